@@ -0,0 +1,135 @@
+import json
+import os
+import unicodedata
+from datetime import date
+from multiprocessing import Pool
+from dotenv import load_dotenv
+
+load_dotenv()
+
+DATA_SEED = int(os.getenv("DATA_SEED", 0))
+# Ages are counted back from this date rather than today, so a seed gives the same records on any day.
+DATASET_DATE = date.fromisoformat(os.getenv("DATASET_DATE", "2025-01-01"))
+DATASET_SIZE = int(os.getenv("DATASET_SIZE", 200))
+DATASET_WORKERS = int(os.getenv("DATASET_WORKERS", os.cpu_count() or 1))
+DATASET_DIR = os.getenv("DATASET_DIR", os.path.join(os.path.dirname(__file__), ".datasets"))
+
+# Nationality as the form lists it (German UI), with the Faker locale used for that person's data.
+NATIONALITIES = (
+    ("Schweiz", "de_CH"),
+    ("Deutschland", "de_DE"),
+    ("Österreich", "de_AT"),
+    ("Frankreich", "fr_FR"),
+    ("Italien", "it_IT"),
+)
+CIVIL_STATUSES = ("ledig", "verheiratet", "geschieden", "verwitwet")
+EMPLOYMENT = ("Angestellt", "Selbständig", "Arbeitslos", "Pensioniert")
+
+_fake = None
+
+
+def _faker():
+    # One Faker per worker process: loading the providers is the expensive part.
+    global _fake
+    if _fake is None:
+        from faker import Faker
+        _fake = Faker([locale for _, locale in NATIONALITIES])
+    return _fake
+
+
+def _ascii(text):
+    return unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode().lower().replace(" ", "")
+
+
+def _years_before(day, years):
+    try:
+        return day.replace(year=day.year - years)
+    except ValueError:
+        # 29 February in a year that has none.
+        return day.replace(year=day.year - years, day=28)
+
+
+def _record(seed, index):
+    fake = _faker()
+    fake.seed_instance(seed * 1_000_000 + index)
+    nationality, locale = fake.random_element(NATIONALITIES)
+    local = fake[locale]
+    salutation = fake.random_element(("Herr", "Frau"))
+    first_name = local.first_name_male() if salutation == "Herr" else local.first_name_female()
+    last_name = local.last_name()
+    birth_date = fake.date_between_dates(_years_before(DATASET_DATE, 80), _years_before(DATASET_DATE, 18))
+    employment = fake.random_element(EMPLOYMENT)
+    return {
+        "index": index,
+        "salutation": salutation,
+        "first_name": first_name,
+        "last_name": last_name,
+        "birth_date": birth_date.strftime("%d.%m.%Y"),
+        "nationality": nationality,
+        # The address comes from the same Faker locale, so it lies in the country of nationality.
+        "country": nationality,
+        "civil_status": fake.random_element(CIVIL_STATUSES),
+        "phone": local.phone_number(),
+        # The index makes every address unique within the dataset without Faker's growing unique set.
+        "email": f"{_ascii(first_name)}.{_ascii(last_name)}.{index}@{fake.free_email_domain()}",
+        "street": local.street_name(),
+        "house_number": str(fake.random_int(1, 200)),
+        "postcode": local.postcode(),
+        "city": local.city(),
+        "employment": employment,
+        "employer": local.company() if employment in ("Angestellt", "Selbständig") else None,
+        "job": fake.job() if employment == "Angestellt" else None,
+        "yearly_income": fake.random_int(30, 180) * 1000 if employment != "Arbeitslos" else 0,
+    }
+
+
+def applicant_record(index, seed=DATA_SEED):
+    """Generates one record on the spot; it equals the dataset's record at index for the same seed."""
+    return _record(seed, index)
+
+
+def _generate_chunk(args):
+    seed, start, stop = args
+    return [_record(seed, index) for index in range(start, stop)]
+
+
+def dataset_path(seed=DATA_SEED, size=DATASET_SIZE, directory=DATASET_DIR):
+    return os.path.join(directory, f"applicants-{seed}-{size}-{DATASET_DATE.isoformat()}.jsonl")
+
+
+def generate_dataset(seed=DATA_SEED, size=DATASET_SIZE, workers=DATASET_WORKERS, directory=DATASET_DIR):
+    """Generates size applicant records across worker processes and writes them as JSONL; returns the path.
+
+    The file is keyed by seed, size and DATASET_DATE and reused when it already exists.
+    """
+    path = dataset_path(seed, size, directory)
+    if os.path.exists(path):
+        return path
+    os.makedirs(directory, exist_ok=True)
+    chunk = max(size // (workers * 4), 1)
+    chunks = [(seed, start, min(start + chunk, size)) for start in range(0, size, chunk)]
+    if workers > 1 and len(chunks) > 1:
+        with Pool(workers) as pool:
+            batches = pool.map(_generate_chunk, chunks)
+    else:
+        batches = [_generate_chunk(args) for args in chunks]
+
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        for batch in batches:
+            for record in batch:
+                f.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n")
+    os.replace(tmp, path)
+    print(f" Generated {size} applicant records with seed {seed} in {path}")
+    return path
+
+
+def stream_applicants(seed=DATA_SEED, size=DATASET_SIZE, offset=0):
+    """Yields the dataset's records one by one, starting at offset and wrapping around at the end."""
+    path = generate_dataset(seed, size)
+    while True:
+        with open(path, encoding="utf-8") as f:
+            for number, line in enumerate(f):
+                if number >= offset:
+                    yield json.loads(line)
+        offset = 0
@@ -0,0 +1,157 @@
+import argparse
+import asyncio
+import math
+import os
+import time
+from dotenv import load_dotenv
+from playwright.async_api import async_playwright
+from applicants import applicant_record
+from test_applicationv3 import adult_steps
+
+load_dotenv()
+BASE_URL = os.getenv("BASE_URL")
+NUM_ADULTS = int(os.getenv("NUM_ADULTS", 1))
+APPLICANTS = int(os.getenv("APPLICANTS", 4))
+CONCURRENCY = int(os.getenv("CONCURRENCY", 4))
+FLOW_TIMEOUT = float(os.getenv("FLOW_TIMEOUT", 300))
+
+
+async def add_adult(page, person):
+    """Awaits the steps of test_applicationv3.add_adult."""
+    for locator, method, args in adult_steps(page, person):
+        await getattr(locator, method)(*args)
+
+
+async def start_application(context):
+    """Opens the listing, follows Bewerben into the form popup and saves Step 1; returns the form page."""
+    page = await context.new_page()
+    await page.goto(BASE_URL)
+
+    await page.get_by_role("row", name="00.01.02 Kanzlei A CHF 1'850").locator("span").first.click()
+    async with page.expect_popup() as popup_info:
+        await page.get_by_text("Bewerben").click()
+    page1 = await popup_info.value
+
+    await page1.get_by_text("Start").click()
+    await page1.get_by_text("Speichern und weiter").click()
+    return page1
+
+
+async def fill_household(page1):
+    """Fills the household step and saves it."""
+    await page1.get_by_role("textbox", name="Bitte auswählen").first.click()
+    await page1.get_by_text("Einpersonen-Haushalt").click()
+    await page1.get_by_role("listitem", name="Nein").first.click()
+    await page1.get_by_role("listitem", name="Nein").nth(1).click()
+    await page1.get_by_role("listitem", name="Nein").nth(2).click()
+    await page1.get_by_role("textbox", name="Bitte auswählen").nth(1).click()
+    await page1.get_by_text("Lärm / Immissionen").click()
+    await page1.locator("div:nth-child(2) > .text-cut").first.click()
+    await page1.get_by_role("listitem", name="Mietkautionskonto").click()
+    await page1.get_by_role("listitem", name="Nein").nth(3).click()
+    await page1.get_by_role("textbox", name="Bitte auswählen").nth(4).click()
+    await page1.get_by_text("Onlinewerbung").click()
+    await page1.get_by_text("Speichern und weiter").click()
+
+
+async def submit(page1):
+    """Saves the adults step, confirms the declarations and submits the application."""
+    await page1.get_by_text("Speichern und weiter", exact=True).click()
+
+    await page1.get_by_role("checkbox", name="Zieht der Mietinteressent").check()
+    await page1.get_by_role("checkbox", name="Ich bestätige, alle Fragen").check()
+    await page1.get_by_role("checkbox", name="Ich habe die Datenschutzerklä").check()
+    await page1.get_by_text("Speichern").click()
+
+
+async def apply(context, people):
+    """Runs the test_applicationv3 flow (listing row → Bewerben → steps → adults → submit) in one context."""
+    page1 = await start_application(context)
+    await fill_household(page1)
+    for person in people:
+        await add_adult(page1, person)
+    await submit(page1)
+
+
+async def _run_one(browser, semaphore, index, num_adults, flow_timeout):
+    async with semaphore:
+        people = [applicant_record(index * num_adults + n) for n in range(num_adults)]
+        context = None
+        start = time.perf_counter()
+        error = None
+        try:
+            context = await browser.new_context()
+            await asyncio.wait_for(apply(context, people), timeout=flow_timeout)
+        except asyncio.TimeoutError:
+            error = f"timed out after {flow_timeout:.0f}s"
+        except Exception as e:
+            error = (str(e).splitlines() or [type(e).__name__])[0]
+        finally:
+            elapsed = time.perf_counter() - start
+            if context is not None:
+                await context.close()
+    return {"applicant": index, "seconds": elapsed, "error": error}
+
+
+async def run_applicants(applicants=APPLICANTS, concurrency=CONCURRENCY, flow_timeout=FLOW_TIMEOUT,
+                         num_adults=NUM_ADULTS, headless=True):
+    """Runs the application flow for several applicants at once, one context each, in one event loop."""
+    semaphore = asyncio.Semaphore(concurrency)
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=headless)
+        try:
+            start = time.perf_counter()
+            results = await asyncio.gather(*(
+                _run_one(browser, semaphore, i, num_adults, flow_timeout) for i in range(applicants)
+            ))
+            wall = time.perf_counter() - start
+        finally:
+            await browser.close()
+    return summarize(results, wall)
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a list of numbers."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(math.ceil(pct / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def summarize(results, wall):
+    """Aggregates per-applicant results into throughput and latency figures."""
+    ok = [r["seconds"] for r in results if r["error"] is None]
+    return {
+        "applicants": len(results),
+        "succeeded": len(ok),
+        "failed": len(results) - len(ok),
+        "wall_seconds": wall,
+        "submissions_per_minute": len(ok) / wall * 60 if wall else 0.0,
+        "latency_p50": percentile(ok, 50),
+        "latency_p95": percentile(ok, 95),
+        "latency_max": max(ok, default=0.0),
+        "errors": [r for r in results if r["error"] is not None],
+    }
+
+
+def print_summary(summary):
+    print(f" {summary['succeeded']}/{summary['applicants']} applications submitted in {summary['wall_seconds']:.1f}s"
+          f" ({summary['submissions_per_minute']:.2f}/min)")
+    print(f" Latency p50 {summary['latency_p50']:.1f}s, p95 {summary['latency_p95']:.1f}s,"
+          f" max {summary['latency_max']:.1f}s")
+    for failure in summary["errors"]:
+        print(f" Applicant {failure['applicant']} failed: {failure['error']}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Submit applications for several applicants concurrently.")
+    parser.add_argument("--applicants", type=int, default=APPLICANTS)
+    parser.add_argument("--concurrency", type=int, default=CONCURRENCY)
+    parser.add_argument("--timeout", type=float, default=FLOW_TIMEOUT)
+    parser.add_argument("--adults", type=int, default=NUM_ADULTS)
+    parser.add_argument("--headed", action="store_true")
+    args = parser.parse_args()
+    print_summary(asyncio.run(run_applicants(
+        args.applicants, args.concurrency, args.timeout, args.adults, headless=not args.headed
+    )))
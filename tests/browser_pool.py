@@ -0,0 +1,129 @@
+import time
+from urllib.parse import urlsplit
+from playwright.sync_api import Error as PlaywrightError
+
+
+def _origin(url):
+    parts = urlsplit(url)
+    if parts.scheme not in ("http", "https"):
+        return None
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+class BrowserPool:
+    """Launches browsers once and hands out isolated contexts that are reset and reused."""
+
+    def __init__(self, launch, size=1, max_context_uses=20, context_args=None):
+        self._launch = launch
+        self.size = max(size, 1)
+        self.max_context_uses = max_context_uses
+        self.context_args = context_args or {}
+        self.hooks = []
+        self.browsers = []
+        self.launch_seconds = []
+        self.acquired = 0
+        self.recycled = 0
+        self._next = 0
+        self._idle = []
+        self._uses = {}
+        self._origins = {}
+        self._recyclable = {}
+
+    def start(self):
+        """Launches every browser in the pool and records how long each cold start took."""
+        for _ in range(self.size):
+            start = time.perf_counter()
+            self.browsers.append(self._launch())
+            self.launch_seconds.append(time.perf_counter() - start)
+        return self
+
+    def acquire(self, fresh=False, **context_args):
+        """Returns a clean context, reusing an idle one unless fresh is set or custom context options are given.
+
+        Fresh and custom contexts are closed on release instead of being parked.
+        Every function in hooks is called with the context before it is handed out.
+        """
+        self.acquired += 1
+        if not fresh and not context_args and self._idle:
+            self.recycled += 1
+            context = self._idle.pop()
+        else:
+            context = self._new_context(context_args, fresh)
+        for hook in self.hooks:
+            hook(context)
+        return context
+
+    def _new_context(self, context_args, fresh=False):
+        browser = self.browsers[self._next % len(self.browsers)]
+        self._next += 1
+        context = browser.new_context(**{**self.context_args, **context_args})
+        self._uses[context] = 0
+        self._origins[context] = set()
+        self._recyclable[context] = not context_args and not fresh
+
+        origins = self._origins[context]
+
+        def track(page):
+            page.on("framenavigated", lambda frame: origins.add(_origin(frame.url)))
+
+        context.on("page", track)
+        return context
+
+    def release(self, context):
+        """Resets a context and parks it for reuse, or closes it when it cannot be reused."""
+        self._uses[context] += 1
+        if not self._recyclable[context] or self._uses[context] >= self.max_context_uses:
+            self._close_context(context)
+            return
+        try:
+            self._reset(context)
+        except PlaywrightError as e:
+            print(f" Could not reset context, closing it instead: {e}")
+            self._close_context(context)
+            return
+        self._idle.append(context)
+
+    def _reset(self, context):
+        context.unroute_all(behavior="ignoreErrors")
+        for page in list(context.pages):
+            page.close()
+        context.clear_cookies()
+        context.clear_permissions()
+        context.set_extra_http_headers({})
+        context.set_offline(False)
+
+        origins = self._origins[context]
+        origins.discard(None)
+        if origins:
+            page = context.new_page()
+            session = context.new_cdp_session(page)
+            for origin in origins:
+                session.send("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+            session.detach()
+            page.close()
+            origins.clear()
+
+    def _close_context(self, context):
+        self._uses.pop(context, None)
+        self._origins.pop(context, None)
+        self._recyclable.pop(context, None)
+        try:
+            context.close()
+        except PlaywrightError:
+            pass
+
+    def startup_seconds_saved(self):
+        """Estimates the cold starts avoided by handing out pooled contexts instead of new browsers."""
+        if not self.launch_seconds:
+            return 0.0
+        average_launch = sum(self.launch_seconds) / len(self.launch_seconds)
+        return max(self.acquired - len(self.browsers), 0) * average_launch
+
+    def close(self):
+        """Closes every context and browser in the pool."""
+        for context in list(self._uses):
+            self._close_context(context)
+        self._idle.clear()
+        for browser in self.browsers:
+            browser.close()
+        self.browsers.clear()
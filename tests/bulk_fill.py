@@ -0,0 +1,113 @@
+from playwright.sync_api import Error as PlaywrightError
+from field_index import field_index
+from form_catalog import form_catalog
+from selector_cache import SELECTOR_TIMEOUT_MS
+
+TEXT_WIDGETS = ("mdt-input", "mdt-textarea", "mdt-datepicker", "mdt-number-incrementer")
+
+BULK_FILL_SCRIPT = """
+async (entries) => {
+    const filled = entries.map(([selector, value]) => {
+        const el = document.querySelector(selector);
+        if (!el) {
+            return { selector, value, el: null };
+        }
+        const proto = el instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+        el.focus();
+        Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, value);
+        el.dispatchEvent(new Event('input', { bubbles: true }));
+        el.dispatchEvent(new Event('change', { bubbles: true }));
+        el.blur();
+        return { selector, value, el };
+    });
+    // Let the components re-render once before checking that the values stuck.
+    await new Promise((resolve) => requestAnimationFrame(() => resolve()));
+    return filled.map(({ selector, value, el }) => ({
+        selector,
+        found: !!el,
+        ok: !!el && el.value === value,
+        actual: el ? el.value : null,
+    }));
+}
+"""
+
+WAIT_SCRIPT = "(selectors) => selectors.every((selector) => document.querySelector(selector))"
+
+
+def _wait_for_fields(page, selectors):
+    """Waits, in one round trip, until every selector matches; the caller reports the ones that never did."""
+    if not selectors:
+        return
+    try:
+        page.wait_for_function(WAIT_SCRIPT, arg=selectors, timeout=SELECTOR_TIMEOUT_MS)
+    except PlaywrightError:
+        pass
+
+
+def _selector_key(key):
+    """The CSS selector a key stands for, or None when the key is a field name or label."""
+    if key.startswith("#"):
+        return key
+    return key[len("css="):] if key.startswith("css=") else None
+
+
+def _label_selector(page, key):
+    matches = field_index(page).lookup(key, TEXT_WIDGETS)
+    return matches[0]["selector"] if matches else None
+
+
+def bulk_fill(page, values):
+    """Fills every field in one page.evaluate and verifies the values in the same round-trip.
+
+    Keys starting with '#' are CSS selectors (e.g. '#field-firstname'), as is anything after a
+    'css=' prefix (e.g. 'css=div:has(> .radio-field) + div input'); any other key is a
+    field name or label, looked up in the form catalog when this form version has been crawled
+    and otherwise resolved through the field index. Selector fields are waited for first, up to
+    SELECTOR_TIMEOUT_MS, and labels are resolved once they have rendered. Fields whose value did not
+    stick are retried with a regular locator.fill(). Raises when a field cannot be found or keeps the
+    wrong value. Returns {key: value actually in the field}.
+    """
+    catalog = form_catalog(page) if any(_selector_key(key) is None for key in values) else None
+    selectors = {}
+    for key in values:
+        if _selector_key(key):
+            selectors[key] = _selector_key(key)
+        elif catalog and catalog.selector(key, TEXT_WIDGETS):
+            selectors[key] = catalog.selector(key, TEXT_WIDGETS)
+    _wait_for_fields(page, list(dict.fromkeys(selectors.values())))
+    for key in values:
+        if key not in selectors:
+            selectors[key] = _label_selector(page, key)
+
+    entries = [[selectors[key], str(value)] for key, value in values.items() if selectors[key]]
+    results = {r["selector"]: r for r in page.evaluate(BULK_FILL_SCRIPT, entries)}
+
+    # A catalogued label can match a same-named field on another step; those fall back to the live index.
+    missed = {}
+    for key, value in values.items():
+        result = results.get(selectors[key])
+        if _selector_key(key) is None and result is not None and not result["found"]:
+            selectors[key] = _label_selector(page, key)
+            if selectors[key]:
+                missed[key] = value
+    if missed:
+        entries = [[selectors[key], str(value)] for key, value in missed.items()]
+        results.update({r["selector"]: r for r in page.evaluate(BULK_FILL_SCRIPT, entries)})
+
+    missing = [key for key in values if not (results.get(selectors[key]) or {}).get("found")]
+    if missing:
+        raise Exception(f"Fields not found: {', '.join(missing)}")
+
+    filled = {}
+    for key, value in values.items():
+        result = results[selectors[key]]
+        if result["ok"]:
+            filled[key] = result["actual"]
+            continue
+        print(f" Field '{key}' holds '{result['actual']}' after bulk fill, retrying with fill().")
+        locator = page.locator(selectors[key])
+        locator.fill(str(value))
+        filled[key] = locator.input_value()
+        if filled[key] != str(value):
+            raise Exception(f"Field '{key}' holds '{filled[key]}' instead of '{value}'")
+    return filled
@@ -0,0 +1,102 @@
+import hashlib
+import inspect
+import json
+import os
+import time
+from urllib.parse import urlsplit
+from dotenv import load_dotenv
+from applicants import DATA_SEED
+from settle import active_step, install_settle_tracker, settle_after_load
+
+load_dotenv()
+
+CHECKPOINT_DIR = os.getenv("CHECKPOINT_DIR", os.path.join(os.path.dirname(__file__), ".checkpoints"))
+
+FORM_ASSETS_SCRIPT = """
+() => Array.from(document.querySelectorAll('script[src], link[rel="stylesheet"][href]'))
+    .map((el) => el.src || el.href)
+    .sort()
+"""
+
+
+def flow_fingerprint(*helpers):
+    """Hashes the source of the helpers that drive a flow, so editing any of them changes the key."""
+    digest = hashlib.sha256()
+    for helper in helpers:
+        digest.update(inspect.getsource(helper).encode())
+    return digest.hexdigest()[:16]
+
+
+def form_fingerprint(page):
+    """Hashes the server origin and the form's script/stylesheet bundles, which change on every deploy."""
+    parts = urlsplit(page.url)
+    assets = page.evaluate(FORM_ASSETS_SCRIPT)
+    digest = hashlib.sha256(f"{parts.scheme}://{parts.netloc}".encode())
+    for asset in assets:
+        digest.update(asset.encode())
+    return digest.hexdigest()[:16]
+
+
+class CheckpointCache:
+    """Stores context.storage_state plus the application URL after each completed form step."""
+
+    def __init__(self, flow_name, flow_key, seed=DATA_SEED, directory=CHECKPOINT_DIR):
+        self.flow_name = flow_name
+        self.flow_key = flow_key
+        self.seed = seed
+        self.directory = directory
+
+    def path(self, step):
+        return os.path.join(self.directory, f"{self.flow_name}-{self.flow_key}-seed{self.seed}-{step}.json")
+
+    def save(self, page, step):
+        """Snapshots the page's context and URL as the checkpoint for the given step."""
+        os.makedirs(self.directory, exist_ok=True)
+        entry = {
+            "url": page.url,
+            "active_step": active_step(page),
+            "form": form_fingerprint(page),
+            "storage_state": page.context.storage_state(),
+            "saved_at": time.time(),
+        }
+        with open(self.path(step), "w") as f:
+            json.dump(entry, f)
+        print(f" Saved checkpoint '{step}' for {self.flow_name}.")
+
+    def load(self, step):
+        try:
+            with open(self.path(step)) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def invalidate(self, step):
+        try:
+            os.remove(self.path(step))
+        except OSError:
+            pass
+
+    def restore(self, browser_pool, step):
+        """Opens a page at the cached step, or returns None when there is no valid checkpoint.
+
+        A checkpoint is dropped when the form bundles or server changed since it was saved,
+        or when the application URL no longer lands on the same step.
+        """
+        entry = self.load(step)
+        if entry is None:
+            return None
+
+        context = browser_pool.acquire(storage_state=entry["storage_state"])
+        page = context.new_page()
+        install_settle_tracker(page)
+        page.goto(entry["url"])
+        settle_after_load(page)
+
+        if form_fingerprint(page) != entry["form"] or active_step(page) != entry["active_step"]:
+            print(f" Checkpoint '{step}' for {self.flow_name} is stale, discarding it.")
+            browser_pool.release(context)
+            self.invalidate(step)
+            return None
+
+        print(f" Resumed {self.flow_name} from checkpoint '{step}'.")
+        return page
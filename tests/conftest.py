@@ -1,14 +1,213 @@
 import pytest
 import os
 from dotenv import load_dotenv
+from applicants import DATASET_SIZE, stream_applicants
+from browser_pool import BrowserPool
+from form_pool import FormPagePool
+from har_replay import NETWORK_MODE, HarReplay, record_context_args
+from network_profiles import PROFILE_BASELINE, NetworkProfile, record_baseline
+from selector_cache import SELECTORS
+from settle import settle_summary
 from test_applicationv3 import add_adult
+from tracer import TRACE, finished_spans, instrument_playwright, rollup, span, write_trace
+from uploads import ARTIFACTS
 
 load_dotenv()
 NUM_ADULTS = int(os.getenv("NUM_ADULTS", 1))
+POOL_BROWSERS = int(os.getenv("POOL_BROWSERS", 1))
+POOL_CONTEXT_USES = int(os.getenv("POOL_CONTEXT_USES", 20))
+ARTIFACT_OPTIONS = ("--tracing", "--video", "--screenshot")
+
+if TRACE:
+    instrument_playwright()
+
+@pytest.fixture(scope="session")
+def applicant_stream():
+    """Streams pre-generated applicant records, offset by PYTEST_XDIST_WORKER when a parallel runner sets it."""
+    worker = os.getenv("PYTEST_XDIST_WORKER", "gw0")
+    workers = int(os.getenv("PYTEST_XDIST_WORKER_COUNT", 1))
+    offset = int(worker.removeprefix("gw") or 0) * (DATASET_SIZE // workers)
+    return stream_applicants(offset=offset)
+
 
 @pytest.fixture
-def add_adults_fixture():
+def add_adults_fixture(applicant_stream):
     def _add(page):
         for _ in range(NUM_ADULTS):
-            add_adult(page)
+            add_adult(page, next(applicant_stream))
     return _add
+
+
+@pytest.fixture(scope="session")
+def har_replay(pytestconfig):
+    """Loads the recorded HAR files when NETWORK_MODE=replay."""
+    if NETWORK_MODE != "replay":
+        return None
+    replay = HarReplay()
+    pytestconfig.har_replay = replay
+    return replay
+
+
+@pytest.fixture(scope="session")
+def browser_pool(launch_browser, browser_context_args, har_replay, pytestconfig):
+    """Launches POOL_BROWSERS browsers once per worker and shares them across all test modules.
+
+    Every context is created with pytest-playwright's browser_context_args (--device, --base-url, --video).
+    """
+    context_args = dict(browser_context_args)
+    if NETWORK_MODE != "live":
+        context_args["service_workers"] = "block"
+    pool = BrowserPool(
+        launch_browser, size=POOL_BROWSERS, max_context_uses=POOL_CONTEXT_USES, context_args=context_args
+    ).start()
+    if har_replay is not None:
+        pool.hooks.append(har_replay.attach)
+    pytestconfig.browser_pool = pool
+    yield pool
+    pool.close()
+
+
+@pytest.fixture(scope="session")
+def browser(browser_pool):
+    return browser_pool.browsers[0]
+
+
+@pytest.fixture
+def context(browser_pool, _artifacts_recorder, request, pytestconfig):
+    """Hands out an isolated context from the pool and recycles it after the test.
+
+    With NETWORK_MODE=record the context records the test's traffic into its own HAR file. A
+    browser_context_args marker adds options for this test only. When --tracing, --video or
+    --screenshot is on, the test gets a fresh context registered with pytest-playwright's
+    artifacts recorder, which starts the trace and takes the screenshots as it would for its
+    own context fixture; that context is closed instead of recycled.
+    """
+    marker = request.node.get_closest_marker("browser_context_args")
+    context_args = dict(marker.kwargs) if marker else {}
+    if NETWORK_MODE == "record":
+        context_args.update(record_context_args(request.node.nodeid))
+    artifacts = any(pytestconfig.getoption(option) != "off" for option in ARTIFACT_OPTIONS)
+    context = browser_pool.acquire(fresh=artifacts, **context_args)
+    if not artifacts:
+        yield context
+        browser_pool.release(context)
+        return
+    _artifacts_recorder.on_did_create_browser_context(context)
+    yield context
+    _artifacts_recorder.on_will_close_browser_context(context)
+    browser_pool.release(context)
+
+
+@pytest.fixture(scope="session")
+def form_pool(browser_pool, pytestconfig):
+    """Pages parked on a fresh application form for each WARM_LISTINGS listing, refilled as tests take them."""
+    pool = FormPagePool(browser_pool).fill()
+    pytestconfig.form_pool = pool
+    yield pool
+    pool.close()
+
+
+@pytest.fixture
+def warm_form(form_pool):
+    """A page already on step 1 of a new application for the first warm listing."""
+    page = form_pool.take()
+    yield page
+    form_pool.release(page)
+
+
+@pytest.fixture(autouse=True)
+def trace_test(request):
+    """Opens the root span every traced helper and Playwright call of the test nests under."""
+    if not TRACE:
+        yield None
+        return
+    with span(request.node.nodeid, "test") as root:
+        yield root
+
+
+@pytest.fixture
+def read_only_page(context):
+    """Page for read-only checks, with third-party, media, font and tracking requests blocked.
+
+    With NETWORK_PROFILE_BASELINE=1 nothing is blocked and the load is recorded as the baseline.
+    """
+    page = context.new_page()
+    if PROFILE_BASELINE:
+        yield page
+        record_baseline(page)
+        return
+    profile = NetworkProfile("read_only").apply(page)
+    yield page
+    profile.report(page)
+
+
+def pytest_sessionfinish(session):
+    # Adds this session's selector stats to the file; sessions running side by side need their own
+    # SELECTOR_STATS_PATH, since the read-add-replace is not locked.
+    SELECTORS.save()
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    pool = getattr(config, "browser_pool", None)
+    if pool is not None:
+        terminalreporter.section("browser pool")
+        terminalreporter.write_line(
+            f"{len(pool.launch_seconds)} browser(s) launched in {sum(pool.launch_seconds):.2f}s, "
+            f"{pool.acquired} context(s) handed out ({pool.recycled} recycled), "
+            f"~{pool.startup_seconds_saved():.2f}s of browser startup saved"
+        )
+
+    forms = getattr(config, "form_pool", None)
+    if forms is not None and forms.taken:
+        terminalreporter.section("warm form pages")
+        terminalreporter.write_line(
+            f"{forms.taken} form page(s) taken, avg wait {sum(forms.waits) / forms.taken:.2f}s, "
+            f"max {max(forms.waits):.2f}s"
+        )
+
+    replay = getattr(config, "har_replay", None)
+    if replay is not None:
+        terminalreporter.section("har replay")
+        terminalreporter.write_line(f"{replay.hits} request(s) served from HAR, {replay.misses} not found")
+
+    if ARTIFACTS.generated:
+        terminalreporter.section("upload artifacts")
+        terminalreporter.write_line(
+            f"{ARTIFACTS.generated} payload(s) generated, {ARTIFACTS.hits} cache hit(s), {ARTIFACTS.spilled} spilled to disk"
+        )
+
+    if SELECTORS.resolved:
+        terminalreporter.section("selector fallbacks")
+        terminalreporter.write_line(
+            f"{SELECTORS.resolved} field(s) located, {SELECTORS.fallbacks} via a fallback candidate"
+        )
+
+    if TRACE:
+        base = write_trace()
+        if base is not None:
+            roots = finished_spans()
+            terminalreporter.section("trace")
+            for root in roots:
+                terminalreporter.write_line(
+                    f"{root.duration:8.2f}s  wait {root.wait:7.2f}s  {root.round_trips:>6} round trips  {root.name}"
+                )
+            totals = rollup(roots)
+            slowest = sorted(
+                (item for item in totals.items() if item[0] not in {root.name for root in roots}),
+                key=lambda item: item[1]["seconds"], reverse=True,
+            )[:10]
+            for name, entry in slowest:
+                terminalreporter.write_line(
+                    f"  {entry['seconds']:8.2f}s  wait {entry['wait']:7.2f}s  {entry['round_trips']:>6} rt  "
+                    f"{entry['calls']:>5}x  {name}"
+                )
+            terminalreporter.write_line(f"trace written to {base}.json and {base}.folded")
+
+    summary = settle_summary()
+    if not summary:
+        return
+    terminalreporter.section("settle timings")
+    for kind, (count, total, longest) in sorted(summary.items()):
+        terminalreporter.write_line(
+            f"{kind:<8} {count:>5}x  total {total:7.2f}s  avg {total / count:6.3f}s  max {longest:6.3f}s"
+        )
@@ -0,0 +1,196 @@
+import re
+
+MONTH_NAMES = (
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December",
+)
+
+TYPE_SCRIPT = """
+async (el, value) => {
+    if (el.readOnly || el.disabled) {
+        return '';
+    }
+    const setter = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set;
+    el.focus();
+    setter.call(el, value);
+    el.dispatchEvent(new Event('input', { bubbles: true }));
+    el.dispatchEvent(new Event('change', { bubbles: true }));
+    el.dispatchEvent(new KeyboardEvent('keyup', { key: 'Enter', bubbles: true }));
+    el.blur();
+    el.dispatchEvent(new Event('blur'));
+    // Give the widget two frames to reformat or revert a value it does not accept.
+    for (let i = 0; i < 2; i++) {
+        await new Promise((resolve) => requestAnimationFrame(() => resolve()));
+    }
+    const field = el.closest('.mdt-datepicker, .mdt-input');
+    if (field && field.querySelector('.error, .is-invalid, .mdt-input-error')) {
+        return '';
+    }
+    return el.value;
+}
+"""
+
+# TYPE_SCRIPT for callers that do not look at the result (e.g. shared sync/async step lists):
+# a value the field does not take raises instead of returning ''.
+TYPE_CHECKED_SCRIPT = """
+async (el, value) => {
+    const typed = await (""" + TYPE_SCRIPT.strip() + """)(el, value);
+    if (!typed) {
+        throw new Error(`Date field did not accept '${value}'`);
+    }
+    return typed;
+}
+"""
+
+PICK_SCRIPT = """
+async (input, { mode, day, month, year, months, timeout }) => {
+    const frame = () => new Promise((resolve) => requestAnimationFrame(() => resolve()));
+    const visible = (node) => node.getClientRects().length > 0;
+    const until = async (find) => {
+        const deadline = performance.now() + timeout;
+        let found = find();
+        while (!found && performance.now() < deadline) {
+            await frame();
+            found = find();
+        }
+        return found;
+    };
+    const fire = (el) => {
+        for (const type of ['mousedown', 'mouseup', 'click']) {
+            el.dispatchEvent(new MouseEvent(type, { bubbles: true, cancelable: true, view: window }));
+        }
+    };
+
+    const wrapper = await until(() => Array.from(document.querySelectorAll('.datepicker-wrapper')).find(visible));
+    if (!wrapper) {
+        return { ok: false, reason: 'datepicker did not open' };
+    }
+    const leaves = () => Array.from(wrapper.querySelectorAll('*'))
+        .filter((el) => !el.children.length && visible(el));
+    const leaf = (text) => leaves().find((el) => el.textContent.trim().toLowerCase() === text.toLowerCase());
+    const header = () => wrapper.querySelector('.datepicker-current-date');
+    const [prev, next] = wrapper.querySelectorAll('.months-buttons > div');
+    const shown = () => {
+        const text = (header() ? header().textContent : '').toLowerCase();
+        const y = text.match(/\\d{4}/);
+        const m = months.findIndex((name) => text.includes(name.slice(0, 3).toLowerCase()));
+        return y && m >= 0 ? { year: Number(y[0]), month: m + 1 } : null;
+    };
+
+    if (mode === 'jump') {
+        // Header toggles to the year grid; year then month cells jump straight to the target.
+        if (!header()) {
+            return { ok: false, reason: 'no header toggle' };
+        }
+        fire(header());
+        let yearCell = await until(() => leaf(String(year)));
+        for (let page = 0; !yearCell && prev && next && page < 20; page++) {
+            const years = leaves().map((el) => el.textContent.trim()).filter((t) => /^\\d{4}$/.test(t)).map(Number);
+            if (!years.length) {
+                break;
+            }
+            fire(year < Math.min(...years) ? prev : next);
+            await frame();
+            yearCell = leaf(String(year));
+        }
+        if (!yearCell) {
+            return { ok: false, reason: `year ${year} not offered` };
+        }
+        fire(yearCell);
+        const name = months[month - 1];
+        const monthCell = await until(() => leaf(name) || leaf(name.slice(0, 3)));
+        if (!monthCell) {
+            return { ok: false, reason: `month ${name} not offered` };
+        }
+        fire(monthCell);
+    } else {
+        // Step mode: work out the month distance once and click prev/next that many times in-page.
+        const current = await until(shown);
+        if (!current || !prev || !next) {
+            return { ok: false, reason: 'month header not readable' };
+        }
+        const distance = (year - current.year) * 12 + (month - current.month);
+        for (let i = 0; i < Math.abs(distance); i++) {
+            fire(distance < 0 ? prev : next);
+            await frame();
+        }
+        const reached = shown();
+        if (!reached || reached.year !== year || reached.month !== month) {
+            return { ok: false, reason: 'did not reach target month' };
+        }
+    }
+
+    const dayCell = await until(() => Array.from(wrapper.querySelectorAll('td')).find(
+        (td) => visible(td) && td.textContent.trim() === String(day) && !/disabled|other|prev|next/.test(td.className)
+    ));
+    if (!dayCell) {
+        return { ok: false, reason: `day ${day} not offered` };
+    }
+    fire(dayCell);
+    await frame();
+    return { ok: true, value: input.value };
+}
+"""
+
+STRATEGIES = ("typed", "jump", "step")
+
+_LEARNED = {}
+
+
+def _month_number(month):
+    if isinstance(month, int) or str(month).isdigit():
+        return int(month)
+    prefix = str(month).strip()[:3].casefold()
+    for number, name in enumerate(MONTH_NAMES, start=1):
+        if name[:3].casefold() == prefix:
+            return number
+    raise Exception(f"Unknown month '{month}'")
+
+
+def _shows_date(value, day, month, year):
+    numbers = tuple(int(n) for n in re.findall(r"\d+", value or ""))
+    return numbers in ((day, month, year), (month, day, year), (year, month, day))
+
+
+def _typed(page, date_input, day, month, year):
+    value = date_input.evaluate(TYPE_SCRIPT, f"{day:02d}.{month:02d}.{year}")
+    return _shows_date(value, day, month, year)
+
+
+def _pick(mode):
+    def strategy(page, date_input, day, month, year):
+        date_input.click()
+        result = date_input.evaluate(PICK_SCRIPT, {
+            "mode": mode, "day": day, "month": month, "year": year, "months": MONTH_NAMES, "timeout": 3000,
+        })
+        return result["ok"] and _shows_date(result["value"], day, month, year)
+    return strategy
+
+
+_DRIVERS = {"typed": _typed, "jump": _pick("jump"), "step": _pick("step")}
+
+
+def set_date(page, date_input, day, month, year, key=None):
+    """Sets an mdt date field in a constant number of actions and returns the strategy that worked.
+
+    Tries typing the value with input/change/blur events, then jumping through the year and month
+    grids, then stepping months in-page. The first strategy that sticks is remembered per field
+    key (the label, or the input id) and tried first next time. month may be a number or a name.
+    """
+    day, month, year = int(day), _month_number(month), int(year)
+    if key is None:
+        key = date_input.evaluate("el => el.id || el.name || ''")
+    learned = _LEARNED.get(key)
+    order = ([learned] if learned else []) + [s for s in STRATEGIES if s != learned]
+
+    for strategy in order:
+        if _DRIVERS[strategy](page, date_input, day, month, year):
+            if strategy != learned:
+                _LEARNED[key] = strategy
+                print(f" Date field '{key}' uses the {strategy} strategy")
+            return strategy
+        # Close whatever the failed strategy left open before trying the next one.
+        page.locator("body").click(position={"x": 1, "y": 1})
+
+    _LEARNED.pop(key, None)
+    raise Exception(f"Could not set date {day:02d}.{month:02d}.{year} on '{key}'")
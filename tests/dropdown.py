@@ -0,0 +1,134 @@
+SELECT_OPTION_SCRIPT = """
+async (el, { wanted, match, fallback, filtered, cachedIndex, cachedText, timeout }) => {
+    const visible = (node) => node.getClientRects().length > 0;
+    const container = el.closest('.mdt-select') || document;
+    const findList = () => {
+        for (const root of [container, document]) {
+            const list = Array.from(root.querySelectorAll('.select-dropdown-items-wrapper'))
+                .find((wrapper) => visible(wrapper) && wrapper.querySelector('li.dropdown-item'));
+            if (list) {
+                return list;
+            }
+        }
+        return null;
+    };
+
+    let list = findList();
+    const deadline = performance.now() + timeout;
+    while (!list && performance.now() < deadline) {
+        await new Promise((resolve) => requestAnimationFrame(() => resolve()));
+        list = findList();
+    }
+    if (!list) {
+        return { status: 'empty' };
+    }
+
+    // The option is only tagged here; Playwright clicks it by the tag, with its actionability checks.
+    const pick = (option) => {
+        window.__optionTag = (window.__optionTag || 0) + 1;
+        option.setAttribute('data-option-tag', String(window.__optionTag));
+        return String(window.__optionTag);
+    };
+    const norm = (text) => text.replace(/\\s+/g, ' ').trim().toLowerCase();
+    // Indexes are positions in the full, unfiltered list; only that one item is read on a cache hit.
+    const items = list.querySelectorAll('li.dropdown-item');
+
+    if (cachedIndex !== null) {
+        const option = items[cachedIndex];
+        if (option && norm(option.textContent) === norm(cachedText)) {
+            return { status: 'cached', tag: pick(option), index: cachedIndex, text: option.textContent.trim() };
+        }
+    }
+
+    const all = Array.from(items);
+    const options = all.filter(visible);
+    if (!options.length) {
+        return { status: 'missing', options: [] };
+    }
+    const target = norm(wanted);
+    const texts = options.map((option) => norm(option.textContent));
+    let index = texts.indexOf(target);
+    if (index === -1 && match === 'substring') {
+        index = texts.findIndex((text) => text.includes(target));
+    }
+    let status = 'matched';
+    if (index === -1) {
+        if (fallback !== 'first') {
+            return { status: 'missing', options: options.map((o) => o.textContent.trim()) };
+        }
+        index = 0;
+        status = 'fallback';
+    }
+    return {
+        status,
+        tag: pick(options[index]),
+        index: all.indexOf(options[index]),
+        text: options[index].textContent.trim(),
+        // A search-filtered list says nothing about the positions in the full one.
+        options: filtered ? null : all.map((o) => o.textContent.trim()),
+    };
+}
+"""
+
+_OPTION_CACHE = {}
+
+
+def _page_cache(page):
+    cache = _OPTION_CACHE.get(page)
+    if cache is None:
+        cache = _OPTION_CACHE[page] = {}
+        page.on("close", lambda _: _OPTION_CACHE.pop(page, None))
+    return cache
+
+
+def _cached_index(options, option_text, match):
+    wanted = " ".join(option_text.split()).lower()
+    lowered = [" ".join(o.split()).lower() for o in options]
+    if wanted in lowered:
+        return lowered.index(wanted)
+    if match == "substring":
+        for i, text in enumerate(lowered):
+            if wanted in text:
+                return i
+    return None
+
+
+def select_option(page, dropdown, option_text, cache_key=None, match="substring", fallback="first", timeout=5000,
+                  search=False):
+    """Opens an mdt-select, finds the option inside the page in a single evaluate and clicks it.
+
+    Matching is case-insensitive: exact text first, then (with match="substring") the first
+    option containing option_text. When nothing matches, fallback="first" picks the first
+    option like the old helper did, any other value raises. With search=True option_text is
+    typed into the select's search box first (dropdown must be that input), so the component
+    filters its own list. Without search, the full option list is cached per page under
+    cache_key, and later selects on that field click the known index without reading the list.
+    Returns the text of the selected option.
+    """
+    cache = _page_cache(page)
+    options = cache.get(cache_key) if cache_key and not search else None
+    cached_index = _cached_index(options, option_text, match) if options else None
+
+    dropdown.click()
+    if search:
+        dropdown.fill(option_text)
+    result = dropdown.evaluate(SELECT_OPTION_SCRIPT, {
+        "wanted": option_text,
+        "match": match,
+        "fallback": fallback,
+        "filtered": search,
+        "cachedIndex": cached_index,
+        "cachedText": options[cached_index] if cached_index is not None else None,
+        "timeout": timeout,
+    })
+
+    if result["status"] == "empty":
+        raise Exception(f"No options found in '{cache_key or option_text}' dropdown!")
+    if result["status"] == "missing":
+        raise Exception(f"Option '{option_text}' not found in '{cache_key}' dropdown!")
+    page.locator(f"[data-option-tag='{result['tag']}']").click()
+    if result.get("options") and cache_key:
+        cache[cache_key] = result["options"]
+    if result["status"] == "fallback":
+        print(f" Warning: Option '{option_text}' not found in '{cache_key}' dropdown! Clicked '{result['text']}' instead.")
+    return result["text"]
@@ -0,0 +1,90 @@
+from settle import settle_after_click
+
+# Each round can only reveal lists nested one level deeper, so a few rounds cover any form.
+SET_RADIOS_ROUNDS = 5
+
+QUERY_SCRIPT = """
+([selector, text, filters, actOn, limit]) => {
+    const wanted = text === null ? null : text.toLowerCase();
+    const hasText = (el) => wanted === null || el.textContent.toLowerCase().includes(wanted);
+    let elements = Array.from(document.querySelectorAll(selector)).filter(hasText);
+    if (wanted !== null) {
+        // Like Playwright's text= engine: keep the innermost elements holding the text.
+        elements = elements.filter((el) => !Array.from(el.children).some(hasText));
+    }
+
+    const matches = [];
+    for (const el of elements) {
+        const info = {
+            index: matches.length,
+            tag: null,
+            text: el.textContent.trim(),
+            visible: el.getClientRects().length > 0 && getComputedStyle(el).visibility !== 'hidden',
+            enabled: !el.closest('.btn-disabled, [disabled], [aria-disabled="true"]'),
+            selected: el.classList.contains('selected') || el.getAttribute('aria-checked') === 'true',
+            acted: false,
+        };
+        if (Object.entries(filters).some(([key, value]) => info[key] !== value)) {
+            continue;
+        }
+        info.target = Object.entries(actOn).every(([key, value]) => info[key] === value);
+        if (info.target) {
+            // A tag on the element itself, so the click finds it even after earlier clicks re-render the list.
+            window.__queryTag = (window.__queryTag || 0) + 1;
+            info.tag = String(window.__queryTag);
+            el.setAttribute('data-query-tag', info.tag);
+        }
+        matches.push(info);
+        if (limit !== null && matches.length >= limit) {
+            break;
+        }
+    }
+    return matches;
+}
+"""
+
+
+def query(page, selector, text=None, act=None, act_on=None, limit=None, **filters):
+    """Scans every element matching selector (and containing text) in one page.evaluate.
+
+    Each match is described by its text and visible/enabled/selected state; keyword filters
+    such as visible=True or selected=False drop the others. With act="click" the matches are
+    then clicked one by one through Playwright, each found again by a data-query-tag attribute
+    set during the scan and followed by a settle, so a click that reveals or re-renders elements
+    does not send the next click to the wrong one. act_on (e.g. {"selected": False}) limits the
+    clicks to some of the matches. At most limit matches are returned. Returns the matches as
+    dicts with an "acted" flag.
+    """
+    matches = page.evaluate(QUERY_SCRIPT, [selector, text, filters, act_on or {}, limit])
+    if act == "click":
+        for match in matches:
+            if match["target"]:
+                page.locator(f"[data-query-tag='{match['tag']}']").click()
+                settle_after_click(page)
+                match["acted"] = True
+    return matches
+
+
+def click_first(page, selector, text=None, **filters):
+    """Clicks the first match that passes the filters; raises when there is none."""
+    matches = query(page, selector, text, act="click", limit=1, **filters)
+    if not matches:
+        raise Exception(f"No clickable '{text or selector}' found.")
+    return matches[0]
+
+
+def set_radios(page, option, within="body"):
+    """Selects option (the li title, e.g. 'Yes' or 'Nein') in every visible radio list inside within.
+
+    Lists already on that option are left alone. Lists revealed by a click are picked up by
+    scanning again until a scan clicks nothing. Returns (radio lists found, options clicked).
+    """
+    clicked = 0
+    for _ in range(SET_RADIOS_ROUNDS):
+        matches = query(page, f"{within} ul.radio-list li[title='{option}']", act="click",
+                        act_on={"selected": False}, visible=True)
+        acted = sum(match["acted"] for match in matches)
+        clicked += acted
+        if not acted:
+            return len(matches), clicked
+    raise Exception(f"Radio lists inside '{within}' still not on '{option}' after {SET_RADIOS_ROUNDS} rounds.")
@@ -0,0 +1,167 @@
+# Widget table and label lookup shared by BUILD_SCRIPT and form_catalog.EXTRACT_SCRIPT: each entry is
+# [widget, container selector, selector of the element a value goes into].
+WIDGET_SCRIPT = """
+    const WIDGETS = [
+        ['mdt-select', '.mdt-select', 'input'],
+        ['mdt-datepicker', '.mdt-datepicker', 'input'],
+        ['mdt-number-incrementer', '.mdt-number-incrementer', 'input'],
+        ['mdt-file-single', '.mdt-file-single', 'input[type=file]'],
+        ['mdt-textarea', '.mdt-textarea', 'textarea'],
+        ['radio-list', '.mdt-radio-list', 'ul.radio-list'],
+        ['mdt-input', '.mdt-input', 'input'],
+    ];
+    const containerSelector = WIDGETS.map((w) => w[1]).join(',');
+
+    const ownText = (el) => Array.from(el.childNodes)
+        .filter((n) => n.nodeType === Node.TEXT_NODE)
+        .map((n) => n.textContent)
+        .join('')
+        .trim();
+
+    const labelOf = (container) => {
+        const explicit = container.querySelector('label, .label, .field-label');
+        if (explicit && explicit.textContent.trim()) {
+            return explicit.textContent.trim();
+        }
+        for (const el of container.querySelectorAll('span, div')) {
+            if (el.closest('li, .select-dropdown-items-wrapper, .datepicker-wrapper')) {
+                continue;
+            }
+            const text = ownText(el);
+            if (text) {
+                return text;
+            }
+        }
+        const parent = container.parentElement;
+        const sibling = parent && parent.querySelector(':scope > label, :scope > .label, :scope > span');
+        return sibling ? sibling.textContent.trim() : '';
+    };
+"""
+
+# Returns null when the page's generation still equals known, else the rebuilt index with its new
+# generation. The generation is a per-document token plus a counter the MutationObserver bumps
+# synchronously, so a navigation or a widget change is seen by the very next lookup.
+BUILD_SCRIPT = """
+(known) => {""" + WIDGET_SCRIPT + """
+    const relevant = (node) => node.nodeType === 1
+        && (node.matches(containerSelector) || !!node.querySelector(containerSelector));
+
+    const changed = (mutations) => mutations.some((m) => (
+        m.type === 'attributes' ? [m.target] : [...m.addedNodes, ...m.removedNodes]
+    ).some(relevant));
+
+    if (!window.__fieldIndexObserver) {
+        window.__fieldIndexDocument = Math.random().toString(36).slice(2);
+        window.__fieldIndexGeneration = 0;
+        window.__fieldIndexObserver = new MutationObserver((mutations) => {
+            if (changed(mutations)) {
+                window.__fieldIndexGeneration++;
+            }
+        });
+        window.__fieldIndexObserver.observe(document.body, {
+            subtree: true, childList: true, attributes: true, attributeFilter: ['style'],
+        });
+    }
+    // Mutations made since the last task have not reached the observer callback yet.
+    if (changed(window.__fieldIndexObserver.takeRecords())) {
+        window.__fieldIndexGeneration++;
+    }
+    const generation = `${window.__fieldIndexDocument}:${window.__fieldIndexGeneration}`;
+    if (generation === known) {
+        return null;
+    }
+    window.__fieldIndexSeq = window.__fieldIndexSeq || 0;
+
+    const fields = [];
+    for (const container of document.querySelectorAll(containerSelector)) {
+        if (container.parentElement && container.parentElement.closest(containerSelector)) {
+            continue;
+        }
+        if (container.getClientRects().length === 0) {
+            continue;
+        }
+        const [widget, , targetSelector] = WIDGETS.find((w) => container.matches(w[1]));
+        const target = container.querySelector(targetSelector) || container;
+        if (!target.hasAttribute('data-field-index')) {
+            target.setAttribute('data-field-index', String(++window.__fieldIndexSeq));
+        }
+        fields.push({
+            label: labelOf(container),
+            widget,
+            id: target.id || null,
+            selector: `[data-field-index="${target.getAttribute('data-field-index')}"]`,
+        });
+    }
+    return { generation, fields };
+}
+"""
+
+_INDEXES = {}
+
+
+class FieldIndex:
+    """Maps every visible form label to a stamped selector and widget type, built with one evaluate.
+
+    A MutationObserver in the page bumps a generation counter when widgets are added, removed or
+    shown. Every lookup sends the generation it was built at and gets the index back rebuilt, in
+    the same evaluate, only when the page's generation has moved on.
+    """
+
+    def __init__(self, page):
+        self.page = page
+        self.fields = []
+        self.generation = None
+        self.builds = 0
+
+    def invalidate(self):
+        self.generation = None
+
+    def refresh(self):
+        """Rebuilds the index if the page changed since the last build; returns True if it did."""
+        result = self.page.evaluate(BUILD_SCRIPT, self.generation)
+        if result is None:
+            return False
+        self.generation = result["generation"]
+        self.fields = result["fields"]
+        self.builds += 1
+        return True
+
+    def build(self):
+        self.invalidate()
+        self.refresh()
+
+    def _match(self, label, widgets):
+        wanted = label.strip().casefold()
+        candidates = [f for f in self.fields if widgets is None or f["widget"] in widgets]
+        exact = [f for f in candidates if f["label"].casefold() == wanted]
+        return exact or [f for f in candidates if wanted in f["label"].casefold()]
+
+    def lookup(self, label, widgets=None):
+        """Returns the index entries whose label matches, exact matches first."""
+        if isinstance(widgets, str):
+            widgets = (widgets,)
+        rebuilt = self.refresh()
+        matches = self._match(label, widgets)
+        if not matches and not rebuilt:
+            # Fields revealed without a structural change (e.g. CSS transitions) are picked up here.
+            self.build()
+            matches = self._match(label, widgets)
+        return matches
+
+    def find_all(self, label, widgets=None):
+        """Returns locators for every field whose label matches, exact matches first."""
+        return [self.page.locator(f["selector"]) for f in self.lookup(label, widgets)]
+
+    def find(self, label, widgets=None):
+        """Returns a locator for the first field with the label, or None."""
+        matches = self.find_all(label, widgets)
+        return matches[0] if matches else None
+
+
+def field_index(page):
+    """Returns the page's field index, creating it on first use."""
+    index = _INDEXES.get(page)
+    if index is None:
+        index = _INDEXES[page] = FieldIndex(page)
+        page.on("close", lambda _: _INDEXES.pop(page, None))
+    return index
@@ -0,0 +1,262 @@
+import json
+import os
+from dotenv import load_dotenv
+from datepicker import set_date
+from dropdown import select_option
+from element_query import click_first
+from form_catalog import form_catalog, resolve, with_language
+from incrementers import set_numbers
+from labels import load_labels
+from listing_index import open_application
+from settle import active_step, install_settle_tracker, settle_after_load, settle_after_step
+from uploads import upload_payload
+
+load_dotenv()
+BASE_URL = os.getenv("BASE_URL")
+NUM_ADULTS = int(os.getenv("NUM_ADULTS", 1))
+FLOW_DIR = os.getenv("FLOW_DIR", os.path.join(os.path.dirname(__file__), "flows"))
+BATCH_TIMEOUT_MS = int(os.getenv("BATCH_TIMEOUT_MS", 5000))
+
+BATCH_SCRIPT = """
+async ([ops, timeout]) => {
+    const frame = () => new Promise((resolve) => requestAnimationFrame(() => resolve()));
+    const visible = (el) => el && el.getClientRects().length > 0;
+    const find = async (selector) => {
+        const deadline = performance.now() + timeout;
+        let el = document.querySelector(selector);
+        while (!visible(el) && performance.now() < deadline) {
+            await frame();
+            el = document.querySelector(selector);
+        }
+        return visible(el) ? el : null;
+    };
+
+    const results = [];
+    for (const op of ops) {
+        const el = await find(op.selector);
+        if (!el) {
+            results.push({ ok: false, reason: 'not found' });
+            continue;
+        }
+        if (op.op === 'click') {
+            el.scrollIntoView({ block: 'nearest' });
+            for (const type of ['mousedown', 'mouseup', 'click']) {
+                el.dispatchEvent(new MouseEvent(type, { bubbles: true, cancelable: true, view: window }));
+            }
+            results.push({ ok: true });
+            continue;
+        }
+        const proto = el instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+        el.focus();
+        Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, op.value);
+        el.dispatchEvent(new Event('input', { bubbles: true }));
+        el.dispatchEvent(new Event('change', { bubbles: true }));
+        el.blur();
+        results.push({ ok: true, el });
+    }
+    // One re-render, then confirm the filled values stuck.
+    await frame();
+    return results.map((result, i) => {
+        if (result.el && result.el.value !== ops[i].value) {
+            return { ok: false, reason: `holds '${result.el.value}'` };
+        }
+        return { ok: result.ok, reason: result.reason || null };
+    });
+}
+"""
+
+
+def load_flow(name, directory=FLOW_DIR):
+    """Loads tests/flows/<name>.json."""
+    with open(os.path.join(directory, f"{name}.json"), encoding="utf-8") as f:
+        return json.load(f)
+
+
+def flow_names(directory=FLOW_DIR):
+    return sorted(name[:-5] for name in os.listdir(directory) if name.endswith(".json"))
+
+
+def _render(value, variables):
+    if isinstance(value, str):
+        return value.format_map(variables)
+    if isinstance(value, dict):
+        return {_render(k, variables): _render(v, variables) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_render(v, variables) for v in value]
+    return value
+
+
+def _role_locator(page, action):
+    locator = page.get_by_role(action["role"], name=action.get("name"), exact=action.get("exact"))
+    return locator.nth(action["nth"]) if "nth" in action else locator.first
+
+
+class FlowRunner:
+    """Runs a declarative flow, batching independent clicks and fills into single round trips.
+
+    Actions that need their own handling (dropdowns, dates, number incrementers, uploads,
+    role/text lookups and clicks on the first enabled button with a text)
+    run one by one and flush the pending batch first. Waiting only happens at step boundaries.
+    Selector keys may also be bare field names (e.g. "firstname"), resolved through the form catalog.
+    """
+
+    def __init__(self, page, variables, locale=None, source_locale=None):
+        self.page = page
+        self.variables = variables
+        self.locale = locale
+        self.source_locale = source_locale
+        self.pending = []
+        self.round_trips = 0
+
+    def option_text(self, selector, option):
+        """Dropdown options are written in the flow's own language; the form catalog maps them to the run's.
+
+        Raises rather than sending the source-language text to a form in another language.
+        """
+        if not self.locale or self.locale == self.source_locale:
+            return option
+        catalog = form_catalog(self.page)
+        if catalog is None:
+            raise Exception(f"No form catalog for this form version to translate '{option}' to {self.locale}; "
+                            f"run the form_catalog crawl first (python tests/form_catalog.py).")
+        translated = catalog.translate_option(selector, option, self.source_locale, self.locale)
+        if translated is None:
+            raise Exception(f"The form catalog has no {self.locale} option for '{option}' in '{selector}'.")
+        return translated
+
+    def flush(self):
+        if not self.pending:
+            return
+        ops, self.pending = self.pending, []
+        self.round_trips += 1
+        results = self.page.evaluate(BATCH_SCRIPT, [ops, BATCH_TIMEOUT_MS])
+        for op, result in zip(ops, results):
+            if result["ok"]:
+                continue
+            print(f" Batched {op['op']} on '{op['selector']}' failed ({result['reason']}), retrying directly.")
+            locator = self.page.locator(op["selector"]).first
+            self.round_trips += 1
+            if op["op"] == "click":
+                locator.click()
+            else:
+                locator.fill(op["value"])
+
+    def run_actions(self, actions):
+        for action in actions:
+            self.run_action(action)
+
+    def run_action(self, action):
+        if "repeat" in action:
+            self.repeat(action)
+            return
+        action = _render(action, self.variables)
+        if "click" in action:
+            self.pending.append({"op": "click", "selector": resolve(self.page, action["click"])})
+            return
+        if "fill" in action:
+            self.pending.extend(
+                {"op": "fill", "selector": resolve(self.page, s), "value": str(v)} for s, v in action["fill"].items()
+            )
+            return
+
+        self.flush()
+        self.round_trips += 1
+        page = self.page
+        if "select" in action:
+            for selector, option in action["select"].items():
+                option = self.option_text(resolve(page, selector), option)
+                select_option(page, page.locator(resolve(page, selector)).first, option, cache_key=selector, fallback="error")
+        elif "date" in action:
+            for selector, value in action["date"].items():
+                day, month, year = value.split(".")
+                set_date(page, page.locator(resolve(page, selector)).first, day, month, year, key=selector)
+        elif "numbers" in action:
+            set_numbers(page, {resolve(page, key): int(value) for key, value in action["numbers"].items()})
+        elif "upload" in action:
+            for selector, kind in action["upload"].items():
+                page.locator(resolve(page, selector)).first.set_input_files(upload_payload(kind))
+        elif "listitem" in action:
+            page.get_by_role("listitem", name=action["listitem"]).click()
+        elif "check" in action:
+            page.get_by_role("checkbox", name=action["check"]).check()
+        elif "enabled" in action:
+            click_first(page, "*", action["enabled"], visible=True, enabled=True)
+        elif "text" in action:
+            page.get_by_text(action["text"], exact=action.get("exact")).first.click()
+        elif "role" in action or "locator" in action:
+            if "role" in action:
+                locator = _role_locator(page, action)
+            else:
+                locator = page.locator(action["locator"]).nth(action.get("nth", 0))
+            if "value" in action:
+                locator.fill(action["value"])
+            else:
+                locator.click()
+        else:
+            raise Exception(f"Unknown flow action: {action}")
+
+    def repeat(self, action):
+        """Runs the nested actions once per person, binding {person[...]} to the next record each time."""
+        people = self.variables["people"]
+        count = action["repeat"]
+        count = self.variables["num_adults"] if count == "num_adults" else int(count)
+        outer = self.variables.get("person")
+        for i in range(count):
+            self.variables["person"] = people[(action.get("from", 0) + i) % len(people)]
+            self.run_actions(action["actions"])
+        self.variables["person"] = outer
+
+    def run_step(self, step):
+        previous = active_step(self.page)
+        self.run_actions(step.get("actions", []))
+        self.flush()
+        if "next" in step:
+            self.round_trips += 1
+            self.page.get_by_text(_render(step["next"], self.variables), exact=True).first.click()
+            settle_after_step(self.page, previous)
+
+
+def run_flow(context, flow, people=(), num_adults=NUM_ADULTS, locale=None):
+    """Opens the flow's application form and runs every step.
+
+    The form is opened directly from the listing index when the flow uses the default listing
+    page; otherwise, or for rows the index does not know, through the listing and its popup.
+
+    people are applicant records (see applicants.py), available to templates as {people[0][email]}
+    and, inside repeat blocks, as {person[first_name]}. On-screen texts can be written as
+    {label[save_and_next]}, taken from tests/locales/<locale>.json; locale defaults to the flow's
+    own "locale" and opens the form in that language. Returns the runner, for its round-trip count.
+    """
+    source_locale = flow.get("locale", "en")
+    locale = locale or source_locale
+    variables = {
+        "BASE_URL": BASE_URL, "people": list(people), "num_adults": num_adults, "person": None,
+        "label": load_labels(locale),
+    }
+    if people:
+        variables["person"] = people[0]
+    lang = locale if "locales" in flow else None
+    opening = _render(flow["open"], variables)
+    url = _render(flow.get("url", "{BASE_URL}"), variables)
+    # The listing index knows the form URL behind the popup, which saves the listing load and the popup.
+    form = open_application(context, opening["row"], opening["popup"], lang) if url == BASE_URL else None
+    if form is None:
+        page = context.new_page()
+        install_settle_tracker(page)
+        page.goto(url)
+        page.get_by_role("row", name=opening["row"]).locator("span").nth(opening.get("span", 0)).click()
+        with page.expect_popup() as popup_info:
+            page.get_by_text(opening["popup"]).click()
+        form = popup_info.value
+        settle_after_load(form)
+        if lang:
+            form.goto(with_language(form.url, lang))
+            settle_after_load(form)
+    if "start" in opening:
+        form.get_by_text(opening["start"]).click()
+
+    runner = FlowRunner(form, variables, locale, source_locale)
+    for step in flow["steps"]:
+        runner.run_step(step)
+    print(f" Flow '{flow['name']}' ({locale}) finished in {runner.round_trips} action round trips")
+    return runner
@@ -0,0 +1,292 @@
+import json
+import os
+import re
+import time
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+from dotenv import load_dotenv
+from checkpoints import form_fingerprint
+from field_index import WIDGET_SCRIPT
+from settle import active_step, settle_after_click, settle_after_load
+
+load_dotenv()
+
+CATALOG_DIR = os.getenv("CATALOG_DIR", os.path.join(os.path.dirname(__file__), ".catalog"))
+CATALOG_LANGUAGES = os.getenv("CATALOG_LANGUAGES", "en,de,fr,it").split(",")
+FORM_URL = os.getenv(
+    "FORM_URL",
+    "https://mostar.demo.melon.market/form/application/new/"
+    "bae01d6af78e4420848436fe9d942729/6tb-21c9987501816e557bd8/"
+    "67c10f4b-9986-4f94-a90e-4cc6c5e83f6d",
+)
+
+# The widgets field_index.BUILD_SCRIPT indexes, keyed on the stable element ids instead of stamped selectors.
+EXTRACT_SCRIPT = """
+() => {""" + WIDGET_SCRIPT + """
+    const fields = [];
+    for (const container of document.querySelectorAll(containerSelector)) {
+        if (container.parentElement && container.parentElement.closest(containerSelector)) {
+            continue;
+        }
+        if (container.getClientRects().length === 0) {
+            continue;
+        }
+        const [widget, , targetSelector] = WIDGETS.find((w) => container.matches(w[1]));
+        const target = container.querySelector(targetSelector) || container;
+        const label = labelOf(container);
+        let id = target.id || null;
+        let options = [];
+        if (widget === 'radio-list') {
+            const items = Array.from(target.querySelectorAll('li'));
+            options = items.map((li) => li.getAttribute('title') || li.textContent.trim());
+            const toggle = target.querySelector('[id$="-true"]');
+            id = id || (toggle ? toggle.id.replace(/-true$/, '') : null);
+        }
+        if (!id) {
+            continue;
+        }
+        fields.push({
+            id,
+            name: id.replace(/^field-/, ''),
+            widget,
+            selector: target.id ? `#${target.id}` : `#${id}-true`,
+            label: label.replace(/\\s*\\*$/, ''),
+            required: /\\*$/.test(label) || target.required
+                || !!container.querySelector('.required, [required], [aria-required="true"]'),
+            options,
+        });
+    }
+    return fields;
+}
+"""
+
+OPEN_OPTIONS_SCRIPT = """
+() => Array.from(document.querySelectorAll('.select-dropdown-items-wrapper li.dropdown-item'))
+    .filter((el) => el.getClientRects().length > 0)
+    .map((el) => el.textContent.trim())
+"""
+
+_CATALOGS = {}
+
+
+def with_language(url, lang):
+    """Returns url with its lang query parameter set to lang."""
+    parts = urlsplit(url)
+    query = [(k, v) for k, v in parse_qsl(parts.query) if k != "lang"] + [("lang", lang)]
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+def _select_options(page, selector):
+    page.locator(selector).first.click()
+    try:
+        page.wait_for_selector(".select-dropdown-items-wrapper li.dropdown-item", timeout=5000)
+        return page.evaluate(OPEN_OPTIONS_SCRIPT)
+    finally:
+        page.keyboard.press("Escape")
+        page.locator("body").click(position={"x": 1, "y": 1})
+
+
+def _dependencies(page, fields):
+    """Switches each yes/no toggle on and back, recording the fields that appear only while it is on."""
+    visible = {f["id"] for f in fields}
+    dependent = {}
+    for field in fields:
+        if field["widget"] != "radio-list" or not page.locator(f"#{field['id']}-true").count():
+            continue
+        selected = "true" if "selected" in (page.locator(f"#{field['id']}-true").get_attribute("class") or "") else "false"
+        page.locator(f"#{field['id']}-true").click()
+        settle_after_click(page)
+        for extra in page.evaluate(EXTRACT_SCRIPT):
+            if extra["id"] in visible or extra["id"] in dependent:
+                continue
+            if extra["widget"] == "mdt-select":
+                # Read now: the dropdown is hidden again once the toggle is switched back.
+                extra["options"] = _select_options(page, extra["selector"])
+            dependent[extra["id"]] = {**extra, "depends_on": {"field": field["id"], "value": True}}
+        if selected == "false":
+            page.locator(f"#{field['id']}-false").click()
+            settle_after_click(page)
+    return list(dependent.values())
+
+
+def crawl_step(page):
+    """Extracts every field of the page's current step, including conditional ones, in the page's language."""
+    fields = page.evaluate(EXTRACT_SCRIPT)
+    for field in fields:
+        field["depends_on"] = None
+        if field["widget"] == "mdt-select":
+            field["options"] = _select_options(page, field["selector"])
+    return fields + _dependencies(page, fields)
+
+
+def _labels(page, url, lang):
+    """Reloads the current step in another language and returns {id: (label, options)}."""
+    page.goto(with_language(url, lang))
+    settle_after_load(page)
+    fields = crawl_step(page)
+    return {f["id"]: (f["label"], f["options"]) for f in fields}
+
+
+def crawl(page, advance, languages=CATALOG_LANGUAGES):
+    """Walks the form once and returns its catalog.
+
+    The page must be on the first step. advance is a list of callables, one per step after the
+    first, that fill the current step and move to the next one. Each step is crawled in the
+    first language and then reloaded with ?lang=<code> for the others; the server keeps the
+    application's progress, so the same step comes back translated.
+    """
+    primary, others = languages[0], languages[1:]
+    catalog = {
+        "version": form_fingerprint(page),
+        "url": page.url,
+        "crawled_at": time.time(),
+        "languages": list(languages),
+        "steps": [],
+    }
+    for number in range(len(advance) + 1):
+        url = page.url
+        step = active_step(page)
+        fields = crawl_step(page)
+        entries = []
+        for field in fields:
+            entry = {key: field[key] for key in ("id", "name", "widget", "selector", "required", "depends_on")}
+            entry["labels"] = {primary: field["label"]}
+            entry["options"] = {primary: field["options"]}
+            entries.append(entry)
+        for lang in others:
+            translated = _labels(page, url, lang)
+            for entry in entries:
+                label, options = translated.get(entry["id"], (None, []))
+                entry["labels"][lang] = label
+                entry["options"][lang] = options
+        if others:
+            page.goto(with_language(url, primary))
+            settle_after_load(page)
+        catalog["steps"].append({"step": step, "fields": entries})
+        print(f" Catalogued {len(entries)} fields on step {step}.")
+        if number < len(advance):
+            advance[number](page)
+    return catalog
+
+
+def catalog_path(version, directory=CATALOG_DIR):
+    return os.path.join(directory, f"form-{version}.json")
+
+
+def save_catalog(catalog, directory=CATALOG_DIR):
+    os.makedirs(directory, exist_ok=True)
+    path = catalog_path(catalog["version"], directory)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(catalog, f, indent=2, ensure_ascii=False)
+    os.replace(tmp, path)
+    return path
+
+
+def load_catalog(version, directory=CATALOG_DIR):
+    """The catalog crawled for this form version, or None when it has not been crawled yet."""
+    try:
+        with open(catalog_path(version, directory), encoding="utf-8") as f:
+            return FormCatalog(json.load(f))
+    except (OSError, ValueError):
+        return None
+
+
+class FormCatalog:
+    """Field lookups by name or label, in any catalogued language, without touching the DOM."""
+
+    def __init__(self, data):
+        self.data = data
+        self.fields = [field for step in data["steps"] for field in step["fields"]]
+        self.by_name = {field["name"]: field for field in self.fields}
+        self.by_selector = {field["selector"]: field for field in self.fields}
+
+    def lookup(self, key, widgets=None):
+        """Returns the fields with selector, name or label key, exact label matches first."""
+        if isinstance(widgets, str):
+            widgets = (widgets,)
+        candidates = [f for f in self.fields if widgets is None or f["widget"] in widgets]
+        for index in (self.by_selector, self.by_name):
+            if key in index and index[key] in candidates:
+                return [index[key]]
+        wanted = key.strip().casefold()
+        labels = [(f, [label.casefold() for label in f["labels"].values() if label]) for f in candidates]
+        exact = [f for f, texts in labels if wanted in texts]
+        return exact or [f for f, texts in labels if any(wanted in text for text in texts)]
+
+    def selector(self, key, widgets=None):
+        matches = self.lookup(key, widgets)
+        return matches[0]["selector"] if matches else None
+
+    def translate_option(self, key, text, source, target):
+        """The target-language option at the position where text (a substring, as select_option
+        matches it) appears among the source-language options; None when the catalog does not know it."""
+        matches = self.lookup(key)
+        if not matches:
+            return None
+        options = matches[0]["options"]
+        wanted = text.casefold()
+        for position, option in enumerate(options.get(source) or []):
+            if wanted in option.casefold() and position < len(options.get(target) or []):
+                return options[target][position]
+        return None
+
+    def options(self, key, lang=None):
+        matches = self.lookup(key)
+        if not matches:
+            return []
+        options = matches[0]["options"]
+        return options.get(lang or self.data["languages"][0]) or []
+
+
+def form_catalog(page):
+    """Returns the catalog for the page's form version, or None when that version has not been crawled.
+
+    The version is read once per page; later calls return the cached catalog.
+    """
+    if page not in _CATALOGS:
+        _CATALOGS[page] = load_catalog(form_fingerprint(page))
+        page.on("close", lambda _: _CATALOGS.pop(page, None))
+    return _CATALOGS[page]
+
+
+def resolve(page, key, widgets=None):
+    """CSS selector for a flow key: a bare field name the catalog knows (e.g. 'firstname') maps to its
+    element id, anything else is already a selector and passes through unchanged."""
+    if not re.fullmatch(r"[\w-]+", key):
+        return key
+    catalog = form_catalog(page)
+    field = catalog and catalog.by_name.get(key)
+    if field is None or (widgets is not None and field["widget"] not in widgets):
+        return key
+    return field["selector"]
+
+
+if __name__ == "__main__":
+    from playwright.sync_api import sync_playwright
+    from settle import install_settle_tracker
+    from form_steps import add_adult, fill_household_section, fill_step1, navigate_to_step2, save_and_next
+    from uploads import upload_payload
+
+    def step1(page):
+        fill_step1(page, upload_payload("png"))
+        navigate_to_step2(page)
+
+    def step2(page):
+        fill_household_section(page, upload_payload("png"))
+        save_and_next(page)
+        add_adult(page)
+
+    with sync_playwright() as playwright:
+        browser = playwright.chromium.launch()
+        page = browser.new_page()
+        install_settle_tracker(page)
+        page.goto(with_language(FORM_URL, CATALOG_LANGUAGES[0]))
+        settle_after_load(page)
+        existing = load_catalog(form_fingerprint(page))
+        if existing is not None:
+            print(f" Form version {existing.data['version']} is already catalogued.")
+        else:
+            catalog = crawl(page, [step1, step2])
+            total = sum(len(step["fields"]) for step in catalog["steps"])
+            print(f" Wrote {total} fields to {save_catalog(catalog)}")
+        browser.close()
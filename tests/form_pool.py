@@ -0,0 +1,128 @@
+import json
+import os
+import time
+from dotenv import load_dotenv
+from playwright.sync_api import Error as PlaywrightError
+from listing_index import application_url
+from settle import SETTLE_TIMEOUT_MS, install_settle_tracker, settle_after_load
+
+load_dotenv()
+
+WARM_PAGES = int(os.getenv("WARM_PAGES", 2))
+WARM_LISTINGS = [name.strip() for name in os.getenv("WARM_LISTINGS", "01.01.01 Kanzlei A CHF 2'900").split(";")]
+APPLY_LABEL = os.getenv("WARM_APPLY_LABEL", "Apply")
+
+# Runs in the browser on every document of a parked page: clicks "Start" as soon as it renders
+# and flags the page ready once step 1 is active, without any round trip from the test process.
+AUTO_START_SCRIPT = """
+((labels) => {
+    if (!location.pathname.includes('/form/application')) {
+        return;
+    }
+    window.__warmForm = 'loading';
+    let started = false;
+    const visible = (el) => el.getClientRects().length > 0;
+    const startButton = () => Array.from(document.querySelectorAll('button, a, span, div'))
+        .find((el) => labels.includes(el.textContent.trim()) && !el.querySelector('button, a, span, div') && visible(el));
+    const check = () => {
+        const button = !started && startButton();
+        if (button) {
+            started = true;
+            button.click();
+            return;
+        }
+        if (document.querySelector('.af-steps .af-position.active')) {
+            window.__warmForm = 'ready';
+            observer.disconnect();
+        }
+    };
+    const observer = new MutationObserver(check);
+    document.addEventListener('DOMContentLoaded', () => {
+        observer.observe(document.body, { subtree: true, childList: true });
+        check();
+    });
+})
+"""
+
+
+class FormPagePool:
+    """Keeps WARM_PAGES pages per listing parked on a fresh application form, each in its own context.
+
+    The application URL of each listing comes from the listing index (listing_index.py).
+    Parked pages are then opened straight on that URL: the navigation is started from the page
+    itself and the Start click happens in the browser, so refilling the pool after a take()
+    returns immediately and the form loads while the test runs.
+    """
+
+    def __init__(self, browser_pool, listings=WARM_LISTINGS, size=WARM_PAGES):
+        self.browser_pool = browser_pool
+        self.listings = list(listings)
+        self.size = size
+        self.form_urls = {}
+        self.parked = {listing: [] for listing in self.listings}
+        self.taken = 0
+        self.waits = []
+
+    def form_url(self, listing):
+        """The listing's application form URL, from the listing index."""
+        if listing not in self.form_urls:
+            context = self.browser_pool.acquire()
+            try:
+                url = application_url(context, listing, APPLY_LABEL)
+            finally:
+                self.browser_pool.release(context)
+            if url is None:
+                raise Exception(f"Listing '{listing}' not found in the listing index.")
+            self.form_urls[listing] = url
+        return self.form_urls[listing]
+
+    def _park(self, listing):
+        context = self.browser_pool.acquire()
+        page = context.new_page()
+        install_settle_tracker(page)
+        page.add_init_script(f"{AUTO_START_SCRIPT}({json.dumps(['Start'])})")
+        # Navigating from inside the page returns at once; page.goto would wait for the load.
+        page.evaluate("(url) => { setTimeout(() => { window.location.href = url; }, 0); }", self.form_url(listing))
+        self.parked[listing].append(page)
+
+    def fill(self):
+        """Starts loading pages until every listing has size parked pages."""
+        for listing in self.listings:
+            while len(self.parked[listing]) < self.size:
+                self._park(listing)
+        return self
+
+    def take(self, listing=None):
+        """Returns a page on step 1 of a fresh application and starts warming its replacement."""
+        listing = listing or self.listings[0]
+        if listing not in self.parked:
+            self.listings.append(listing)
+            self.parked[listing] = []
+        if not self.parked[listing]:
+            self._park(listing)
+        page = self.parked[listing].pop(0)
+        self._park(listing)
+
+        start = time.perf_counter()
+        try:
+            page.wait_for_function("() => window.__warmForm === 'ready'", timeout=SETTLE_TIMEOUT_MS)
+        except PlaywrightError as e:
+            print(f" Parked form for '{listing}' did not become ready ({e}), opening another one.")
+            self.release(page)
+            self._park(listing)
+            page = self.parked[listing].pop()
+            page.wait_for_function("() => window.__warmForm === 'ready'", timeout=SETTLE_TIMEOUT_MS)
+        settle_after_load(page)
+        self.waits.append(time.perf_counter() - start)
+        self.taken += 1
+        return page
+
+    def release(self, page):
+        """Hands the page's context back to the browser pool."""
+        self.browser_pool.release(page.context)
+
+    def close(self):
+        for pages in self.parked.values():
+            for page in pages:
+                self.release(page)
+            pages.clear()
@@ -0,0 +1,203 @@
+from bulk_fill import bulk_fill
+from dropdown import select_option
+from element_query import set_radios
+from field_index import field_index
+from incrementers import set_numbers
+from settle import (
+    active_step,
+    settle_after_click,
+    settle_after_fill,
+    settle_after_select,
+    settle_after_step,
+    settle_after_upload,
+)
+from tracer import trace_helpers
+
+# Steps 1 and 2 of the application form and the start of Step 3, shared by test_application_form
+# and the form_catalog crawler.
+
+def fill_step1(page, upload):
+    """Fills Step 1 (Object): radios, number fields, upload and text fields."""
+    click_yes_buttons(page)
+
+    fill_number_inputs(page)
+
+    upload_and_reupload_file(page, upload)
+
+    fill_text_fields(page)
+
+def click_yes_buttons(page):
+    """Clicks all 'Yes' buttons if not already selected."""
+    found, clicked = set_radios(page, "Yes")
+    assert found > 0, "No 'Yes' buttons found!"
+    if clicked:
+        settle_after_click(page)
+
+def navigate_to_step2(page):
+    """Clicks 'Save and Next' and waits for Step 2 (Household) to load."""
+    save_and_next(page)
+
+    page.wait_for_selector(".af-steps .af-position.active", timeout=15000)
+    active_step = page.locator(".af-steps .af-position.active").text_content().strip()
+    assert active_step == "2", f"⚠ Not in Step 2! Expected '2', got '{active_step}'"
+    
+
+def fill_household_section(page, upload):
+    """Fills in the Household section after navigating to Step 2; the caller saves it with save_and_next."""
+    page.wait_for_selector(".sections-container", timeout=10000)
+
+    click_yes_buttons(page)
+
+    select_dropdown_option(page, "Household type", "couple household")
+
+    fill_input_field(page, "Type of pet / dog breed", "Golden Retriever")
+
+    upload_and_reupload_file(page, upload)
+
+    select_radio_option(page, "Music instruments", "Yes")
+    fill_input_field(page, "Type of music instrument", "Piano")
+
+    select_radio_option(page, "Smoker", "No")
+
+    select_dropdown_option(page, "Reason for moving", "Change in space requirements")
+    fill_input_field(page, "Desired reference date", "01-09-2024")
+    fill_input_field(page, "Wanted doorbell/mailbox label", "John Doe")
+
+    select_radio_option(page, "Security deposit (3 grossly month rent)", "Insurance solution")  
+
+    provider_dropdown = page.locator("//span[contains(text(), 'Provider')]")
+    if provider_dropdown.count() > 0:
+        page.wait_for_selector("//span[contains(text(), 'Provider')]", timeout=5000)
+        select_dropdown_option(page, "Provider", "SwissCaution")
+
+    select_radio_option(page, "Monthly household income > 3 monthly rents", "Yes")
+    fill_input_field(page, "IBAN number", "CH9300762011623852957")
+    fill_input_field(page, "Bank name and location", "Swiss Bank, Zurich")
+    fill_input_field(page, "Account owner", "John Doe")
+
+    fill_input_field(page, "Motivation", "Looking for a community-oriented environment.")
+
+    fill_textarea_field(page, "Participation ideas", "Volunteering in community events")
+    fill_textarea_field(page, "Remarks", "Looking forward to being part of the community.")
+
+    select_dropdown_option(page, "Object found on", "Search engine")
+
+    select_dropdown_option(page, "Relation to the cooperative", "Current tenant")
+
+    select_dropdown_option(page, "Type of relation", "Already living in the neighborhood")
+
+
+
+def fill_textarea_field(page, field_label, value):
+    """Fills a textarea field based on the label."""
+    
+    
+    textarea = field_index(page).find(field_label, "mdt-textarea")
+    if textarea is None:
+        textarea = page.locator(f"//div[contains(@class, 'mdt-textarea')]//div[contains(text(), '{field_label}')]/following::textarea[1]")
+        if textarea.count() == 0:
+            raise Exception(f"Textarea '{field_label}' not found!")
+
+    textarea.first.fill(value)
+    settle_after_fill(page)
+
+
+def select_radio_option(page, field_label, option_text):
+    """Selects a radio button based on field label and option text, only if it's not already selected."""
+    
+    radio_list = field_index(page).find(field_label, "radio-list")
+    if radio_list is not None:
+        radio_option = radio_list.locator(f"li[title='{option_text}']")
+    else:
+        radio_option = page.locator(f"//div[contains(text(), '{field_label}')]/following::li[@title='{option_text}'][1]")
+
+    if radio_option.count() > 0:
+        if "selected" not in (radio_option.first.get_attribute("class") or ""):
+            radio_option.first.click()
+            settle_after_click(page)
+        else:
+            print(f" '{field_label}' is already set to '{option_text}', skipping click.")
+    else:
+        raise Exception(f"Radio option '{option_text}' not found for '{field_label}'!")
+
+
+
+def upload_and_reupload_file(page, upload):
+    """Uploads a file, deletes it if already uploaded, then re-uploads it."""
+    file_input = page.locator(".mdt-file-upload input[type='file']")
+    delete_button = page.locator(".mdt-file-single .icon-delete")
+
+    if file_input.count() > 0:
+        page.evaluate("document.querySelector('.mdt-file-upload input[type=file]').style.display = 'block'")
+
+        if delete_button.count() > 0:
+            delete_button.click()
+            settle_after_click(page)
+
+        file_input.set_input_files(upload)
+        settle_after_upload(page)
+
+def fill_number_inputs(page):
+    """Sets every number field to its position (1, 2, ... capped at 7) in one call."""
+    count = page.locator(".mdt-number-incrementer input[type='number']").count()
+    set_numbers(page, [min(i + 1, 7) for i in range(count)])
+    settle_after_fill(page)
+
+def fill_text_fields(page):
+    """Fills all required text fields."""
+    fields = {
+        "Car ownership justification": "I own a car for work purposes.",
+        "Wanted area of additional room (from-to)": "15-30 sqm",
+        "Wanted area of storage room (from-to)": "10-20 sqm",
+        "Reason for home office work": "Remote work requirement.",
+    }
+    
+    bulk_fill(page, fields)
+    settle_after_fill(page)
+
+def fill_input_field(page, field_label, value):
+    """Fills a single input field based on label."""
+    input_field = field_index(page).find(field_label, ("mdt-input", "mdt-datepicker"))
+    if input_field is None:
+        input_field = page.locator(f"//span[contains(text(), '{field_label}')]/ancestor::div[contains(@class, 'mdt-input')]//input")
+        if input_field.count() == 0:
+            return
+    input_field.first.fill(value)
+    settle_after_fill(page)
+
+def select_dropdown_option(page, field_label, option_text):
+    """Selects a dropdown option based on the field label."""
+    
+    dropdown = field_index(page).find(field_label, "mdt-select")
+    if dropdown is None:
+        dropdown = page.locator(f"//span[contains(text(), '{field_label}')]/ancestor::div[contains(@class, 'mdt-select')]//input")
+        if dropdown.count() == 0:
+            dropdown = page.locator(f"//label[contains(text(), '{field_label}')]/ancestor::div[contains(@class, 'mdt-select')]//input")
+
+        if dropdown.count() == 0:
+            raise Exception(f"Dropdown '{field_label}' not found!")
+
+    select_option(page, dropdown.first, option_text, cache_key=field_label)
+    settle_after_select(page)
+
+
+
+def save_and_next(page):
+    """Clicks 'Save and Next' button if present."""
+    save_button = page.locator(".btn-next")
+    if save_button.count() > 0:
+        previous_step = active_step(page)
+        save_button.click()
+        settle_after_step(page, previous_step)
+
+def add_adult(page):
+    """Clicks the 'Add Adult' button at the start of Step 3."""
+    add_adult_button = page.locator("//div[contains(@class, 'create-adult')]//i[contains(@class, 'fa-plus-circle')]")
+    if add_adult_button.count() > 0:
+        add_adult_button.first.click()
+        settle_after_click(page)
+    else:
+        raise Exception("Add Adult button not found!")
+
+
+trace_helpers(globals())
@@ -0,0 +1,143 @@
+import base64
+import glob
+import json
+import os
+import re
+from urllib.parse import urlsplit, urlunsplit
+from dotenv import load_dotenv
+
+load_dotenv()
+
+NETWORK_MODE = os.getenv("NETWORK_MODE", "live")
+HAR_DIR = os.getenv("HAR_DIR", os.path.join(os.path.dirname(__file__), ".har"))
+REPLAY_NOT_FOUND = os.getenv("REPLAY_NOT_FOUND", "abort")
+
+SKIPPED_RESPONSE_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+
+def har_path(nodeid):
+    """Returns the HAR file a test records into, named after its node id."""
+    return os.path.join(HAR_DIR, re.sub(r"[^\w.-]+", "_", nodeid) + ".har")
+
+
+def record_context_args(nodeid):
+    """Context options that record every request of the test into its own HAR file."""
+    os.makedirs(HAR_DIR, exist_ok=True)
+    return {
+        "record_har_path": har_path(nodeid),
+        "record_har_content": "embed",
+        "service_workers": "block",
+    }
+
+
+def _strip_fragment(url):
+    parts = urlsplit(url)
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, parts.query, ""))
+
+
+def _strip_query(url):
+    parts = urlsplit(url)
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, "", ""))
+
+
+def _parse_body(text):
+    if not text:
+        return None
+    try:
+        return json.loads(text)
+    except ValueError:
+        return text
+
+
+def _body_score(recorded, actual):
+    """Counts matching top-level JSON fields, so step saves with different values still match."""
+    if recorded == actual:
+        return 1_000_000
+    if isinstance(recorded, dict) and isinstance(actual, dict):
+        same_keys = recorded.keys() & actual.keys()
+        return len(same_keys) + sum(1 for key in same_keys if recorded[key] == actual[key])
+    return 0
+
+
+def _response_headers(response):
+    """Folds the HAR header list into the dict route.fulfill takes, keeping repeated headers.
+
+    Repeated values are joined with ", " as RFC 9110 allows, except Set-Cookie, whose values may
+    contain commas: those are joined with newlines, which Playwright splits back into separate headers.
+    """
+    values = {}
+    for header in response.get("headers", []):
+        name = header["name"].lower()
+        if name not in SKIPPED_RESPONSE_HEADERS:
+            values.setdefault(name, []).append(header["value"])
+    return {name: ("\n" if name == "set-cookie" else ", ").join(found) for name, found in values.items()}
+
+
+class HarReplay:
+    """Serves recorded HAR responses to a context through context.route.
+
+    Only contexts from the shared browser pool are attached; async_runner and load_runner launch
+    their own browsers and always talk to the live server.
+    """
+
+    def __init__(self, directory=HAR_DIR, not_found=REPLAY_NOT_FOUND):
+        self.not_found = not_found
+        self.entries = {}
+        self.loose_entries = {}
+        self._served = {}
+        self.hits = 0
+        self.misses = 0
+        for path in sorted(glob.glob(os.path.join(directory, "*.har"))):
+            with open(path, encoding="utf-8") as f:
+                for entry in json.load(f)["log"]["entries"]:
+                    self._add(entry)
+
+    def _add(self, entry):
+        if entry["response"]["status"] <= 0:
+            return
+        request = entry["request"]
+        method = request["method"]
+        self.entries.setdefault((method, _strip_fragment(request["url"])), []).append(entry)
+        self.loose_entries.setdefault((method, _strip_query(request["url"])), []).append(entry)
+
+    def _find(self, request):
+        key = (request.method, _strip_fragment(request.url))
+        candidates = self.entries.get(key)
+        if not candidates:
+            key = (request.method, _strip_query(request.url))
+            candidates = self.loose_entries.get(key)
+        if not candidates:
+            return None
+
+        if request.method in ("GET", "HEAD", "OPTIONS") or len(candidates) == 1:
+            return candidates[0]
+
+        actual = _parse_body(request.post_data)
+        scores = [_body_score(_parse_body(c["request"].get("postData", {}).get("text")), actual)
+                  for c in candidates]
+        best = max(scores)
+        best_candidates = [c for c, score in zip(candidates, scores) if score == best]
+        # Repeated saves to the same endpoint replay their recorded responses in order.
+        served = self._served.get(key, 0)
+        self._served[key] = served + 1
+        return best_candidates[served % len(best_candidates)]
+
+    def handle(self, route):
+        entry = self._find(route.request)
+        if entry is None:
+            self.misses += 1
+            if self.not_found == "fallback":
+                route.fallback()
+            else:
+                route.abort("internetdisconnected")
+            return
+
+        self.hits += 1
+        response = entry["response"]
+        content = response.get("content", {})
+        text = content.get("text", "")
+        body = base64.b64decode(text) if content.get("encoding") == "base64" else text.encode("utf-8")
+        route.fulfill(status=response["status"], headers=_response_headers(response), body=body)
+
+    def attach(self, context):
+        context.route("**/*", self.handle)
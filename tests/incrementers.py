@@ -0,0 +1,126 @@
+import re
+
+SET_NUMBERS_SCRIPT = """
+async ([targets, positional, within]) => {
+    const frame = () => new Promise((resolve) => requestAnimationFrame(() => resolve()));
+    const scope = document.querySelector(within) || document;
+    const inputs = Array.from(scope.querySelectorAll('.mdt-number-incrementer input'));
+
+    const entries = [];
+    for (const [key, selector, value] of targets) {
+        entries.push({ key, el: document.querySelector(selector), value });
+    }
+    positional.forEach((value, i) => {
+        if (i < inputs.length) {
+            entries.push({ key: String(i), el: inputs[i], value });
+        }
+    });
+
+    const clamp = (el, value) => {
+        let target = Number(value);
+        if (el.min !== '' && !Number.isNaN(Number(el.min))) {
+            target = Math.max(target, Number(el.min));
+        }
+        if (el.max !== '' && !Number.isNaN(Number(el.max))) {
+            target = Math.min(target, Number(el.max));
+        }
+        return target;
+    };
+    const setter = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set;
+
+    // A value of { by: n } moves the field n steps from what it holds now, as n button clicks would.
+    const requested = (el, value) => (value !== null && typeof value === 'object'
+        ? Number(el.value || 0) + value.by * (Number(el.step) || 1)
+        : Number(value));
+
+    for (const entry of entries) {
+        if (!entry.el) {
+            continue;
+        }
+        entry.requested = requested(entry.el, entry.value);
+        entry.target = clamp(entry.el, entry.requested);
+        entry.el.focus();
+        setter.call(entry.el, String(entry.target));
+        entry.el.dispatchEvent(new Event('input', { bubbles: true }));
+        entry.el.dispatchEvent(new Event('change', { bubbles: true }));
+        entry.el.blur();
+        entry.via = 'input';
+    }
+    // One re-render for all fields, then step the ones whose component threw the typed value away.
+    await frame();
+
+    const press = (button) => {
+        for (const type of ['mousedown', 'mouseup', 'click']) {
+            button.dispatchEvent(new MouseEvent(type, { bubbles: true, cancelable: true, view: window }));
+        }
+    };
+    for (const entry of entries) {
+        if (!entry.el || Number(entry.el.value) === entry.target) {
+            continue;
+        }
+        const wrapper = entry.el.closest('.wrapper') || entry.el.parentElement;
+        const up = wrapper.querySelector('[id^="increment"]');
+        const down = wrapper.querySelector('[id^="decrement"]');
+        entry.via = 'buttons';
+        let guard = 1000;
+        while (Number(entry.el.value || 0) !== entry.target && guard-- > 0) {
+            const before = entry.el.value;
+            const button = Number(entry.el.value || 0) < entry.target ? up : down;
+            if (!button) {
+                break;
+            }
+            press(button);
+            await frame();
+            if (entry.el.value === before) {
+                break;
+            }
+        }
+    }
+
+    return entries.map(({ key, el, requested, target, via }) => ({
+        key,
+        found: !!el,
+        requested: el ? requested : null,
+        target: el ? target : null,
+        value: el ? el.value : null,
+        ok: !!el && Number(el.value) === target,
+        via: via || null,
+    }));
+}
+"""
+
+
+def _selector(key):
+    # Bare names such as 'days_present' are the form's field-<name> ids.
+    return f"#field-{key}" if re.fullmatch(r"[\w-]+", key) else key
+
+
+def set_numbers(page, values, within="body"):
+    """Sets mdt-number-incrementer fields to target values in one page.evaluate.
+
+    values is either {name or selector: number} or a list of numbers applied to the
+    incrementers inside within in document order. A value of {"by": n} moves the field n steps
+    from its current value instead, like n clicks on its buttons. Targets are clamped to the
+    input's min and max, typed in with input/change events and checked after one re-render; fields whose
+    component rejected the typed value are stepped with their increment/decrement buttons
+    inside the same call. Returns {key: value left in the field}; raises when a field is
+    missing or does not end up on its target.
+    """
+    if isinstance(values, dict):
+        targets = [[key, _selector(key), value] for key, value in values.items()]
+        positional = []
+    else:
+        targets, positional = [], list(values)
+    results = page.evaluate(SET_NUMBERS_SCRIPT, [targets, positional, within])
+
+    missing = [result["key"] for result in results if not result["found"]]
+    if missing:
+        raise Exception(f"Number fields not found: {', '.join(missing)}")
+    numbers = {}
+    for result in results:
+        if not result["ok"]:
+            raise Exception(f"Number field '{result['key']}' holds '{result['value']}' instead of {result['target']}")
+        if result["target"] != float(result["requested"]):
+            print(f" Number field '{result['key']}' clamped from {result['requested']} to {result['target']}.")
+        numbers[result["key"]] = result["value"]
+    return numbers
@@ -0,0 +1,29 @@
+import json
+import os
+from dotenv import load_dotenv
+
+load_dotenv()
+
+LOCALE_DIR = os.getenv("LOCALE_DIR", os.path.join(os.path.dirname(__file__), "locales"))
+# fr and it are translations nobody has checked against the live form yet; run them by setting FLOW_LOCALES.
+LOCALES = os.getenv("FLOW_LOCALES", "en,de").split(",")
+
+_LABELS = {}
+
+
+def load_labels(locale):
+    """The on-screen text of each logical action (e.g. 'save_and_next') in locale, read once per process."""
+    if locale not in _LABELS:
+        with open(os.path.join(LOCALE_DIR, f"{locale}.json"), encoding="utf-8") as f:
+            _LABELS[locale] = {key: text for key, text in json.load(f).items() if not key.startswith("_")}
+    return _LABELS[locale]
+
+
+def unverified_labels(locale):
+    """Keys listed under "_unverified" in locale's file: texts no recorded script has shown on the form."""
+    with open(os.path.join(LOCALE_DIR, f"{locale}.json"), encoding="utf-8") as f:
+        return set(json.load(f).get("_unverified", []))
+
+
+def available_locales(directory=LOCALE_DIR):
+    return sorted(name[:-5] for name in os.listdir(directory) if name.endswith(".json"))
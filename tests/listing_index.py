@@ -0,0 +1,217 @@
+import json
+import os
+import re
+import time
+from urllib.parse import parse_qs, urlsplit
+from dotenv import load_dotenv
+from form_catalog import with_language
+from settle import install_settle_tracker, settle_after_load
+
+load_dotenv()
+
+BASE_URL = os.getenv("BASE_URL")
+LISTING_INDEX_DIR = os.getenv("LISTING_INDEX_DIR", os.path.join(os.path.dirname(__file__), ".listings"))
+LISTING_INDEX_TTL = int(os.getenv("LISTING_INDEX_TTL", 3600))
+
+# Expands every row and presses its Apply button with window.open and new-tab links intercepted,
+# so the application URLs are collected from one load of the listing page without any popup.
+INDEX_SCRIPT = """
+async ([applyLabels, timeout]) => {
+    const frame = () => new Promise((resolve) => requestAnimationFrame(() => resolve()));
+    const visible = (el) => el.getClientRects().length > 0;
+    const waitFor = async (find) => {
+        const deadline = performance.now() + timeout;
+        let found = find();
+        while (!found && performance.now() < deadline) {
+            await frame();
+            found = find();
+        }
+        return found;
+    };
+    const press = (el) => {
+        for (const type of ['mousedown', 'mouseup', 'click']) {
+            el.dispatchEvent(new MouseEvent(type, { bubbles: true, cancelable: true, view: window }));
+        }
+    };
+
+    const captured = [];
+    const originalOpen = window.open;
+    window.open = (url) => {
+        captured.push(new URL(String(url), location.href).href);
+        return null;
+    };
+    const intercept = (event) => {
+        const link = event.target.closest && event.target.closest('a[href]');
+        if (link && (link.target === '_blank' || link.href.includes('/form/application'))) {
+            captured.push(link.href);
+            event.preventDefault();
+        }
+    };
+    document.addEventListener('click', intercept, true);
+
+    const applyButton = () => Array.from(document.querySelectorAll('a, button, span, div'))
+        .find((el) => applyLabels.includes(el.textContent.trim()) && visible(el)
+            && !el.querySelector('a, button, span, div'));
+
+    const rows = [];
+    try {
+        for (const row of document.querySelectorAll('tr')) {
+            const cells = Array.from(row.querySelectorAll('td')).map((td) => td.textContent.trim()).filter(Boolean);
+            const toggle = row.querySelectorAll('span')[1] || row.querySelector('span');
+            if (!cells.length || !toggle) {
+                continue;
+            }
+            const before = captured.length;
+            press(toggle);
+            const apply = await waitFor(applyButton);
+            if (apply) {
+                press(apply);
+                await waitFor(() => captured.length > before);
+            }
+            rows.push({ row: cells.join(' '), cells, apply: !!apply, url: captured[before] || null });
+            if (apply) {
+                // Collapse the row again so the next row's Apply button is the only one visible.
+                press(toggle);
+                await waitFor(() => !applyButton());
+            }
+        }
+    } finally {
+        window.open = originalOpen;
+        document.removeEventListener('click', intercept, true);
+    }
+    return rows;
+}
+"""
+
+OBJECT_NUMBER = re.compile(r"^\d{2}\.\d{2}\.?\d{2,}$")
+RENT = re.compile(r"CHF\s*[\d'’.,]+")
+
+_INDEXES = {}
+_SESSION_START = time.time()
+
+
+def _uuid(url):
+    """The object uuid(s) of an application URL: the ?uuids= list, or the last path segment."""
+    parts = urlsplit(url)
+    uuids = parse_qs(parts.query).get("uuids")
+    if uuids:
+        return uuids[0]
+    return parts.path.rstrip("/").rsplit("/", 1)[-1]
+
+
+def _entry(row):
+    cells = row["cells"]
+    number = next((cell for cell in cells if OBJECT_NUMBER.match(cell)), None)
+    rent = RENT.search(row["row"])
+    building = next((cell for cell in cells if cell != number and not RENT.search(cell)), None)
+    return {
+        "row": row["row"],
+        "object": number,
+        "building": building,
+        "rent": rent.group(0) if rent else None,
+        "url": row["url"],
+        "uuid": _uuid(row["url"]) if row["url"] else None,
+    }
+
+
+def build_index(context, apply_label="Apply", timeout=5000):
+    """Loads the listing page once and returns {row name: entry} for every row with an application URL.
+
+    apply_label is the Apply button's text in the listing's language ("Apply", "Bewerben").
+    """
+    page = context.new_page()
+    try:
+        install_settle_tracker(page)
+        page.goto(BASE_URL)
+        settle_after_load(page)
+        page.wait_for_selector("tr td", timeout=15000)
+        rows = page.evaluate(INDEX_SCRIPT, [[apply_label], timeout])
+    finally:
+        page.close()
+    for row in rows:
+        if row["apply"] and not row["url"]:
+            # The button reacted to none of the synthetic events, e.g. because it checks isTrusted.
+            print(f" Listing row '{row['row']}' has an Apply button but no URL was captured; "
+                  f"it opens through the popup instead.")
+    entries = {row["row"]: _entry(row) for row in rows if row["url"]}
+    print(f" Indexed {len(entries)} of {len(rows)} listing rows ('{apply_label}').")
+    return entries
+
+
+def index_path(apply_label, directory=LISTING_INDEX_DIR):
+    return os.path.join(directory, f"index-{apply_label}.json")
+
+
+def _load(apply_label):
+    try:
+        with open(index_path(apply_label), encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return data if data.get("base_url") == BASE_URL else None
+
+
+def _save(data, apply_label):
+    path = index_path(apply_label)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+    os.replace(tmp, path)
+
+
+def _fresh(data):
+    return data is not None and time.time() - data["built_at"] <= LISTING_INDEX_TTL
+
+
+def listing_index(context, apply_label="Apply", refresh=False):
+    """The listing index, from memory or disk while younger than LISTING_INDEX_TTL seconds, else rebuilt."""
+    data = None if refresh else _INDEXES.get(apply_label)
+    if not _fresh(data):
+        data = None if refresh else _load(apply_label)
+        if not _fresh(data):
+            data = {"base_url": BASE_URL, "built_at": time.time(), "rows": build_index(context, apply_label)}
+            _save(data, apply_label)
+        _INDEXES[apply_label] = data
+    return data["rows"]
+
+
+def find_listing(rows, name):
+    """The entry whose row text or object number matches name, or None; raises when several match.
+
+    Playwright's row names drop the spacing, so rows are also compared with all whitespace removed.
+    """
+    if name in rows:
+        return rows[name]
+    squashed = re.sub(r"\s+", "", name)
+    matches = [entry for entry in rows.values()
+               if re.sub(r"\s+", "", entry["row"]) == squashed or entry["object"] == name]
+    if len(matches) > 1:
+        raise Exception(f"Listing '{name}' matches {len(matches)} rows: {[entry['row'] for entry in matches]}")
+    return matches[0] if matches else None
+
+
+def application_url(context, name, apply_label="Apply"):
+    """The application form URL for a listing row, or None if the row is unknown.
+
+    An index loaded from an earlier session is rebuilt once when the row is missing from it.
+    """
+    entry = find_listing(listing_index(context, apply_label), name)
+    if entry is None and _INDEXES[apply_label]["built_at"] < _SESSION_START:
+        entry = find_listing(listing_index(context, apply_label, refresh=True), name)
+    return entry and entry["url"]
+
+
+def open_application(context, name, apply_label="Apply", lang=None):
+    """Opens the listing's application form directly, where the Apply popup would have landed; None if unknown.
+
+    lang switches the form's language through its ?lang= parameter.
+    """
+    url = application_url(context, name, apply_label)
+    if url is None:
+        return None
+    page = context.new_page()
+    install_settle_tracker(page)
+    page.goto(with_language(url, lang) if lang else url)
+    settle_after_load(page)
+    return page
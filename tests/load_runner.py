@@ -0,0 +1,139 @@
+import argparse
+import asyncio
+import os
+import time
+from dotenv import load_dotenv
+from playwright.async_api import async_playwright
+from applicants import applicant_record
+from async_runner import BASE_URL, NUM_ADULTS, add_adult, fill_household, percentile, start_application, submit
+
+load_dotenv()
+LOAD_USERS = int(os.getenv("LOAD_USERS", 4))
+LOAD_DURATION = float(os.getenv("LOAD_DURATION", 300))
+LOAD_ITERATIONS = int(os.getenv("LOAD_ITERATIONS", 0))
+LOAD_THINK_TIME = float(os.getenv("LOAD_THINK_TIME", 0))
+FLOW_TIMEOUT = float(os.getenv("FLOW_TIMEOUT", 300))
+
+STEPS = ("start", "household", "add_adult", "submit")
+
+
+async def _timed(timings, step, coro):
+    start = time.perf_counter()
+    result = await coro
+    timings.setdefault(step, []).append(time.perf_counter() - start)
+    return result
+
+
+async def _iteration(context, people, timings):
+    page1 = await _timed(timings, "start", start_application(context))
+    await _timed(timings, "household", fill_household(page1))
+    for person in people:
+        await _timed(timings, "add_adult", add_adult(page1, person))
+    await _timed(timings, "submit", submit(page1))
+
+
+async def virtual_user(browser, user, deadline, iterations, num_adults, think_time, flow_timeout):
+    """Submits applications back to back until the deadline (or iteration count) is reached.
+
+    Each iteration gets a fresh context and applicant records indexed by (user, iteration), so runs are repeatable.
+    """
+    results = []
+    iteration = 0
+    while time.perf_counter() < deadline and (not iterations or iteration < iterations):
+        first = (user * 100_000 + iteration) * num_adults
+        people = [applicant_record(first + n) for n in range(num_adults)]
+        context = None
+        timings = {}
+        error = None
+        start = time.perf_counter()
+        try:
+            context = await browser.new_context()
+            await asyncio.wait_for(_iteration(context, people, timings), timeout=flow_timeout)
+        except asyncio.TimeoutError:
+            error = f"timed out after {flow_timeout:.0f}s"
+        except Exception as e:
+            error = (str(e).splitlines() or [type(e).__name__])[0]
+        finally:
+            if context is not None:
+                await context.close()
+        results.append({
+            "user": user, "iteration": iteration, "seconds": time.perf_counter() - start,
+            "steps": timings, "error": error,
+        })
+        iteration += 1
+        if think_time:
+            await asyncio.sleep(think_time)
+    return results
+
+
+async def run_load(users=LOAD_USERS, duration=LOAD_DURATION, iterations=LOAD_ITERATIONS,
+                   num_adults=NUM_ADULTS, think_time=LOAD_THINK_TIME, flow_timeout=FLOW_TIMEOUT, headless=True):
+    """Runs a closed-loop load test: users virtual applicants, each starting a new application when the last ends."""
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=headless)
+        try:
+            start = time.perf_counter()
+            deadline = start + duration
+            per_user = await asyncio.gather(*(
+                virtual_user(browser, user, deadline, iterations, num_adults, think_time, flow_timeout)
+                for user in range(users)
+            ))
+            wall = time.perf_counter() - start
+        finally:
+            await browser.close()
+    return summarize_load([result for results in per_user for result in results], wall, users)
+
+
+def summarize_load(results, wall, users):
+    """Aggregates iterations into throughput and per-step latency percentiles (failed iterations excluded)."""
+    ok = [r for r in results if r["error"] is None]
+    steps = {}
+    for step in STEPS:
+        samples = [seconds for r in ok for seconds in r["steps"].get(step, [])]
+        steps[step] = {
+            "count": len(samples),
+            "p50": percentile(samples, 50),
+            "p90": percentile(samples, 90),
+            "p99": percentile(samples, 99),
+            "max": max(samples, default=0.0),
+        }
+    flows = [r["seconds"] for r in ok]
+    return {
+        "users": users,
+        "iterations": len(results),
+        "succeeded": len(ok),
+        "failed": len(results) - len(ok),
+        "wall_seconds": wall,
+        "submissions_per_second": len(ok) / wall if wall else 0.0,
+        "flow_p50": percentile(flows, 50),
+        "flow_p95": percentile(flows, 95),
+        "steps": steps,
+        "errors": [r for r in results if r["error"] is not None],
+    }
+
+
+def print_load_summary(summary):
+    print(f" {summary['users']} virtual applicant(s) against {BASE_URL}: {summary['succeeded']}/{summary['iterations']}"
+          f" submissions in {summary['wall_seconds']:.1f}s ({summary['submissions_per_second']:.3f}/s)")
+    print(f" Full flow p50 {summary['flow_p50']:.1f}s, p95 {summary['flow_p95']:.1f}s")
+    for step, stats in summary["steps"].items():
+        print(f"   {step:<10} n={stats['count']:<5} p50 {stats['p50']:6.2f}s  p90 {stats['p90']:6.2f}s"
+              f"  p99 {stats['p99']:6.2f}s  max {stats['max']:6.2f}s")
+    for failure in summary["errors"]:
+        print(f" User {failure['user']} iteration {failure['iteration']} failed: {failure['error']}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Closed-loop load test of the application submission flow.")
+    parser.add_argument("--users", type=int, default=LOAD_USERS)
+    parser.add_argument("--duration", type=float, default=LOAD_DURATION, help="seconds to keep submitting")
+    parser.add_argument("--iterations", type=int, default=LOAD_ITERATIONS, help="per user, 0 = until duration")
+    parser.add_argument("--adults", type=int, default=NUM_ADULTS)
+    parser.add_argument("--think-time", type=float, default=LOAD_THINK_TIME)
+    parser.add_argument("--timeout", type=float, default=FLOW_TIMEOUT)
+    parser.add_argument("--headed", action="store_true")
+    args = parser.parse_args()
+    print_load_summary(asyncio.run(run_load(
+        args.users, args.duration, args.iterations, args.adults, args.think_time, args.timeout,
+        headless=not args.headed,
+    )))
@@ -0,0 +1,71 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from labels import LOCALES
+from selector_cache import SELECTOR_STATS_PATH, SelectorCache
+
+SHARD_DIR = os.getenv("SHARD_DIR", os.path.join(os.path.dirname(__file__), ".shards"))
+
+
+def shard_env(locale, directory=SHARD_DIR):
+    """The environment of one locale's pytest process.
+
+    Files a session writes go to the shard's own directory, so shards running at the same time never
+    read-merge-replace the same file. The form catalog and the applicant dataset stay shared: tests
+    only read the catalog, and the dataset file is written once, atomically, with the same content.
+    """
+    base = os.path.join(directory, locale)
+    return {
+        **os.environ,
+        "FLOW_LOCALES": locale,
+        "SELECTOR_STATS_PATH": os.path.join(base, "selectors.json"),
+        "LISTING_INDEX_DIR": os.path.join(base, "listings"),
+        "CHECKPOINT_DIR": os.path.join(base, "checkpoints"),
+        "TRACE_DIR": os.path.join(base, "perf"),
+        "PAGE_METRICS_PATH": os.path.join(base, "perf", "page_metrics.jsonl"),
+    }
+
+
+def merge_selector_stats(path):
+    """Adds a finished shard's selector stats to SELECTOR_STATS_PATH, then removes the shard's file."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            stats = json.load(f)
+    except (OSError, ValueError):
+        return
+    cache = SelectorCache(SELECTOR_STATS_PATH)
+    cache.pending = stats
+    cache.save()
+    os.remove(path)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the flow tests once per language, all languages at the same time.")
+    parser.add_argument("--locales", default=",".join(LOCALES), help="comma-separated locales (default: FLOW_LOCALES)")
+    parser.add_argument("pytest_args", nargs="*", default=[os.path.join(os.path.dirname(__file__), "test_flows.py")])
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    shards = {}
+    for locale in args.locales.split(","):
+        # Each shard is its own pytest process with its own browsers and its own state directory.
+        shards[locale] = subprocess.Popen(
+            [sys.executable, "-m", "pytest", "-q", *args.pytest_args],
+            env=shard_env(locale),
+            stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True,
+        )
+    failed = []
+    for locale, shard in shards.items():
+        output, _ = shard.communicate()
+        lines = output.strip().splitlines()
+        print(f" [{locale}] {lines[-1] if lines else 'no output'}")
+        if shard.returncode:
+            failed.append(locale)
+            print(output)
+        merge_selector_stats(shard_env(locale)["SELECTOR_STATS_PATH"])
+    print(f" {len(shards)} locale shard(s) finished in {time.perf_counter() - start:.1f}s"
+          + (f", failed: {', '.join(failed)}" if failed else ""))
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,132 @@
+import base64
+import json
+import os
+from urllib.parse import urlsplit
+from dotenv import load_dotenv
+
+load_dotenv()
+
+FIRST_PARTY_DOMAINS = tuple(os.getenv("FIRST_PARTY_DOMAINS", "melon.market").split(","))
+PROFILE_BASELINE = os.getenv("NETWORK_PROFILE_BASELINE", "0") == "1"
+BASELINE_PATH = os.getenv(
+    "NETWORK_PROFILE_BASELINE_PATH", os.path.join(os.path.dirname(__file__), ".perf", "profile_baselines.json")
+)
+
+TRANSPARENT_PNG = base64.b64decode(
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR42mNkYAAAAAYAAjCB0C8AAAAASUVORK5CYII="
+)
+
+TRACKING_PATTERNS = (
+    "google-analytics.com", "googletagmanager.com", "doubleclick.net", "facebook.net", "facebook.com/tr",
+    "hotjar.com", "clarity.ms", "matomo", "piwik", "segment.io", "cookiebot.com",
+)
+
+PROFILES = {
+    "read_only": {
+        "block_third_party": True,
+        "block_tracking": True,
+        "abort_types": {"font", "media"},
+        "stub_types": {"image"},
+    },
+    "no_tracking": {
+        "block_third_party": False,
+        "block_tracking": True,
+        "abort_types": set(),
+        "stub_types": set(),
+    },
+}
+
+MEASURE_SCRIPT = """
+() => {
+    const nav = performance.getEntriesByType('navigation')[0];
+    const resources = performance.getEntriesByType('resource');
+    return {
+        bytes: (nav ? nav.transferSize : 0) + resources.reduce((sum, r) => sum + (r.transferSize || 0), 0),
+        load_ms: nav ? nav.loadEventEnd - nav.startTime : 0,
+        requests: resources.length + 1,
+    };
+}
+"""
+
+
+def _is_first_party(url):
+    host = urlsplit(url).hostname or ""
+    return any(host == domain or host.endswith("." + domain) for domain in FIRST_PARTY_DOMAINS)
+
+
+def _load_baselines():
+    try:
+        with open(BASELINE_PATH) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def measure_page(page):
+    """Returns transferred bytes, load time and request count of the current page load."""
+    page.wait_for_load_state("load")
+    return page.evaluate(MEASURE_SCRIPT)
+
+
+class NetworkProfile:
+    """Aborts or stubs classes of requests on a page and counts what it blocked."""
+
+    def __init__(self, name):
+        self.name = name
+        self.rules = PROFILES[name]
+        self.blocked = {}
+
+    def _classify(self, request):
+        url = request.url
+        if self.rules["block_tracking"] and any(pattern in url for pattern in TRACKING_PATTERNS):
+            return "tracking"
+        if url.startswith("data:"):
+            return None
+        if request.resource_type in self.rules["stub_types"]:
+            return request.resource_type
+        if request.resource_type in self.rules["abort_types"]:
+            return request.resource_type
+        if self.rules["block_third_party"] and not _is_first_party(url):
+            return "third_party"
+        return None
+
+    def handle(self, route):
+        kind = self._classify(route.request)
+        if kind is None:
+            route.fallback()
+            return
+        self.blocked[kind] = self.blocked.get(kind, 0) + 1
+        if kind == "image":
+            # Keep the <img> elements loading so counts and visibility checks still pass.
+            route.fulfill(status=200, content_type="image/png", body=TRANSPARENT_PNG)
+        else:
+            route.abort("blockedbyclient")
+
+    def apply(self, page):
+        page.route("**/*", self.handle)
+        return self
+
+    def report(self, page):
+        """Prints what was blocked and the bytes/ms saved against the recorded unblocked baseline."""
+        metrics = measure_page(page)
+        blocked = ", ".join(f"{kind} {count}" for kind, count in sorted(self.blocked.items())) or "nothing"
+        line = f" Network profile '{self.name}' on {page.url}: blocked {blocked}"
+        baseline = _load_baselines().get(page.url)
+        if baseline:
+            saved_kb = (baseline["bytes"] - metrics["bytes"]) / 1024
+            saved_ms = baseline["load_ms"] - metrics["load_ms"]
+            line += f"; saved {saved_kb:.0f} KB and {saved_ms:.0f} ms"
+        print(line)
+        return metrics
+
+
+def record_baseline(page):
+    """Stores the unblocked load of the current page as the baseline profiles are compared against."""
+    metrics = measure_page(page)
+    baselines = _load_baselines()
+    baselines[page.url] = metrics
+    os.makedirs(os.path.dirname(BASELINE_PATH), exist_ok=True)
+    with open(BASELINE_PATH, "w") as f:
+        json.dump(baselines, f, indent=2)
+    print(f" Recorded network baseline for {page.url}: {metrics['bytes'] / 1024:.0f} KB, {metrics['load_ms']:.0f} ms")
+    return metrics
@@ -0,0 +1,181 @@
+import json
+import os
+import time
+from contextlib import contextmanager
+from dotenv import load_dotenv
+from playwright.sync_api import Error as PlaywrightError
+from har_replay import NETWORK_MODE
+
+load_dotenv()
+
+METRICS_PATH = os.getenv(
+    "PAGE_METRICS_PATH", os.path.join(os.path.dirname(__file__), ".perf", "page_metrics.jsonl")
+)
+
+# Budgets per page kind; any entry can be overridden with PERF_BUDGET_<KIND>_<METRIC>, e.g. PERF_BUDGET_LISTING_LCP_MS.
+BUDGETS = {
+    "listing": {"fcp_ms": 2500, "lcp_ms": 4000, "cls": 0.1, "load_ms": 8000, "transfer_kb": 4000},
+    "form": {"fcp_ms": 3000, "lcp_ms": 5000, "cls": 0.1, "load_ms": 10000, "transfer_kb": 6000},
+    "form_step": {"cls": 0.1, "script_ms": 2000, "transfer_kb": 1500},
+}
+for _kind, _budget in BUDGETS.items():
+    for _metric in _budget:
+        _override = os.getenv(f"PERF_BUDGET_{_kind}_{_metric}".upper())
+        if _override is not None:
+            _budget[_metric] = float(_override)
+
+# Metrics reported as deltas when the page changes step without loading a new document.
+STEP_METRICS = ("cls", "transfer_kb", "resources", "script_ms", "layout_ms")
+
+OBSERVER_SCRIPT = """
+(() => {
+    if (window.__pageMetrics) {
+        return;
+    }
+    const metrics = window.__pageMetrics = { fcp: null, lcp: null, cls: 0 };
+    const observe = (type, callback) => {
+        try {
+            new PerformanceObserver((list) => list.getEntries().forEach(callback)).observe({ type, buffered: true });
+        } catch (e) {
+            // Entry type not supported by this browser.
+        }
+    };
+    observe('paint', (entry) => {
+        if (entry.name === 'first-contentful-paint') {
+            metrics.fcp = entry.startTime;
+        }
+    });
+    observe('largest-contentful-paint', (entry) => { metrics.lcp = entry.startTime; });
+    observe('layout-shift', (entry) => {
+        if (!entry.hadRecentInput) {
+            metrics.cls += entry.value;
+        }
+    });
+})();
+"""
+
+COLLECT_SCRIPT = """
+() => {
+    const observed = window.__pageMetrics || { fcp: null, lcp: null, cls: 0 };
+    const nav = performance.getEntriesByType('navigation')[0];
+    const resources = performance.getEntriesByType('resource');
+    const paint = performance.getEntriesByName('first-contentful-paint')[0];
+    const since = (end) => (nav && end ? end - nav.startTime : null);
+    return {
+        document: performance.timeOrigin,
+        ttfb_ms: nav ? since(nav.responseStart) : null,
+        dom_content_loaded_ms: nav ? since(nav.domContentLoadedEventEnd) : null,
+        load_ms: nav ? since(nav.loadEventEnd) : null,
+        fcp_ms: observed.fcp !== null ? observed.fcp : (paint ? paint.startTime : null),
+        lcp_ms: observed.lcp,
+        cls: observed.cls,
+        transfer_bytes: (nav ? nav.transferSize : 0) + resources.reduce((sum, r) => sum + (r.transferSize || 0), 0),
+        resources: resources.length,
+    };
+}
+"""
+
+_COLLECTORS = {}
+
+
+def _record(entry):
+    os.makedirs(os.path.dirname(METRICS_PATH), exist_ok=True)
+    with open(METRICS_PATH, "a") as f:
+        f.write(json.dumps(entry) + "\n")
+
+
+def over_budget(kind, metrics):
+    """Returns a description of every metric in metrics that exceeds the budget for kind."""
+    budget = BUDGETS.get(kind, {})
+    return [
+        f"{metric} {metrics[metric]:.3f} > {limit}"
+        for metric, limit in budget.items()
+        if metrics.get(metric) is not None and metrics[metric] > limit
+    ]
+
+
+class PageMetrics:
+    """Collects load and paint timings, CLS, transfer sizes and Chromium runtime metrics for one page.
+
+    The first check on a document reports the full load; later checks on the same document
+    (form steps rendered without navigation) report what changed since the previous sample,
+    which transition() takes right before a step change so the test's own work is left out.
+    """
+
+    def __init__(self, page):
+        self.page = page
+        self._cdp = None
+        self._last = None
+        page.add_init_script(OBSERVER_SCRIPT)
+
+    def _runtime_metrics(self):
+        if self._cdp is False:
+            return {}
+        try:
+            if self._cdp is None:
+                self._cdp = self.page.context.new_cdp_session(self.page)
+                self._cdp.send("Performance.enable")
+            values = {m["name"]: m["value"] for m in self._cdp.send("Performance.getMetrics")["metrics"]}
+        except PlaywrightError:
+            # Not Chromium, or the session is gone; page-side metrics are still collected.
+            self._cdp = False
+            return {}
+        return {
+            "script_ms": values.get("ScriptDuration", 0) * 1000,
+            "layout_ms": values.get("LayoutDuration", 0) * 1000,
+            "heap_mb": values.get("JSHeapUsedSize", 0) / 1048576,
+            "nodes": values.get("Nodes", 0),
+        }
+
+    def collect(self):
+        """Returns the current cumulative metrics of the page."""
+        self.page.wait_for_load_state("load")
+        metrics = self.page.evaluate(COLLECT_SCRIPT)
+        metrics["transfer_kb"] = metrics.pop("transfer_bytes") / 1024
+        metrics.update(self._runtime_metrics())
+        return metrics
+
+    def mark(self):
+        """Samples the page now, so the next check on this document reports only what happens after."""
+        self._last = self.collect()
+
+    @contextmanager
+    def transition(self, name, budget=None):
+        """Checks the step change made inside the with block (e.g. save and next, then settle) on its own."""
+        self.mark()
+        yield self
+        self.check(name, budget)
+
+    def check(self, name, budget=None):
+        """Records the metrics for name and fails when any exceeds the budget (default: the budget named name).
+
+        Budgets are not enforced under NETWORK_MODE=replay, where timings reflect the HAR, not the server.
+        """
+        current = self.collect()
+        if self._last is None or self._last["document"] != current["document"]:
+            metrics = {key: value for key, value in current.items() if key != "document"}
+        else:
+            metrics = {key: current[key] - self._last[key] for key in STEP_METRICS if key in current}
+        self._last = current
+
+        _record({
+            "time": time.time(),
+            "test": os.getenv("PYTEST_CURRENT_TEST", "").rsplit(" ", 1)[0],
+            "name": name,
+            "url": self.page.url,
+            "network": NETWORK_MODE,
+            "metrics": metrics,
+        })
+        violations = over_budget(budget or name, metrics)
+        if violations and NETWORK_MODE != "replay":
+            raise AssertionError(f"Performance budget exceeded on '{name}': {', '.join(violations)}")
+        return metrics
+
+
+def page_metrics(page):
+    """Returns the page's metrics collector; create it before the first goto so paint entries are observed."""
+    collector = _COLLECTORS.get(page)
+    if collector is None:
+        collector = _COLLECTORS[page] = PageMetrics(page)
+        page.on("close", lambda _: _COLLECTORS.pop(page, None))
+    return collector
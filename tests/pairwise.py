@@ -0,0 +1,153 @@
+import itertools
+import json
+import os
+from dotenv import load_dotenv
+
+load_dotenv()
+
+FACTORS_PATH = os.getenv(
+    "HOUSEHOLD_FACTORS_PATH", os.path.join(os.path.dirname(__file__), ".datasets", "household_factors.json")
+)
+
+STEP1_TOGGLES = (
+    "parking", "car_sharing", "motorbikes", "bicycles", "wants_stockroom",
+    "wants_workshop", "wants_coworking", "obstacle_free", "wants_homeoffice", "wants_addroom",
+)
+STEP2_TOGGLES = ("pets", "music_instruments", "smoking")
+STEP2_SELECTS = ("household_type", "relocation_reason", "source")
+
+# Options seen in the recorded flows; `python pairwise.py` replaces them with what the live form offers.
+HOUSEHOLD_FACTORS = {
+    **{name: [True, False] for name in STEP1_TOGGLES + STEP2_TOGGLES},
+    "household_type": ["couple household with child"],
+    "relocation_reason": ["Change of life situation"],
+    "deposit": ["Security deposit"],
+    "source": ["Real estate platform (Newhome", "Instagram"],
+}
+
+TOGGLES_SCRIPT = """
+() => Array.from(new Set(
+    Array.from(document.querySelectorAll('[id$="-true"]'))
+        .filter((el) => document.getElementById(el.id.replace(/-true$/, '-false')))
+        .map((el) => el.id.replace(/-true$/, ''))
+))
+"""
+
+OPEN_OPTIONS_SCRIPT = """
+() => Array.from(document.querySelectorAll('.select-dropdown-items-wrapper li.dropdown-item'))
+    .filter((el) => el.getClientRects().length > 0)
+    .map((el) => el.textContent.trim())
+"""
+
+DEPOSIT_SCRIPT = """
+() => {
+    const item = Array.from(document.querySelectorAll('ul.radio-list li'))
+        .find((li) => li.textContent.trim() === 'Security deposit');
+    return item ? Array.from(item.parentElement.querySelectorAll('li')).map((li) => li.textContent.trim()) : [];
+}
+"""
+
+
+def pairwise(factors):
+    """Returns configurations (dicts) that together cover every pair of values of every two factors.
+
+    Greedy and deterministic: each new configuration starts from the first uncovered pair and then
+    gives every other factor the value that covers the most still-uncovered pairs.
+    """
+    names = list(factors)
+    if len(names) < 2:
+        return [{names[0]: value} for value in factors[names[0]]] if names else []
+    uncovered = {
+        (a, va, b, vb)
+        for a, b in itertools.combinations(names, 2)
+        for va in factors[a]
+        for vb in factors[b]
+    }
+
+    def key(a, va, b, vb):
+        return (a, va, b, vb) if names.index(a) < names.index(b) else (b, vb, a, va)
+
+    configs = []
+    while uncovered:
+        first = min(uncovered, key=lambda p: (names.index(p[0]), names.index(p[2]), repr(p)))
+        config = {first[0]: first[1], first[2]: first[3]}
+        for name in names:
+            if name in config:
+                continue
+            best = max(
+                factors[name],
+                key=lambda value: (
+                    sum(key(other, config[other], name, value) in uncovered for other in config),
+                    sum(key(name, value, other, v) in uncovered for other in names if other not in config
+                        for v in factors[other] if other != name),
+                    -factors[name].index(value),
+                ),
+            )
+            config[name] = best
+        for a, b in itertools.combinations(names, 2):
+            uncovered.discard((a, config[a], b, config[b]))
+        configs.append({name: config[name] for name in names})
+    return configs
+
+
+def config_id(config):
+    """Short readable test id: the toggles switched on plus the chosen select values."""
+    on = [name for name, value in config.items() if value is True]
+    picked = [str(value)[:18] for value in config.values() if not isinstance(value, bool)]
+    return "+".join(on or ["none"]) + "|" + "|".join(picked)
+
+
+def load_factors(path=FACTORS_PATH):
+    """Factors read from the live form by read_factors, or the recorded defaults when none were saved."""
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return HOUSEHOLD_FACTORS
+
+
+def _open_options(page, selector):
+    page.locator(selector).click()
+    page.wait_for_selector(".select-dropdown-items-wrapper li.dropdown-item", timeout=5000)
+    options = page.evaluate(OPEN_OPTIONS_SCRIPT)
+    page.keyboard.press("Escape")
+    page.locator("body").click(position={"x": 1, "y": 1})
+    return options
+
+
+def read_factors(page):
+    """Reads the option sets of the step-1 and step-2 household fields; the page must be on step 1."""
+    factors = {name: [True, False] for name in page.evaluate(TOGGLES_SCRIPT)}
+    page.get_by_text("Save and next").click()
+    page.wait_for_selector("#field-household_type", timeout=15000)
+    factors.update({name: [True, False] for name in page.evaluate(TOGGLES_SCRIPT)})
+    for name in STEP2_SELECTS:
+        factors[name] = _open_options(page, f"#field-{name}")
+    factors["deposit"] = page.evaluate(DEPOSIT_SCRIPT) or HOUSEHOLD_FACTORS["deposit"]
+    # Follow-up toggles such as income_rent_ratio are not household choices.
+    return {name: values for name, values in factors.items() if name in HOUSEHOLD_FACTORS}
+
+
+if __name__ == "__main__":
+    from playwright.sync_api import sync_playwright
+
+    with sync_playwright() as playwright:
+        browser = playwright.chromium.launch()
+        page = browser.new_page()
+        page.goto(os.getenv("BASE_URL"))
+        page.get_by_role("row", name="01.01.01 Kanzlei A CHF 2'900").locator("span").nth(1).click()
+        with page.expect_popup() as popup_info:
+            page.get_by_text("Apply").click()
+        form = popup_info.value
+        form.get_by_text("Start").click()
+        factors = read_factors(form)
+        browser.close()
+
+    os.makedirs(os.path.dirname(FACTORS_PATH), exist_ok=True)
+    with open(FACTORS_PATH, "w") as f:
+        json.dump(factors, f, indent=2, ensure_ascii=False)
+    full = 1
+    for values in factors.values():
+        full *= len(values)
+    print(f" Wrote {len(factors)} factors to {FACTORS_PATH}: {len(pairwise(factors))} pairwise configurations"
+          f" instead of {full} combinations")
@@ -0,0 +1,221 @@
+import argparse
+import ast
+import json
+import re
+
+# Rough cost per action when no trace is given; a trace from tracer.py replaces these with measured averages.
+ACTION_COST_MS = {"click": 250, "dblclick": 300, "fill": 200, "check": 250, "press": 150, "set_numbers": 250}
+SET_NUMBERS_IMPORT = "from incrementers import set_numbers\n"
+
+TOGGLE = re.compile(r"^#(?P<family>[\w-]+)-(true|false)$")
+STEPPER = re.compile(r"^#(?P<kind>increment|decrement)-field-(?P<field>[\w-]+)(\s.*)?$")
+
+
+class Action:
+    """One `<receiver>.<...>.verb(args)` statement of a recorded script."""
+
+    def __init__(self, node, receiver, target, selector, verb, value):
+        self.node = node
+        self.receiver = receiver
+        self.target = target
+        self.selector = selector
+        self.verb = verb
+        self.value = value
+        self.replacement = None
+
+    @property
+    def lines(self):
+        return self.node.lineno, self.node.end_lineno
+
+
+def _parse_action(node):
+    if not (isinstance(node, ast.Expr) and isinstance(node.value, ast.Call)) or not isinstance(node.value.func, ast.Attribute):
+        # Any other statement is kept as a barrier no rule may look across.
+        return Action(node, "", f"<line {node.lineno}>", None, None, None)
+    call = node.value
+    verb = call.func.attr
+    locator = call.func.value
+    value = None
+    if call.args and isinstance(call.args[0], ast.Constant):
+        value = call.args[0].value
+
+    selector = None
+    receiver = locator
+    while True:
+        if isinstance(receiver, ast.Call) and isinstance(receiver.func, ast.Attribute):
+            if receiver.func.attr == "locator" and receiver.args and isinstance(receiver.args[0], ast.Constant):
+                selector = receiver.args[0].value
+            receiver = receiver.func.value
+        elif isinstance(receiver, ast.Attribute):
+            receiver = receiver.value
+        else:
+            # A page, or a helper call such as radio_option(page, ...) that returns a locator.
+            break
+    return Action(node, ast.unparse(receiver), ast.unparse(locator), selector, verb, value)
+
+
+def _actions(tree):
+    """Yields the statements of every function body in the script as actions."""
+    for fn in ast.walk(tree):
+        if isinstance(fn, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            yield [_parse_action(node) for node in fn.body]
+
+
+def _family(action):
+    match = TOGGLE.match(action.selector or "") if action.verb == "click" else None
+    return match and match["family"]
+
+
+def _stepper(action):
+    match = STEPPER.match(action.selector or "") if action.verb in ("click", "dblclick") else None
+    return match and (match["kind"], match["field"])
+
+
+def optimize(actions):
+    """Returns (kept actions, [(rule, removed action)]) for one function's action sequence."""
+    removed = []
+    actions = list(actions)
+
+    # Repeated increment/decrement clicks become one relative set_numbers call. The field's value
+    # is only known at run time, and the buttons stop at its min and max; set_numbers steps from the
+    # current value and clamps the same way.
+    result, i = [], 0
+    while i < len(actions):
+        step = _stepper(actions[i])
+        if not step:
+            result.append(actions[i])
+            i += 1
+            continue
+        field = step[1]
+        run = []
+        while i < len(actions) and _stepper(actions[i]) and _stepper(actions[i])[1] == field:
+            run.append(actions[i])
+            i += 1
+        if len(run) == 1 and run[0].verb == "click":
+            result.append(run[0])
+            continue
+        delta = sum((2 if a.verb == "dblclick" else 1) * (1 if _stepper(a)[0] == "increment" else -1) for a in run)
+        keep = run[0]
+        keep.replacement = f'set_numbers({keep.receiver}, {{"#field-{field}": {{"by": {delta}}}}})'
+        keep.verb, keep.selector, keep.value = "set_numbers", f"#field-{field}", delta
+        keep.target = keep.replacement
+        result.append(keep)
+        removed.extend(("increments", a) for a in run[1:])
+    actions = result
+
+    changed = True
+    while changed:
+        changed = False
+        for i, action in enumerate(actions):
+            following = actions[i + 1] if i + 1 < len(actions) else None
+            rule = None
+            if following is not None and following.target == action.target:
+                if action.verb == "click" and following.verb == "fill":
+                    rule = "click before fill"
+                elif action.verb == "click" and following.verb == "click" and (action.selector or "").startswith("#field-"):
+                    rule = "repeated click"
+                elif (action.verb == "fill" and action.value == "" and following.verb == "click"
+                      and not any(a.target == action.target and a.verb == "fill" for a in actions[:i])):
+                    # Clearing a field nothing has filled yet, only to click it again, does nothing.
+                    rule = "empty fill before click"
+                elif action.verb == "fill" and following.verb == "fill":
+                    rule = "overwritten fill"
+            family = _family(action)
+            if rule is None and family:
+                # A later click on the same yes/no toggle, with only other toggles in between, wins.
+                for later in actions[i + 1:]:
+                    if not _family(later):
+                        break
+                    if _family(later) == family:
+                        rule = "toggle overridden"
+                        break
+            if rule:
+                removed.append((rule, action))
+                del actions[i]
+                changed = True
+                break
+    return actions, removed
+
+
+def load_costs(trace_path):
+    """Average ms per Playwright method from a tracer.py JSON trace, e.g. {'click': 312.5}."""
+    with open(trace_path) as f:
+        rollup = json.load(f)["rollup"]
+    costs = dict(ACTION_COST_MS)
+    for name, entry in rollup.items():
+        if name.startswith("Locator.") and entry["calls"]:
+            costs[name.split(".", 1)[1]] = entry["seconds"] / entry["calls"] * 1000
+    return costs
+
+
+def optimize_script(source, costs=ACTION_COST_MS):
+    """Returns the optimized script source and a report of what was removed and the time saved."""
+    tree = ast.parse(source)
+    lines = source.splitlines(keepends=True)
+    report = []
+    drop = set()
+    replace = {}
+    before = after = 0
+    saved = 0.0
+    for actions in _actions(tree):
+        original_cost = sum(costs.get(a.verb, costs["click"]) for a in actions if a.verb)
+        kept, removed = optimize(actions)
+        before += sum(1 for a in actions if a.verb)
+        after += sum(1 for a in kept if a.verb)
+        saved += original_cost - sum(costs.get(a.verb, costs["click"]) for a in kept if a.verb)
+        for action in kept:
+            if action.replacement:
+                replace[action.lines] = action.replacement
+        for rule, action in removed:
+            drop.add(action.lines)
+            report.append((action.lines[0], rule, ast.unparse(action.node).strip()))
+
+    # The collapsed increments call set_numbers; it is imported after the script's last top-level import.
+    import_after = None
+    if replace and not re.search(r"^from incrementers import .*\bset_numbers\b", source, re.M):
+        import_after = max((node.end_lineno for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom))),
+                           default=0)
+    out = [SET_NUMBERS_IMPORT] if import_after == 0 else []
+    skip_until = 0
+    for number, line in enumerate(lines, start=1):
+        if number - 1 == import_after and number > 1:
+            out.append(SET_NUMBERS_IMPORT)
+        if number <= skip_until:
+            continue
+        span = next(((start, end) for start, end in drop | set(replace) if start == number), None)
+        if span is None:
+            out.append(line)
+            continue
+        skip_until = span[1]
+        if span in replace:
+            indent = line[:len(line) - len(line.lstrip())]
+            out.append(f"{indent}{replace[span]}\n")
+    return "".join(out), {
+        "actions_before": before,
+        "actions_after": after,
+        "saved_ms": saved,
+        "removed": sorted(report),
+    }
+
+
+def print_report(report):
+    for line, rule, code in report["removed"]:
+        print(f" line {line:>4}  {rule:<24} {code}")
+    print(f" {report['actions_before']} actions -> {report['actions_after']},"
+          f" ~{report['saved_ms'] / 1000:.1f}s saved per run")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Remove redundant actions from a recorded Playwright script.")
+    parser.add_argument("script")
+    parser.add_argument("--write", help="write the optimized script here (default: print the report only)")
+    parser.add_argument("--trace", help="tracer.py JSON trace to take per-action costs from")
+    args = parser.parse_args()
+
+    with open(args.script, encoding="utf-8") as f:
+        optimized, report = optimize_script(f.read(), load_costs(args.trace) if args.trace else ACTION_COST_MS)
+    print_report(report)
+    if args.write:
+        with open(args.write, "w", encoding="utf-8") as f:
+            f.write(optimized)
+        print(f" Wrote {args.write}")
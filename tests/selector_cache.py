@@ -0,0 +1,169 @@
+import json
+import os
+import time
+from dotenv import load_dotenv
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+load_dotenv()
+
+SELECTOR_STATS_PATH = os.getenv(
+    "SELECTOR_STATS_PATH", os.path.join(os.path.dirname(__file__), ".selectors", "stats.json")
+)
+CANDIDATE_TIMEOUT_MS = int(os.getenv("CANDIDATE_TIMEOUT_MS", 1500))
+SELECTOR_TIMEOUT_MS = int(os.getenv("SELECTOR_TIMEOUT_MS", 15000))
+
+
+def by_css(selector, nth=0):
+    return ("css", selector, nth)
+
+
+def by_id(element_id):
+    return ("id", element_id, 0)
+
+
+def by_role(role, name=None, nth=0):
+    return ("role", role, name, nth)
+
+
+def by_label(label, widget, target="input", nth=0):
+    """The target element inside the widget container whose span or label contains label."""
+    return ("label", label, widget, target, nth)
+
+
+def _build(page, candidate):
+    kind = candidate[0]
+    if kind == "css":
+        return page.locator(candidate[1]).nth(candidate[2])
+    if kind == "id":
+        return page.locator(f"[id='{candidate[1]}']").first
+    if kind == "role":
+        _, role, name, nth = candidate
+        return page.get_by_role(role, name=name, exact=True).nth(nth)
+    if kind == "label":
+        _, label, widget, target, nth = candidate
+        return page.locator(
+            f"xpath=//*[self::span or self::label][contains(normalize-space(.), '{label}')]"
+            f"/ancestor::*[contains(@class, '{widget}')][1]//{target}"
+        ).nth(nth)
+    raise Exception(f"Unknown locator candidate: {candidate}")
+
+
+def _key(candidate):
+    return json.dumps(candidate, ensure_ascii=False)
+
+
+class SelectorCache:
+    """Per-field stats of which locator candidate resolved, and how fast, persisted between runs.
+
+    Stats are sums (hits, misses, milliseconds) so each run adds its own to what earlier runs saved.
+    """
+
+    def __init__(self, path=SELECTOR_STATS_PATH):
+        self.path = path
+        self.stats = None
+        self.pending = {}
+        self.fallbacks = 0
+        self.resolved = 0
+
+    def _load(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _entry(self, field, key):
+        if self.stats is None:
+            self.stats = self._load()
+        totals = self.stats.get(field, {}).get(key, {"hits": 0, "misses": 0, "ms": 0.0})
+        delta = self.pending.get(field, {}).get(key, {"hits": 0, "misses": 0, "ms": 0.0})
+        return {name: totals[name] + delta[name] for name in totals}
+
+    def rank(self, field, candidates):
+        """Candidates ordered by smoothed success rate, then mean resolve time; ties keep the given order."""
+        def score(item):
+            index, candidate = item
+            entry = self._entry(field, _key(candidate))
+            rate = (entry["hits"] + 1) / (entry["hits"] + entry["misses"] + 2)
+            mean = entry["ms"] / entry["hits"] if entry["hits"] else CANDIDATE_TIMEOUT_MS
+            return (-rate, mean, index)
+        return [candidate for _, candidate in sorted(enumerate(candidates), key=score)]
+
+    def record(self, field, candidate, ok, ms=0.0):
+        entry = self.pending.setdefault(field, {}).setdefault(_key(candidate), {"hits": 0, "misses": 0, "ms": 0.0})
+        if ok:
+            entry["hits"] += 1
+            entry["ms"] += ms
+        else:
+            entry["misses"] += 1
+
+    def save(self):
+        """Adds this run's stats to the file on disk."""
+        if not self.pending:
+            return
+        merged = self._load()
+        for field, entries in self.pending.items():
+            for key, delta in entries.items():
+                entry = merged.setdefault(field, {}).setdefault(key, {"hits": 0, "misses": 0, "ms": 0.0})
+                for name in entry:
+                    entry[name] += delta[name]
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(merged, f, indent=1, ensure_ascii=False)
+        os.replace(tmp, self.path)
+        self.stats, self.pending = merged, {}
+
+    def locate(self, page, field, candidates, timeout=CANDIDATE_TIMEOUT_MS):
+        """Returns a locator for the logical field from the first candidate that shows up.
+
+        The historically best candidate is tried first; each one gets only timeout ms, so a
+        stale selector costs a short fallback instead of the full action timeout. If none
+        appears in time, the best one is waited on for SELECTOR_TIMEOUT_MS before giving up.
+        """
+        return _build(page, self.resolve(page, field, candidates, timeout))
+
+    def resolve(self, page, field, candidates, timeout=CANDIDATE_TIMEOUT_MS):
+        """Like locate, but returns the candidate that showed up."""
+        ranked = self.rank(field, candidates)
+        for position, candidate in enumerate(ranked):
+            locator = _build(page, candidate)
+            start = time.perf_counter()
+            try:
+                locator.wait_for(state="visible", timeout=timeout)
+            except PlaywrightTimeoutError:
+                self.record(field, candidate, False)
+                continue
+            self.record(field, candidate, True, (time.perf_counter() - start) * 1000)
+            self.resolved += 1
+            if position:
+                self.fallbacks += 1
+                print(f" '{field}' resolved by fallback {candidate[0]} candidate after {position} miss(es).")
+            return candidate
+
+        locator = _build(page, ranked[0])
+        start = time.perf_counter()
+        try:
+            locator.wait_for(state="visible", timeout=SELECTOR_TIMEOUT_MS)
+        except PlaywrightTimeoutError:
+            raise Exception(f"No locator candidate for '{field}' matched: {ranked}")
+        self.record(field, ranked[0], True, (time.perf_counter() - start) * 1000)
+        self.resolved += 1
+        return ranked[0]
+
+
+SELECTORS = SelectorCache()
+
+
+def locate(page, field, candidates, timeout=CANDIDATE_TIMEOUT_MS):
+    return SELECTORS.locate(page, field, candidates, timeout)
+
+
+def tagged_selector(page, field, candidates, timeout=CANDIDATE_TIMEOUT_MS):
+    """Locates the field like locate, tags the element with data-located and returns a CSS selector for it.
+
+    For in-page scripts that take selectors: any candidate kind can resolve the field, and the
+    selector keeps pointing at that element after other fields shift.
+    """
+    SELECTORS.locate(page, field, candidates, timeout).evaluate("(el, field) => el.setAttribute('data-located', field)", field)
+    return f"[data-located='{field}']"
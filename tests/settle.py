@@ -0,0 +1,181 @@
+import os
+import time
+import weakref
+from dotenv import load_dotenv
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+load_dotenv()
+
+API_HOST = os.getenv("SETTLE_API_HOST", "melon.market")
+QUIET_MS = int(os.getenv("SETTLE_QUIET_MS", 150))
+SETTLE_TIMEOUT_MS = int(os.getenv("SETTLE_TIMEOUT_MS", 15000))
+
+SETTLE_TIMINGS = []
+# Contexts that already carry the tracker init script; pooled contexts are reused across tests.
+_TRACKED_CONTEXTS = weakref.WeakSet()
+
+TRACKER_SCRIPT = """
+(apiHost) => {
+    if (window.__settle) {
+        return;
+    }
+    const state = { inflight: 0, lastMutation: performance.now() };
+    window.__settle = state;
+
+    const tracked = (url) => String(url || "").includes(apiHost);
+
+    const originalFetch = window.fetch;
+    if (originalFetch) {
+        window.fetch = function (input, init) {
+            const url = typeof input === "string" ? input : (input && input.url);
+            if (!tracked(url)) {
+                return originalFetch.apply(this, arguments);
+            }
+            state.inflight += 1;
+            return originalFetch.apply(this, arguments).finally(() => {
+                state.inflight -= 1;
+            });
+        };
+    }
+
+    const originalOpen = XMLHttpRequest.prototype.open;
+    const originalSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.open = function (method, url) {
+        this.__settleTracked = tracked(url);
+        return originalOpen.apply(this, arguments);
+    };
+    XMLHttpRequest.prototype.send = function () {
+        if (this.__settleTracked) {
+            state.inflight += 1;
+            this.addEventListener("loadend", () => { state.inflight -= 1; }, { once: true });
+        }
+        return originalSend.apply(this, arguments);
+    };
+
+    const observe = () => {
+        new MutationObserver(() => { state.lastMutation = performance.now(); })
+            .observe(document.documentElement, {
+                subtree: true, childList: true, attributes: true, characterData: true,
+            });
+    };
+    if (document.documentElement) {
+        observe();
+    } else {
+        document.addEventListener("DOMContentLoaded", observe, { once: true });
+    }
+}
+"""
+
+QUIET_CONDITION = """
+(quietMs) => {
+    const state = window.__settle;
+    if (!state) {
+        return true;
+    }
+    return state.inflight <= 0 && performance.now() - state.lastMutation >= quietMs;
+}
+"""
+
+DROPDOWN_CLOSED_CONDITION = """
+() => !Array.from(document.querySelectorAll('.select-dropdown-items-wrapper'))
+    .some((el) => el.offsetParent !== null)
+"""
+
+STEP_CHANGED_CONDITION = """
+(previous) => {
+    // A final submit replaces the form, step bar included, with the confirmation page.
+    const active = document.querySelector('.af-steps .af-position.active');
+    return !active || active.textContent.trim() !== previous;
+}
+"""
+
+
+def install_settle_tracker(page):
+    """Installs the network/DOM tracker on the page and on every page the context opens later.
+
+    The init script is added once per context; later calls only install it on the given page.
+    """
+    if page.context not in _TRACKED_CONTEXTS:
+        page.context.add_init_script(f"({TRACKER_SCRIPT})({API_HOST!r})")
+        _TRACKED_CONTEXTS.add(page.context)
+    page.evaluate(TRACKER_SCRIPT, API_HOST)
+
+
+def active_step(page):
+    """Returns the label of the active .af-steps position, or None outside the form."""
+    return page.evaluate(
+        "() => { const el = document.querySelector('.af-steps .af-position.active');"
+        " return el ? el.textContent.trim() : null; }"
+    )
+
+
+def _settle(page, kind, conditions):
+    """Waits for every (expression, arg) condition in order and records the elapsed time.
+
+    Raises when the conditions are not all met within SETTLE_TIMEOUT_MS, so a page that never
+    settles fails the step instead of letting the next action run against a half-rendered form.
+    """
+    start = time.perf_counter()
+    timeout = SETTLE_TIMEOUT_MS
+    for expression, arg in conditions:
+        try:
+            page.wait_for_function(expression, arg=arg, timeout=max(timeout, 1))
+        except PlaywrightTimeoutError:
+            SETTLE_TIMINGS.append((kind, time.perf_counter() - start))
+            raise Exception(f"Settle '{kind}' timed out after {SETTLE_TIMEOUT_MS} ms.")
+        timeout = SETTLE_TIMEOUT_MS - int((time.perf_counter() - start) * 1000)
+    elapsed = time.perf_counter() - start
+    SETTLE_TIMINGS.append((kind, elapsed))
+    return elapsed
+
+
+def settle_after_load(page):
+    """Waits for the initial page load to stop fetching and rendering."""
+    page.wait_for_load_state("domcontentloaded")
+    return _settle(page, "load", [(QUIET_CONDITION, QUIET_MS)])
+
+
+def settle_after_click(page):
+    """Waits for a click (radio, checkbox, button) to finish its API calls and re-render."""
+    return _settle(page, "click", [(QUIET_CONDITION, QUIET_MS)])
+
+
+def settle_after_fill(page):
+    """Waits for an input to finish validation and autosave after a fill."""
+    return _settle(page, "fill", [(QUIET_CONDITION, QUIET_MS)])
+
+
+def settle_after_select(page):
+    """Waits for an mdt-select dropdown to close and the form to re-render."""
+    return _settle(page, "select", [(DROPDOWN_CLOSED_CONDITION, None), (QUIET_CONDITION, QUIET_MS)])
+
+
+def settle_after_dropdown_open(page):
+    """Waits for an mdt-select dropdown to render its options."""
+    return _settle(page, "open", [(QUIET_CONDITION, QUIET_MS)])
+
+
+def settle_after_upload(page):
+    """Waits for a file upload request to complete."""
+    return _settle(page, "upload", [(QUIET_CONDITION, QUIET_MS)])
+
+
+def settle_after_step(page, previous_step=None):
+    """Waits for 'Save and next' to move the .af-steps position and the new step to render.
+
+    When previous_step is None only the network and DOM quiet window are awaited,
+    which covers saves that stay on the same step.
+    """
+    conditions = [(QUIET_CONDITION, QUIET_MS)]
+    if previous_step is not None:
+        conditions.insert(0, (STEP_CHANGED_CONDITION, previous_step))
+    return _settle(page, "step", conditions)
+
+
+def settle_summary():
+    """Returns {kind: (count, total seconds, max seconds)} for every settle so far."""
+    summary = {}
+    for kind, elapsed in SETTLE_TIMINGS:
+        count, total, longest = summary.get(kind, (0, 0.0, 0.0))
+        summary[kind] = (count + 1, total + elapsed, max(longest, elapsed))
+    return summary
@@ -1,26 +1,18 @@
 import pytest
-from playwright.sync_api import sync_playwright
 
-@pytest.fixture(scope="session")
-def browser():
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=False)
-        yield browser
-        browser.close()
+@pytest.fixture
+def page(read_only_page):
+    return read_only_page
 
-def test_page_load(browser):
+def test_page_load(page):
     """Testira da li se stranica pravilno učitava"""
-    page = browser.new_page()
     page.goto("https://mostar.demo.melon.market/form/application/new?uuids=e34bfbd2-218e-4f36-9e92-e2ae9367fcfc,db50b164-beec-4379-a025-6f5d57aab822,c4e795a5-05dd-4e5f-b073-518321751d6b&lang=en")
 
     assert "melon" in page.title()  
     page.wait_for_selector("body")  
 
-    page.close()
-
-def test_click_start_application(browser):
+def test_click_start_application(page):
     """Klik na dugme 'Start' i provjera da li se stranica mijenja"""
-    page = browser.new_page()
     page.goto("https://mostar.demo.melon.market/form/application/new?uuids=e34bfbd2-218e-4f36-9e92-e2ae9367fcfc,db50b164-beec-4379-a025-6f5d57aab822,c4e795a5-05dd-4e5f-b073-518321751d6b&lang=en")
 
     page.wait_for_selector("#start-application-btn")
@@ -29,11 +21,8 @@ def test_click_start_application(browser):
     page.wait_for_timeout(3000)  
     assert "application" in page.url  
 
-    page.close()
-
-def test_check_links_and_images(browser):
+def test_check_links_and_images(page):
     """Provjera da li postoje slike, linkovi i da su ispravni"""
-    page = browser.new_page()
     page.goto("https://mostar.demo.melon.market/form/application/new?uuids=e34bfbd2-218e-4f36-9e92-e2ae9367fcfc,db50b164-beec-4379-a025-6f5d57aab822,c4e795a5-05dd-4e5f-b073-518321751d6b&lang=en")
 
     page.wait_for_selector("img.logo", timeout=10000)
@@ -50,16 +39,11 @@ def test_check_links_and_images(browser):
     assert email_link.count() > 0, "Email link ne postoji!"
     assert email_link.first.is_visible(), "Email link nije vidljiv!"
 
-    page.close()
-
-def test_privacy_policy_visibility(browser):
+def test_privacy_policy_visibility(page):
     """Provjera da li postoji link za politiku privatnosti"""
-    page = browser.new_page()
     page.goto("https://mostar.demo.melon.market/form/application/new?uuids=e34bfbd2-218e-4f36-9e92-e2ae9367fcfc,db50b164-beec-4379-a025-6f5d57aab822,c4e795a5-05dd-4e5f-b073-518321751d6b&lang=en")
 
     page.wait_for_selector("div.privacy-policy", timeout=10000)
     privacy_policy = page.locator("div.privacy-policy")
     privacy_policy.scroll_into_view_if_needed()  
     assert privacy_policy.is_visible(), "Sekcija politike privatnosti nije vidljiva!"
-
-    page.close()
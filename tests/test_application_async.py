@@ -0,0 +1,21 @@
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from dotenv import load_dotenv
+from async_runner import APPLICANTS, CONCURRENCY, print_summary, run_applicants
+
+load_dotenv()
+# Every run submits APPLICANTS real applications to the demo server, so it is opt-in like load_runner.
+CONCURRENT_TEST = os.getenv("CONCURRENT_TEST", "0") == "1"
+
+
+@pytest.mark.skipif(not CONCURRENT_TEST, reason="submits real applications; set CONCURRENT_TEST=1 to run")
+def test_concurrent_applicants():
+    """Submits APPLICANTS applications with at most CONCURRENCY flows in flight."""
+    # The sync Playwright driver behind the shared pool owns this thread's event loop.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        summary = executor.submit(asyncio.run, run_applicants(APPLICANTS, CONCURRENCY)).result()
+
+    print_summary(summary)
+    assert summary["failed"] == 0, f"{summary['failed']} of {summary['applicants']} applications failed!"
@@ -1,268 +1,127 @@
 import pytest
-import time
-from playwright.sync_api import sync_playwright
+from bulk_fill import bulk_fill
+from checkpoints import CheckpointCache, flow_fingerprint
+from datepicker import set_date
+from dropdown import select_option
+from element_query import set_radios
+from field_index import field_index
+from incrementers import set_numbers
+from page_metrics import page_metrics
+from settle import (
+    active_step,
+    install_settle_tracker,
+    settle_after_click,
+    settle_after_dropdown_open,
+    settle_after_fill,
+    settle_after_load,
+    settle_after_select,
+    settle_after_step,
+)
+from form_steps import (
+    add_adult,
+    click_yes_buttons,
+    fill_household_section,
+    fill_input_field,
+    fill_number_inputs,
+    fill_step1,
+    fill_text_fields,
+    fill_textarea_field,
+    navigate_to_step2,
+    save_and_next,
+    select_dropdown_option,
+    select_radio_option,
+    upload_and_reupload_file,
+)
+from tracer import trace_helpers
+from uploads import upload_payload
 
 @pytest.fixture(scope="session")
-def browser():
-    """Launch Playwright browser once for all tests."""
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=False, slow_mo=200)
-        yield browser
-        browser.close()
+def upload_file():
+    """The PNG uploaded on Steps 1 and 2, generated on first use rather than at collection."""
+    return upload_payload("png")
 
 @pytest.fixture
-def page(browser):
-    """Create a new browser page for each test."""
-    page = browser.new_page()
+def page(context):
+    """Create a new page in a pooled context for each test."""
+    page = context.new_page()
     url = ("https://mostar.demo.melon.market/form/application/new/"
            "bae01d6af78e4420848436fe9d942729/6tb-21c9987501816e557bd8/"
            "67c10f4b-9986-4f94-a90e-4cc6c5e83f6d")
+    install_settle_tracker(page)
+    page_metrics(page)
     page.goto(url)
     page.wait_for_selector("body", timeout=20000)
-    page.wait_for_timeout(3000)  
+    settle_after_load(page)
     yield page
     page.close()
 
-def test_fill_form(page):
-    """Fills Step 1 (Object), navigates to Step 2 (Household), and starts Step 3."""
-
-    click_yes_buttons(page)
-
-    fill_number_inputs(page)
-
-    file_path = "C:/Users/Pc/Pictures/Screenshots/Screenshot 2024-07-04 124108.png"
-    upload_and_reupload_file(page, file_path)
-
-    fill_text_fields(page)
-
-    navigate_to_step2(page)
+@pytest.fixture
+def step3_page(browser_pool, upload_file, request):
+    """Resumes at Step 3 from the checkpoint cache, replaying only the steps that are not cached."""
+    checkpoints = form_checkpoints()
+
+    resumed = checkpoints.restore(browser_pool, "step3")
+    if resumed is not None:
+        yield resumed
+        browser_pool.release(resumed.context)
+        return
+
+    resumed = checkpoints.restore(browser_pool, "step2")
+    if resumed is not None:
+        form_page = resumed
+    else:
+        form_page = request.getfixturevalue("page")
+        fill_step1(form_page, upload_file)
+        navigate_to_step2(form_page)
+        checkpoints.save(form_page, "step2")
 
-    fill_household_section(page, file_path)
+    fill_household_section(form_page, upload_file)
+    save_and_next(form_page)
+    checkpoints.save(form_page, "step3")
 
-    save_and_next(page)
+    yield form_page
+    if resumed is not None:
+        browser_pool.release(resumed.context)
 
-    add_adult(page)
+def test_fill_form(page, upload_file):
+    """Fills Step 1 (Object), navigates to Step 2 (Household), and starts Step 3."""
+    checkpoints = form_checkpoints()
+    metrics = page_metrics(page)
+    metrics.check("form")
 
-    fill_step3_personal_info(page)
+    fill_step1(page, upload_file)
 
+    with metrics.transition("form_step2", budget="form_step"):
+        navigate_to_step2(page)
+    checkpoints.save(page, "step2")
 
-def test_fill_step3(page):
-    """Navigates to Step 3 and fills in personal information."""
+    fill_household_section(page, upload_file)
 
-    
-    url_step3 = ("https://mostar.demo.melon.market/form/application/new/34e0aa24a451410791c134c118783056/6tb-2288c281637e9d1fdfdb/8b4d20d5-93f4-44f8-bec8-a2056c2f2559")  
-    page.goto(url_step3)
-    
-    page.wait_for_selector("body", timeout=20000)
-    page.wait_for_timeout(3000)  
+    with metrics.transition("form_step3", budget="form_step"):
+        save_and_next(page)
+    checkpoints.save(page, "step3")
 
     add_adult(page)
 
     fill_step3_personal_info(page)
 
 
+def test_fill_step3(step3_page):
+    """Starts directly at Step 3 and fills in personal information."""
 
-def click_yes_buttons(page):
-    """Clicks all 'Yes' buttons if not already selected."""
-    yes_buttons = page.locator("ul.radio-list li[title='Yes']")
-    assert yes_buttons.count() > 0, "No 'Yes' buttons found!"
-    for i in range(yes_buttons.count()):
-        yes_button = yes_buttons.nth(i)
-        if "selected" not in (yes_button.get_attribute("class") or ""):
-            yes_button.click()
-            time.sleep(0.5)
-
-def navigate_to_step2(page):
-    """Clicks 'Save and Next' and waits for Step 2 (Household) to load."""
-    save_and_next(page)
-
-    page.wait_for_selector(".af-steps .af-position.active", timeout=15000)
-    active_step = page.locator(".af-steps .af-position.active").text_content().strip()
-    assert active_step == "2", f"⚠ Not in Step 2! Expected '2', got '{active_step}'"
-    
-
-def fill_household_section(page, file_path):
-    """Fills in the Household section after navigating to Step 2."""
-    page.wait_for_selector(".sections-container", timeout=10000)
-
-    click_yes_buttons(page)
-
-    select_dropdown_option(page, "Household type", "couple household")
-
-    fill_input_field(page, "Type of pet / dog breed", "Golden Retriever")
-
-    upload_and_reupload_file(page, file_path)
-
-    select_radio_option(page, "Music instruments", "Yes")
-    fill_input_field(page, "Type of music instrument", "Piano")
-
-    select_radio_option(page, "Smoker", "No")
-
-    select_dropdown_option(page, "Reason for moving", "Change in space requirements")
-    fill_input_field(page, "Desired reference date", "01-09-2024")
-    fill_input_field(page, "Wanted doorbell/mailbox label", "John Doe")
-
-    select_radio_option(page, "Security deposit (3 grossly month rent)", "Insurance solution")  
-
-    provider_dropdown = page.locator("//span[contains(text(), 'Provider')]")
-    if provider_dropdown.count() > 0:
-        page.wait_for_selector("//span[contains(text(), 'Provider')]", timeout=5000)
-        select_dropdown_option(page, "Provider", "SwissCaution")
-
-    select_radio_option(page, "Monthly household income > 3 monthly rents", "Yes")
-    fill_input_field(page, "IBAN number", "CH9300762011623852957")
-    fill_input_field(page, "Bank name and location", "Swiss Bank, Zurich")
-    fill_input_field(page, "Account owner", "John Doe")
-
-    fill_input_field(page, "Motivation", "Looking for a community-oriented environment.")
-
-    fill_textarea_field(page, "Participation ideas", "Volunteering in community events")
-    fill_textarea_field(page, "Remarks", "Looking forward to being part of the community.")
-
-    select_dropdown_option(page, "Object found on", "Search engine")
-
-    select_dropdown_option(page, "Relation to the cooperative", "Current tenant")
-
-    select_dropdown_option(page, "Type of relation", "Already living in the neighborhood")
-
-   
-    save_and_next(page)
-
-
-
-def fill_textarea_field(page, field_label, value):
-    """Fills a textarea field based on the label."""
-    
-    
-    textarea = page.locator(f"//div[contains(@class, 'mdt-textarea')]//div[contains(text(), '{field_label}')]/following::textarea[1]")
-    
-    if textarea.count() > 0:
-        textarea.first.fill(value)
-        time.sleep(1)  
-    else:
-        raise Exception(f"Textarea '{field_label}' not found!")
-
-
-def select_radio_option(page, field_label, option_text):
-    """Selects a radio button based on field label and option text, only if it's not already selected."""
-    
-    radio_option = page.locator(f"//div[contains(text(), '{field_label}')]/following::li[@title='{option_text}'][1]")
-
-    if radio_option.count() > 0:
-        if "selected" not in (radio_option.get_attribute("class") or ""):
-            radio_option.first.click()
-            time.sleep(1)  
-        else:
-            print(f" '{field_label}' is already set to '{option_text}', skipping click.")
-    else:
-        raise Exception(f"Radio option '{option_text}' not found for '{field_label}'!")
-
-
-
-def upload_and_reupload_file(page, file_path):
-    """Uploads a file, deletes it if already uploaded, then re-uploads it."""
-    file_input = page.locator(".mdt-file-upload input[type='file']")
-    delete_button = page.locator(".mdt-file-single .icon-delete")
-
-    if file_input.count() > 0:
-        page.evaluate("document.querySelector('.mdt-file-upload input[type=file]').style.display = 'block'")
-
-        if delete_button.count() > 0:
-            delete_button.click()
-            time.sleep(3)
-
-        file_input.set_input_files(file_path)
-        time.sleep(3)
-
-def fill_number_inputs(page):
-    """Fills number fields and clicks increment/decrement buttons."""
-    number_inputs = page.locator(".mdt-number-incrementer input[type='number']")
-    
-    for i in range(number_inputs.count()):
-        number_input = number_inputs.nth(i)
-        increment_button = number_input.locator("xpath=../div[@id='increment']")
-        decrement_button = number_input.locator("xpath=../div[@id='decrement']")
-        
-        number_input.fill(str(min(i + 1, 7)))
-        time.sleep(0.5)
-
-        if increment_button.count() > 0:
-            increment_button.click()
-            time.sleep(0.5)
-
-        if decrement_button.count() > 0:
-            decrement_button.click()
-            time.sleep(0.5)
-
-def fill_text_fields(page):
-    """Fills all required text fields."""
-    fields = {
-        "Car ownership justification": "I own a car for work purposes.",
-        "Wanted area of additional room (from-to)": "15-30 sqm",
-        "Wanted area of storage room (from-to)": "10-20 sqm",
-        "Reason for home office work": "Remote work requirement.",
-    }
-    
-    for label, value in fields.items():
-        fill_input_field(page, label, value)
-
-def fill_input_field(page, field_label, value):
-    """Fills a single input field based on label."""
-    input_field = page.locator(f"//span[contains(text(), '{field_label}')]/ancestor::div[contains(@class, 'mdt-input')]//input")
-    if input_field.count() > 0:
-        input_field.first.fill(value)
-        time.sleep(1)
-
-def select_dropdown_option(page, field_label, option_text):
-    """Selects a dropdown option based on the field label."""
-    
-    dropdown = page.locator(f"//span[contains(text(), '{field_label}')]/ancestor::div[contains(@class, 'mdt-select')]//input")
-    if dropdown.count() == 0:
-        dropdown = page.locator(f"//label[contains(text(), '{field_label}')]/ancestor::div[contains(@class, 'mdt-select')]//input")
-
-    if dropdown.count() == 0:
-        raise Exception(f"Dropdown '{field_label}' not found!")
-
-    dropdown.first.click()
-    time.sleep(1.5) 
-
-    page.wait_for_selector("//div[contains(@class, 'text-cut')]", timeout=5000)
-
-    options = page.locator("//div[contains(@class, 'text-cut')]")
-    options_count = options.count()
+    add_adult(step3_page)
 
-    if options_count > 0:
-        for i in range(options_count):
-            option = options.nth(i)
-            option_text_content = option.text_content().strip().lower()
-            if option_text.lower() in option_text_content:
-                option.click()
-                time.sleep(1) 
-                return
-        
-        print(f" Warning: Option '{option_text}' not found in '{field_label}' dropdown! Clicking first available option.")
-        options.first.click() 
-        time.sleep(1)
-    else:
-        raise Exception(f"No options found in '{field_label}' dropdown!")
+    fill_step3_personal_info(step3_page)
 
 
 
-def save_and_next(page):
-    """Clicks 'Save and Next' button if present."""
-    save_button = page.locator(".btn-next")
-    if save_button.count() > 0:
-        save_button.click()
-        time.sleep(3)
-
-def add_adult(page):
-    """Clicks the 'Add Adult' button at the start of Step 3."""
-    add_adult_button = page.locator("//div[contains(@class, 'create-adult')]//i[contains(@class, 'fa-plus-circle')]")
-    if add_adult_button.count() > 0:
-        add_adult_button.first.click()
-        time.sleep(2) 
-    else:
-        raise Exception("Add Adult button not found!")
+def form_checkpoints():
+    """Checkpoint cache keyed on the helpers that drive Steps 1 and 2."""
+    return CheckpointCache("application_form", flow_fingerprint(
+        fill_step1, click_yes_buttons, fill_number_inputs, upload_and_reupload_file, fill_text_fields,
+        bulk_fill, select_option, set_date, set_radios, set_numbers, fill_input_field, navigate_to_step2, fill_household_section, select_dropdown_option,
+        select_radio_option, fill_textarea_field, save_and_next,
+    ))
 
 def fill_step3_personal_info(page):
     """Fills in personal information (Salutation, Name, Nationality, etc.) in Step 3."""
@@ -333,7 +192,7 @@ def fill_step3_personal_info(page):
     contact_email="20@example.com",
     post_code_index=2 
 )       
-    fill_credit_check_details(page, file_path="C:/Users/Pc/Pictures/Screenshots/Screenshot 2024-07-04 124108.png")
+    fill_credit_check_details(page, upload=upload_payload("pdf"))
 
 
 
@@ -358,80 +217,31 @@ def fill_step3_personal_info(page):
 
 
 def select_date_from_datepicker(page, field_label, day, month, year):
-    """Selects a date using the datepicker widget by adjusting months."""
-
-    date_input = page.locator(f"//span[contains(text(), '{field_label}')]/ancestor::div[contains(@class, 'mdt-input')]//input")
-    if date_input.count() == 0:
-        raise Exception(f"Date field '{field_label}' not found!")
-
-    date_input.first.click()
-    time.sleep(1)  
-
-    page.wait_for_selector("//div[contains(@class, 'datepicker-wrapper')]", timeout=5000)
+    """Selects a date on the datepicker widget, by typing or jumping straight to the month."""
 
-    current_date_label = page.locator("//div[contains(@class, 'datepicker-current-date')]")
-    
-    prev_button = page.locator("//div[contains(@class, 'months-buttons')]/div[1]") 
-    next_button = page.locator("//div[contains(@class, 'months-buttons')]/div[2]")  
-
-    max_attempts = 30  
-    attempts = 0
-
-    while True:
-        current_date_text = current_date_label.text_content().strip()
-        if f"{month} {year}" in current_date_text:
-            break  
-
-        if f"{year}" not in current_date_text or month not in current_date_text:
-            prev_button.click()
-        else:
-            break 
-
-        time.sleep(0.5)  
+    date_input = field_index(page).find(field_label, ("mdt-datepicker", "mdt-input"))
+    if date_input is None:
+        date_input = page.locator(f"//span[contains(text(), '{field_label}')]/ancestor::div[contains(@class, 'mdt-input')]//input")
+        if date_input.count() == 0:
+            raise Exception(f"Date field '{field_label}' not found!")
 
-        attempts += 1
-        if attempts >= max_attempts:
-            raise Exception(f"Could not navigate to {month} {year}")
-
-    day_locator = page.locator(f"//td[normalize-space(text())='{day}']")
-    if day_locator.count() > 0:
-        day_locator.first.click()
-        time.sleep(1) 
-    else:
-        raise Exception(f"Date '{day} {month} {year}' not found in the datepicker!")
+    set_date(page, date_input.first, day, month, year, key=field_label)
+    settle_after_select(page)
 
     print(f" Successfully selected {day}.{month}.{year}")
 
 def select_nationality(page, country):
     """Searches for and selects a nationality from the dropdown."""
     
-    dropdown_button = page.locator("//span[contains(text(), 'Nationality')]/ancestor::div[contains(@class, 'mdt-select')]//i[contains(@class, 'icon-dropdown')]")
-    if dropdown_button.count() == 0:
-        raise Exception("Nationality dropdown button not found!")
-    
-    dropdown_button.first.click()
-    time.sleep(1)
-
-    search_input = page.locator("//div[contains(@class, 'mdt-select')]//input[@placeholder='Search...']")
-    if search_input.count() > 1:
-        search_input = search_input.first 
-
-    search_input.fill(country)
-    time.sleep(2)  
-
-    page.wait_for_selector("//div[contains(@class, 'text-cut')]", timeout=5000)
+    dropdown = field_index(page).find("Nationality", "mdt-select")
+    if dropdown is None:
+        dropdown = page.locator("//span[contains(text(), 'Nationality')]/ancestor::div[contains(@class, 'mdt-select')]//input")
+        if dropdown.count() == 0:
+            raise Exception("Nationality dropdown not found!")
 
-
-    country_option = page.locator(f"//div[contains(@class, 'text-cut') and contains(text(), '{country}')]")
-    
-    if country_option.count() > 0:
-        country_option.first.click()
-        time.sleep(1)
-        print(f" Successfully selected nationality: {country}")
-    else:
-    
-        search_input.press("Enter")
-        print(f" Could not find '{country}' directly, pressed Enter instead.")
+    selected = select_option(page, dropdown.first, country, fallback="error", search=True)
+    settle_after_select(page)
+    print(f" Successfully selected nationality: {selected}")
 
 def select_residence_permit(page, permit_type):
     """Selects a residence permit from the dropdown."""
@@ -442,7 +252,7 @@ def select_residence_permit(page, permit_type):
         raise Exception("Residence permit dropdown container not found!")
 
     dropdown_wrapper.first.click()  
-    time.sleep(1)  
+    settle_after_dropdown_open(page)
 
     page.wait_for_selector("//ul[contains(@class, 'select-dropdown-items-wrapper')]", timeout=5000)
 
@@ -451,7 +261,7 @@ def select_residence_permit(page, permit_type):
 
     if permit_option.count() > 0:
         permit_option.first.click()
-        time.sleep(1)  
+        settle_after_select(page)
         print(f" Successfully selected Residence Permit: {permit_type}")
     else:
         raise Exception(f"Residence permit option '{permit_type}' not found!")
@@ -605,26 +415,19 @@ def fill_location_details(
     print(f" Entered city: {city}")
 
     country_input = page.locator("//div[contains(@class, 'mdt-select') and .//span[contains(text(), 'Country')]]//input").first
-    country_input.click()
-    country_input.fill(country)
-    page.wait_for_selector("//ul[contains(@class, 'select-dropdown-items-wrapper')]", timeout=5000)
-    country_option = page.locator(f"//li[contains(@class, 'dropdown-item') and normalize-space(.)='{country}']").first
-    if country_option.count() > 0:
-        country_option.click()
-        page.wait_for_timeout(500)
-        page.locator("body").click()
-    else:
-        raise Exception(f" Country '{country}' not found in dropdown!")
+    select_option(page, country_input, country, match="exact", fallback="error", search=True)
+    settle_after_select(page)
+    page.locator("body").click()
 
     select_date_from_datepicker(page, "Move-in date", move_in_day, move_in_month, move_in_year)
 
-    page.wait_for_timeout(500)
     page.locator(f"//div[contains(@class, 'mdt-radio-list') and .//div[contains(text(), 'Civil law principal residence')]]//li[contains(text(), '{principal_residence}')]").first.click()
     print(f" Selected Civil law principal residence: {principal_residence}")
+    settle_after_click(page)
 
-    page.wait_for_timeout(500)
     page.locator(f"//div[contains(@class, 'mdt-radio-list') and .//div[contains(text(), 'Relocation in the last 3 years')]]//li[contains(text(), '{relocated}')]").first.click()
     print(f" Selected Relocation in last 3 years: {relocated}")
+    settle_after_click(page)
 
     if relocated == "Yes":
         fill_input_field(page, "Previous street and number", prev_street)
@@ -636,7 +439,7 @@ def fill_location_details(
             print(" Found 'Date of entry' field, clicking to open datepicker...")
 
             date_entry_locator.click()
-            page.wait_for_timeout(500)
+            settle_after_click(page)
 
             page.wait_for_selector("//div[contains(@class, 'datepicker-wrapper')]", timeout=5000)
 
@@ -645,7 +448,7 @@ def fill_location_details(
                 print(f" Successfully selected Date of Entry: {entry_day}.{entry_month}.{entry_year}")
 
                 page.locator("body").click()
-                page.wait_for_timeout(500)
+                settle_after_click(page)
                 max_attempts = 5
                 attempts = 0
                 filled_date = ""
@@ -655,14 +458,14 @@ def fill_location_details(
                     if filled_date != "":
                         print(f" 'Date of entry' successfully set: {filled_date}")
                         break
-                    time.sleep(1)  
+                    settle_after_fill(page)
                     attempts += 1
 
                 if filled_date == "":
                     print(" 'Date of entry' field is still empty after selection! Retrying manually...")
                     date_entry_locator.fill(f"{entry_day}.{entry_month}.{entry_year}")
                     page.locator("body").click()
-                    page.wait_for_timeout(500)
+                    settle_after_fill(page)
 
                     
                     filled_date = date_entry_locator.input_value().strip()
@@ -675,7 +478,6 @@ def fill_location_details(
         else:
             print(" 'Date of Entry' field not found, skipping.")
 
-    page.wait_for_timeout(500)
     community_radio = page.locator(f"//div[contains(@class, 'mdt-radio-list') and .//div[contains(text(), 'Already a member of the community')]]//li[contains(text(), '{community_member}')]")
     
     if community_radio.count() > 0:
@@ -688,8 +490,7 @@ def fill_location_details(
         fill_input_field(page, "Membership number", membership_number)
         print(" Filled Membership Number")
 
-    print("⏳ Pausing for 10 seconds so you can verify the selections...")
-    time.sleep(3)
+    settle_after_click(page)
 
 def fill_insurance_details(page, liability_insurance, liability_specify, household_insurance, household_specify, free_insurance_check):
     """Fills in the insurance details including personal liability, household insurance, and free insurance check."""
@@ -727,8 +528,7 @@ def fill_insurance_details(page, liability_insurance, liability_specify, househo
     else:
         raise Exception(" 'Free insurance check' radio option not found!")
 
-    print(" Pausing for 5 seconds to visually confirm selections...")
-    time.sleep(5)
+    settle_after_click(page)
 
 
 
@@ -759,7 +559,7 @@ def fill_employment_and_income_details(page, education_level, employment_status,
             print(f" Selected Employment Status: {employment_status}")
 
     if employment_status == "Full-time (90-100%)":
-        time.sleep(2)
+        settle_after_select(page)
 
         occupation_input = page.locator("//div[contains(@class, 'mdt-input') and .//span[contains(text(), 'Occupation')]]//input").first
         if occupation_input.count() > 0 and occupation:
@@ -783,7 +583,7 @@ def fill_employment_and_income_details(page, education_level, employment_status,
                 employment_relationship_option.click()
                 print(f" Selected Employment Relationship: {employment_relationship}")
 
-        time.sleep(1)
+        settle_after_click(page)
         permanent_option = page.locator("//li[contains(@class, 'radio-list-item') and normalize-space(text())='Permanent']").first
         if permanent_option.count() > 0:
             permanent_option.click()
@@ -816,7 +616,7 @@ def fill_employment_and_income_details(page, education_level, employment_status,
                     el.dispatchEvent(new Event('change', { bubbles: true }));
                 }""", str(post_code)
             )
-            time.sleep(1)
+            settle_after_fill(page)
             current_value = post_code_input.input_value()
             print(f" Post Code after evaluate input: {current_value}")
 
@@ -829,7 +629,7 @@ def fill_employment_and_income_details(page, education_level, employment_status,
                         el.dispatchEvent(new Event('change', { bubbles: true }));
                     }""", str(post_code)
                 )
-                time.sleep(1)
+                settle_after_fill(page)
                 current_value = post_code_input.input_value()
                 print(f" Post Code after second evaluate input: {current_value}")
                 if current_value != str(post_code):
@@ -880,8 +680,7 @@ def fill_employment_and_income_details(page, education_level, employment_status,
         taxable_assets_input.fill(str(taxable_assets))
         print(f" Entered Taxable Assets: {taxable_assets}")
 
-    print(" Pausing for 10 seconds to visually confirm selections...")
-    time.sleep(10)
+    settle_after_fill(page)
 
 
 
@@ -889,7 +688,7 @@ def fill_employment_and_income_details(page, education_level, employment_status,
 
     
 
-def fill_credit_check_details(page, file_path):
+def fill_credit_check_details(page, upload):
     """Selects 'Excerpt from the debt collection register' and uploads the file to all required fields."""
     
     credit_check_option = page.locator("//li[contains(@class, 'radio-list-item') and normalize-space(.)='Excerpt from the debt collection register']").first
@@ -910,7 +709,7 @@ def fill_credit_check_details(page, file_path):
     for label in document_labels:
         file_input = page.locator(f"//div[contains(@class, 'mdt-file-single') and .//span[contains(text(), '{label}')]]//input[@type='file']").first
         if file_input.count() > 0:
-            file_input.set_input_files(file_path)
+            file_input.set_input_files(upload)
             print(f" Uploaded file for: {label}")
         else:
             print(f" File input not found for: {label} (Skipping)")
@@ -934,7 +733,7 @@ def confirm_and_save(page):
         if not current_value.strip():
             post_code_input.fill("8000")
             print(" Entered missing Post Code: 8000")
-            time.sleep(2) 
+            settle_after_fill(page)
 
     save_button = page.locator("//div[contains(@class, 'btn-primary') and normalize-space(text())='Save']").first
     if save_button.count() > 0:
@@ -943,8 +742,7 @@ def confirm_and_save(page):
     else:
         print(" Save button not found!")
     
-    print(" Waiting 10 seconds for Save to complete...")
-    time.sleep(10)
+    settle_after_step(page)
     
     
     person_card = page.locator("div.person-card[section-key='0'][field-key='0'][person-key='0']").first
@@ -952,7 +750,7 @@ def confirm_and_save(page):
         try:
             person_card.hover()
             print(" Hovered over the person card.")
-            time.sleep(0.5)
+            settle_after_click(page)
             
             trash_icon = person_card.locator("div.actions i.fa-regular.fa-trash-can").first
             if trash_icon.count() > 0:
@@ -970,7 +768,7 @@ def confirm_and_save(page):
             if delete_button.count() > 0:
                 delete_button.click(force=True)
                 print(" Clicked Delete button to confirm deletion.")
-                time.sleep(2)  
+                settle_after_click(page)
             else:
                 print(" Delete button not found in modal.")
         except Exception as e:
@@ -981,14 +779,13 @@ def confirm_and_save(page):
     
     save_next_button = page.locator("//div[contains(@class, 'navigation-buttons')]//div[contains(@class, 'btn-next') and normalize-space(text())='Save and next']").first
     if save_next_button.count() > 0:
+        previous_step = active_step(page)
         save_next_button.scroll_into_view_if_needed()
         save_next_button.click(force=True)
         print(" Clicked 'Save and Next' button.")
+        settle_after_step(page, previous_step)
     else:
         print(" 'Save and Next' button not found!")
-    
-    print(" Waiting 5 seconds for verification...")
-    time.sleep(15)
 
 
 def check_all_boxes_and_save(page):
@@ -1032,4 +829,7 @@ def check_all_boxes_and_save(page):
     else:
         print(" Save button not found.")
     
-    time.sleep(7)
+    settle_after_step(page)
+
+
+trace_helpers(globals())
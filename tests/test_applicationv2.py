@@ -1,31 +1,44 @@
 import re
 import os
-import tempfile
 import time
-from faker import Faker
 from dotenv import load_dotenv
-from playwright.sync_api import Playwright, sync_playwright, expect
+from playwright.sync_api import BrowserContext, sync_playwright, expect
+from browser_pool import BrowserPool
+from incrementers import set_numbers
+from selector_cache import by_css, by_id, by_label, by_role, locate, tagged_selector
+from uploads import upload_payload
 
 load_dotenv()
 
 BASE_URL = os.getenv("BASE_URL")
 
 
+NUMBER_CHAIN = "div:nth-child({}) > .mt-16 > div > div > .mdt-number-incrementer > .wrapper > .input"
 
-def generate_fake_file():
-    fake = Faker()
-    temp_dir = tempfile.gettempdir()  
-    file_name = fake.file_name(category="image")  
-    file_path = os.path.join(temp_dir, file_name)  
 
-    with open(file_path, "w") as fake_file:
-        fake_file.write("This is a fake file for testing.")  
+def number_field(page, field, candidates):
+    """Selector of a step-1 number incrementer's input for set_numbers, resolved through the selector cache."""
+    return tagged_selector(page, f"applicationv2 number {field}", candidates)
 
-    return file_path
 
-def test_run(playwright: Playwright) -> None:
-    browser = playwright.chromium.launch(headless=False)
-    context = browser.new_context()
+def after_radio(index, offset):
+    """The offset-th number input after the index-th radio list of step 1 (0 is parking)."""
+    return by_css(f"xpath=(//ul[contains(@class, 'radio-list')])[{index + 1}]"
+                  f"/following::div[contains(@class, 'mdt-number-incrementer')][{offset}]//input")
+
+
+def radio_option(page, child, index, option):
+    """Option 1 (No) or 2 (Yes) of the index-th step-1 radio list, by role, label or recorded chain."""
+    # The recording shows the order: switching a list to option 2 is what reveals its follow-up fields.
+    name = "No" if option == 1 else "Yes"
+    return locate(page, f"applicationv2 radio {child} option {option}", [
+        by_role("listitem", name, index),
+        by_label(name, "radio-field", f"li[@title='{name}']", index),
+        by_css(f"div:nth-child({child}) > .radio-field > .mdt-radio-list > .radio-list > li:nth-child({option})"),
+    ])
+
+
+def test_run(context: BrowserContext) -> None:
     page = context.new_page()
     page.goto(os.getenv("BASE_URL"))
     page.get_by_role("link", name="Phasellus").click()
@@ -59,85 +72,61 @@ def test_run(playwright: Playwright) -> None:
     page3 = page3_info.value
     page3.get_by_text("Start").click()
     page3.locator(".radio-list-item").first.click()
-    page3.locator("div:nth-child(12) > .radio-field > .mdt-radio-list > .radio-list > li").first.click()
-    page3.locator("div:nth-child(13) > .radio-field > .mdt-radio-list > .radio-list > li").first.click()
-    page3.locator("div:nth-child(15) > .radio-field > .mdt-radio-list > .radio-list > li").first.click()
-    page3.locator("div:nth-child(21) > .radio-field > .mdt-radio-list > .radio-list > li").first.click()
-    page3.locator("div:nth-child(18) > .radio-field > .mdt-radio-list > .radio-list > li").first.click()
-    page3.locator("div:nth-child(24) > .radio-field > .mdt-radio-list > .radio-list > li").first.click()
-    page3.locator("div:nth-child(26) > .radio-field > .mdt-radio-list > .radio-list > li").first.click()
-    page3.locator("div:nth-child(27) > .radio-field > .mdt-radio-list > .radio-list > li").first.click()
-    page3.locator("div:nth-child(29) > .radio-field > .mdt-radio-list > .radio-list > li").first.click()
+    radio_option(page3, 12, 1, 1).click()
+    radio_option(page3, 13, 2, 1).click()
+    radio_option(page3, 15, 3, 1).click()
+    radio_option(page3, 21, 5, 1).click()
+    radio_option(page3, 18, 4, 1).click()
+    radio_option(page3, 24, 6, 1).click()
+    radio_option(page3, 26, 7, 1).click()
+    radio_option(page3, 27, 8, 1).click()
+    radio_option(page3, 29, 9, 1).click()
     page3.locator("li:nth-child(2)").first.click()
-    page3.locator(".input").first.click()
-    page3.locator(".input").first.fill("5")
-    page3.locator("#decrement").first.click()
-    page3.locator("#increment").first.click()
-    page3.locator("div:nth-child(4) > .mt-16 > div > div > .mdt-number-incrementer > .wrapper > .input").click()
-    page3.locator("div:nth-child(4) > .mt-16 > div > div > .mdt-number-incrementer > .wrapper > .input").fill("2")
-    page3.locator("div:nth-child(4) > .mt-16 > div > div > .mdt-number-incrementer > .wrapper > #decrement > .fas").click()
-    page3.locator("div:nth-child(4) > .mt-16 > div > div > .mdt-number-incrementer > .wrapper > #increment").click()
-    page3.locator("div:nth-child(5) > .mt-16 > div > div > .mdt-number-incrementer > .wrapper > .input").click()
-    page3.locator("div:nth-child(5) > .mt-16 > div > div > .mdt-number-incrementer > .wrapper > .input").fill("2")
-    page3.locator("div:nth-child(5) > .mt-16 > div > div > .mdt-number-incrementer > .wrapper > #decrement").click()
-    page3.locator("div:nth-child(5) > .mt-16 > div > div > .mdt-number-incrementer > .wrapper > #increment > .fas").click()
-    page3.locator("div:nth-child(6) > .mt-16 > div > div > .mdt-number-incrementer > .wrapper > .input").click()
-    page3.locator("div:nth-child(6) > .mt-16 > div > div > .mdt-number-incrementer > .wrapper > .input").fill("2")
-    page3.locator("div:nth-child(6) > .mt-16 > div > div > .mdt-number-incrementer > .wrapper > #decrement").click()
-    page3.locator("div:nth-child(6) > .mt-16 > div > div > .mdt-number-incrementer > .wrapper > #increment").click()
-    page3.locator("div:nth-child(7) > .mt-16 > div > div > .mdt-number-incrementer > .wrapper > .input").click()
-    page3.locator("div:nth-child(7) > .mt-16 > div > div > .mdt-number-incrementer > .wrapper > .input").fill("2")
-    page3.locator("div:nth-child(7) > .mt-16 > div > div > .mdt-number-incrementer > .wrapper > #increment").click()
-    page3.locator("div:nth-child(7) > .mt-16 > div > div > .mdt-number-incrementer > .wrapper > #decrement").click()
-    page3.locator("div:nth-child(8) > .mt-16 > div > div > .mdt-number-incrementer > .wrapper > .input").click()
-    page3.locator("div:nth-child(8) > .mt-16 > div > div > .mdt-number-incrementer > .wrapper > .input").fill("2")
-    page3.locator("div:nth-child(8) > .mt-16 > div > div > .mdt-number-incrementer > .wrapper > #decrement").click()
-    page3.locator("div:nth-child(8) > .mt-16 > div > div > .mdt-number-incrementer > .wrapper > #increment").click()
-    page3.locator("div:nth-child(9) > .mt-16 > div > div > .mdt-number-incrementer > .wrapper > .input").click()
-    page3.locator("div:nth-child(9) > .mt-16 > div > div > .mdt-number-incrementer > .wrapper > .input").fill("2")
-    page3.locator("div:nth-child(9) > .mt-16 > div > div > .mdt-number-incrementer > .wrapper > #decrement").click()
-    page3.locator("div:nth-child(9) > .mt-16 > div > div > .mdt-number-incrementer > .wrapper > #increment").click()
+    set_numbers(page3, {
+        number_field(page3, "parking_regular", [by_id("field-parking_regular"), by_css(".mdt-number-incrementer > .wrapper > .input")]): 5,
+        number_field(page3, "parking_small", [by_id("field-parking_small"), by_css(NUMBER_CHAIN.format(4))]): 2,
+        number_field(page3, "parking_large", [by_id("field-parking_large"), by_css(NUMBER_CHAIN.format(5))]): 2,
+        number_field(page3, "parking_electric", [by_id("field-parking_electric"), by_css(NUMBER_CHAIN.format(6))]): 2,
+        number_field(page3, "parking_electric_small", [by_id("field-parking_electric_small"), by_css(NUMBER_CHAIN.format(7))]): 2,
+        number_field(page3, "parking_outdoor", [by_id("field-parking_outdoor"), by_css(NUMBER_CHAIN.format(8))]): 2,
+        number_field(page3, "parking_special", [by_id("field-parking_special"), by_css(NUMBER_CHAIN.format(9))]): 2,
+    })
     page3.get_by_role("textbox", name="Please specify").click()
     page3.get_by_role("textbox", name="Please specify").fill("geses")
-    file_path = generate_fake_file()
-    page3.on("filechooser", lambda file_chooser: file_chooser.set_files(file_path))
+    upload = upload_payload("jpeg")
+    page3.on("filechooser", lambda file_chooser: file_chooser.set_files(upload))
     page3.locator("input[type=\"file\"]").click()
-    page3.locator("input[type=\"file\"]").set_input_files(file_path)
-    page3.locator("div:nth-child(12) > .radio-field > .mdt-radio-list > .radio-list > li:nth-child(2)").click()
-    page3.locator("div:nth-child(13) > .radio-field > .mdt-radio-list > .radio-list > li:nth-child(2)").click()
-    page3.locator("div:nth-child(14) > .mt-16 > div > div > .mdt-number-incrementer > .wrapper > .input").click()
-    page3.locator("div:nth-child(14) > .mt-16 > div > div > .mdt-number-incrementer > .wrapper > .input").fill("4")
-    page3.locator("div:nth-child(14) > .mt-16 > div > div > .mdt-number-incrementer > .wrapper > #decrement > .fas").click()
-    page3.locator("div:nth-child(14) > .mt-16 > div > div > .mdt-number-incrementer > .wrapper > #increment > .fas").click()
-    page3.locator("div:nth-child(15) > .radio-field > .mdt-radio-list > .radio-list > li:nth-child(2)").click()
-    page3.locator("div:nth-child(16) > .mt-16 > div > div > .mdt-number-incrementer > .wrapper > .input").click()
-    page3.locator("div:nth-child(16) > .mt-16 > div > div > .mdt-number-incrementer > .wrapper > .input").fill("5")
-    page3.locator("div:nth-child(16) > .mt-16 > div > div > .mdt-number-incrementer > .wrapper > #decrement").click()
-    page3.locator("div:nth-child(16) > .mt-16 > div > div > .mdt-number-incrementer > .wrapper > #increment").click()
-    page3.locator("div:nth-child(17) > .mt-16 > div > div > .mdt-number-incrementer > .wrapper > .input").click()
-    page3.locator("div:nth-child(17) > .mt-16 > div > div > .mdt-number-incrementer > .wrapper > .input").fill("5")
-    page3.locator("div:nth-child(17) > .mt-16 > div > div > .mdt-number-incrementer > .wrapper > #decrement > .fas").click()
-    page3.locator("div:nth-child(17) > .mt-16 > div > div > .mdt-number-incrementer > .wrapper > #increment > .fas").click()
-    page3.locator("div:nth-child(18) > .radio-field > .mdt-radio-list > .radio-list > li:nth-child(2)").click()
+    page3.locator("input[type=\"file\"]").set_input_files(upload)
+    radio_option(page3, 12, 1, 2).click()
+    radio_option(page3, 13, 2, 2).click()
+    set_numbers(page3, {
+        number_field(page3, "child 14", [after_radio(2, 1), by_css(NUMBER_CHAIN.format(14))]): 4,
+    })
+    radio_option(page3, 15, 3, 2).click()
+    set_numbers(page3, {
+        number_field(page3, "child 16", [after_radio(3, 1), by_css(NUMBER_CHAIN.format(16))]): 5,
+        number_field(page3, "child 17", [after_radio(3, 2), by_css(NUMBER_CHAIN.format(17))]): 5,
+    })
+    radio_option(page3, 18, 4, 2).click()
     page3.locator("textarea").click()
     page3.locator("textarea").fill("dg4w")
     page3.get_by_role("textbox", name="Please specify").nth(1).click()
     page3.get_by_role("textbox", name="Please specify").nth(1).fill("w3")
     page3.get_by_role("textbox", name="Please specify").nth(1).press("F1")
     page3.get_by_role("textbox", name="Please specify").nth(1).fill("33")
-    page3.locator("div:nth-child(21) > .radio-field > .mdt-radio-list > .radio-list > li:nth-child(2)").click()
+    radio_option(page3, 21, 5, 2).click()
     page3.get_by_role("textbox").nth(3).click()
     page3.get_by_role("textbox").nth(3).fill("3gw3tw")
     page3.get_by_role("textbox", name="Please specify").nth(2).click()
     page3.get_by_role("textbox", name="Please specify").nth(2).fill("r2qr2qr2q")
-    page3.locator("div:nth-child(24) > .radio-field > .mdt-radio-list > .radio-list > li:nth-child(2)").click()
+    radio_option(page3, 24, 6, 2).click()
     page3.locator("textarea").nth(2).click()
     page3.locator("textarea").nth(2).fill("2eda2a")
-    page3.locator("div:nth-child(26) > .radio-field > .mdt-radio-list > .radio-list > li:nth-child(2)").click()
-    page3.locator("div:nth-child(27) > .radio-field > .mdt-radio-list > .radio-list > li:nth-child(2)").click()
+    radio_option(page3, 26, 7, 2).click()
+    radio_option(page3, 27, 8, 2).click()
     page3.get_by_role("textbox", name="Please specify").nth(3).click()
     page3.get_by_role("textbox", name="Please specify").nth(3).fill("d2ada2")
-    page3.locator("div:nth-child(29) > .radio-field > .mdt-radio-list > .radio-list > li:nth-child(2)").click()
+    radio_option(page3, 29, 9, 2).click()
     page3.get_by_text("Save and next").click()
     page3.get_by_role("textbox", name="Please choose").first.click()
     page3.get_by_text("single person household").click()
@@ -146,7 +135,7 @@ def test_run(playwright: Playwright) -> None:
     page3.locator("div:nth-child(2) > .text-cut").first.click()
     page3.locator("div:nth-child(2) > .text-cut").first.fill("efsefs")
     page3.locator("input[type='file']").click()
-    page3.locator("input[type='file']").set_input_files(file_path)
+    page3.locator("input[type='file']").set_input_files(upload)
 
 
     
@@ -295,24 +284,24 @@ def test_run(playwright: Playwright) -> None:
     page3.get_by_role("spinbutton").nth(4).fill("5555555555")
     page3.get_by_role("listitem", name="CreditTrust certificate").click()
     page3.get_by_role("listitem", name="Excerpt from the debt").click()
-    page3.on("filechooser", lambda file_chooser: file_chooser.set_files(file_path))
+    page3.on("filechooser", lambda file_chooser: file_chooser.set_files(upload))
     page3.locator(".input-file").first.click()
-    page3.locator(".input-file").first.set_input_files(file_path)
+    page3.locator(".input-file").first.set_input_files(upload)
 
     page3.locator("input[type=\"file\"]").first.click()
-    page3.locator("input[type=\"file\"]").first.set_input_files(file_path)
+    page3.locator("input[type=\"file\"]").first.set_input_files(upload)
 
     page3.locator("input[type=\"file\"]").first.click()
-    page3.locator("input[type=\"file\"]").first.set_input_files(file_path)
+    page3.locator("input[type=\"file\"]").first.set_input_files(upload)
 
     page3.locator("input[type=\"file\"]").first.click()
-    page3.locator("input[type=\"file\"]").first.set_input_files(file_path)
+    page3.locator("input[type=\"file\"]").first.set_input_files(upload)
 
     page3.locator("input[type=\"file\"]").first.click()
-    page3.locator("input[type=\"file\"]").first.set_input_files(file_path)
+    page3.locator("input[type=\"file\"]").first.set_input_files(upload)
 
     page3.locator("input[type=\"file\"]").click()
-    page3.locator("input[type=\"file\"]").set_input_files(file_path)
+    page3.locator("input[type=\"file\"]").set_input_files(upload)
 
     page3.get_by_role("checkbox", name="I hereby confirm that").check()
     page3.get_by_text("Save", exact=True).click()
@@ -370,12 +359,10 @@ def test_run(playwright: Playwright) -> None:
     page3.get_by_role("checkbox", name="I have read the privacy").check()
     page3.get_by_text("Save").click()
 
-    # ---------------------
-    os.remove(file_path)
-    context.close()
-    browser.close()
 
 
 if __name__ == "__main__":
     with sync_playwright() as playwright:
-        test_run(playwright)
\ No newline at end of file
+        pool = BrowserPool(lambda: playwright.chromium.launch(headless=False)).start()
+        test_run(pool.acquire())
+        pool.close()
\ No newline at end of file
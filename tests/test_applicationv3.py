@@ -1,50 +1,60 @@
 import os
-from faker import Faker
 from dotenv import load_dotenv
-from playwright.sync_api import Playwright
+from playwright.sync_api import BrowserContext
+from datepicker import TYPE_CHECKED_SCRIPT
 
 load_dotenv()
 BASE_URL = os.getenv("BASE_URL")
 
 
-def add_adult(page):
-    fake = Faker()
-    email = fake.unique.email()
+def adult_steps(page, person):
+    """The actions that add one adult from a dataset record (see applicants.py), as (locator, method, args).
 
-    page.get_by_text("Erwachsene Person hinzufügen").click()
-    page.locator(".text-cut").first.click()
-    page.get_by_text("Herr").click()
-    page.get_by_role("textbox", name="Bitte präzisieren").first.fill("Ivo")
-    page.get_by_role("textbox", name="Bitte präzisieren").nth(1).fill("Ivic")
-    page.get_by_role("textbox", name="DD.MM.YYYY").first.click()
-    page.get_by_role("cell", name="1", exact=True).click()
-    page.locator("div:nth-child(7) .text-cut").click()
-    page.get_by_text("verheiratet").click()
-    page.get_by_role("textbox", name="Suche...").first.click()
-    page.get_by_text("Schweiz", exact=True).click()
-    page.locator("div:nth-child(9) .text-cut").fill("Bla")
-    page.locator("div:nth-child(12) .text-cut").click()
-    page.get_by_text("Solidarhafter", exact=True).click()
-    page.get_by_role("textbox", name="123 45 67").first.fill("333333333")
-    page.locator("input[type=\"email\"]").first.fill(email)
-    page.locator("input[type=\"email\"]").nth(1).fill(email)
-    page.locator("div:nth-child(13) .text-cut").fill("efs")
-    page.get_by_role("spinbutton").first.fill("3")
-    page.locator("div:nth-child(15) .text-cut").fill("gwawag")
-    page.get_by_role("textbox", name="Suche...").nth(1).click()
-    page.get_by_text("Schweiz", exact=True).click()
-    page.get_by_role("textbox", name="DD.MM.YYYY").nth(2).click()
-    page.get_by_role("cell", name="1", exact=True).click()
-    page.locator("div:nth-child(3) > .mt-16 > div > .mdt-select > .select-wrapper > .search > .mdt-input > .input-wrapper > .text-cut").click()
-    page.get_by_text("Arbeitslos").click()
-    page.get_by_role("listitem", name="CreditTrust-Zertifikat").click()
-    page.get_by_role("checkbox", name="Hiermit bestätige ich, dass").check()
-    page.get_by_text("Speichern", exact=True).click()
+    Locators are lazy and built the same way by the sync and async APIs, so add_adult here and
+    async_runner.add_adult run this one list, calling or awaiting each method.
+    """
+    email = person["email"]
+    # The phone field has its own country prefix and takes the nine-digit national number.
+    phone = "".join(ch for ch in person["phone"] if ch.isdigit())[-9:]
+    return [
+        (page.get_by_text("Erwachsene Person hinzufügen"), "click", ()),
+        (page.locator(".text-cut").first, "click", ()),
+        (page.get_by_text(person["salutation"], exact=True), "click", ()),
+        (page.get_by_role("textbox", name="Bitte präzisieren").first, "fill", (person["first_name"],)),
+        (page.get_by_role("textbox", name="Bitte präzisieren").nth(1), "fill", (person["last_name"],)),
+        (page.get_by_role("textbox", name="DD.MM.YYYY").first, "evaluate", (TYPE_CHECKED_SCRIPT, person["birth_date"])),
+        (page.locator("div:nth-child(7) .text-cut"), "click", ()),
+        (page.get_by_text(person["civil_status"], exact=True), "click", ()),
+        (page.get_by_role("textbox", name="Suche...").first, "click", ()),
+        (page.get_by_text(person["nationality"], exact=True), "click", ()),
+        (page.locator("div:nth-child(9) .text-cut"), "fill", (person["city"],)),
+        (page.locator("div:nth-child(12) .text-cut"), "click", ()),
+        (page.get_by_text("Solidarhafter", exact=True), "click", ()),
+        (page.get_by_role("textbox", name="123 45 67").first, "fill", (phone,)),
+        (page.locator("input[type=\"email\"]").first, "fill", (email,)),
+        (page.locator("input[type=\"email\"]").nth(1), "fill", (email,)),
+        (page.locator("div:nth-child(13) .text-cut"), "fill", (person["street"],)),
+        (page.get_by_role("spinbutton").first, "fill", (person["house_number"],)),
+        (page.locator("div:nth-child(15) .text-cut"), "fill", (person["city"],)),
+        (page.get_by_role("textbox", name="Suche...").nth(1), "click", ()),
+        (page.get_by_text(person["country"], exact=True), "click", ()),
+        (page.get_by_role("textbox", name="DD.MM.YYYY").nth(2), "click", ()),
+        (page.get_by_role("cell", name="1", exact=True), "click", ()),
+        (page.locator("div:nth-child(3) > .mt-16 > div > .mdt-select > .select-wrapper > .search > .mdt-input > .input-wrapper > .text-cut"), "click", ()),
+        (page.get_by_text("Arbeitslos"), "click", ()),
+        (page.get_by_role("listitem", name="CreditTrust-Zertifikat"), "click", ()),
+        (page.get_by_role("checkbox", name="Hiermit bestätige ich, dass"), "check", ()),
+        (page.get_by_text("Speichern", exact=True), "click", ()),
+    ]
 
 
-def test_run(playwright: Playwright, add_adults_fixture):
-    browser = playwright.chromium.launch(headless=False)
-    context = browser.new_context()
+def add_adult(page, person):
+    """Adds one adult to the household from a dataset record."""
+    for locator, method, args in adult_steps(page, person):
+        getattr(locator, method)(*args)
+
+
+def test_run(context: BrowserContext, add_adults_fixture):
     page = context.new_page()
     page.goto(BASE_URL)
 
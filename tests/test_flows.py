@@ -0,0 +1,30 @@
+import json
+import re
+import pytest
+from playwright.sync_api import BrowserContext
+from flow_engine import NUM_ADULTS, flow_names, load_flow, run_flow
+from labels import LOCALES, unverified_labels
+
+
+def _case(name, locale):
+    # A flow that clicks a label no recording has confirmed in this language would fail on a guess.
+    used = set(re.findall(r"label\[(\w+)\]", json.dumps(load_flow(name))))
+    unverified = sorted(used & unverified_labels(locale))
+    marks = [pytest.mark.skip(reason=f"unverified {locale} labels: {', '.join(unverified)}")] if unverified else []
+    return pytest.param(name, locale, id=f"{name}-{locale}", marks=marks)
+
+
+# One case per flow and language; FLOW_LOCALES picks the languages, so locale_shards.py can run each in its own process.
+CASES = [
+    _case(name, locale)
+    for name in flow_names()
+    for locale in load_flow(name).get("locales") or [load_flow(name).get("locale", "en")]
+    if locale in LOCALES
+]
+
+
+@pytest.mark.parametrize("name, locale", CASES)
+def test_flow(context: BrowserContext, applicant_stream, name, locale):
+    """Runs one declarative flow from tests/flows end to end with dataset applicants, in one language."""
+    people = [next(applicant_stream) for _ in range(max(NUM_ADULTS, 2))]
+    run_flow(context, load_flow(name), people, locale=locale)
@@ -1,41 +1,35 @@
 import pytest
-from playwright.sync_api import sync_playwright
+from page_metrics import page_metrics
 
-@pytest.fixture(scope="session")
-def browser():
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=False)
-        yield browser
-        browser.close()
+@pytest.fixture
+def page(read_only_page):
+    return read_only_page
 
-def test_page_load(browser):
-    page = browser.new_page()
+def test_listing_performance(context):
+    page = context.new_page()
+    metrics = page_metrics(page)
+    page.goto("https://mostar.api.demo.ch.melon.market/")
+
+    metrics.check("listing")
+
+def test_page_load(page):
     page.goto("https://mostar.api.demo.ch.melon.market/")
 
     assert "Demo" in page.title()
     page.wait_for_selector("body")
 
-    page.close()
-
-def test_check_text(browser):
-    page = browser.new_page()
+def test_check_text(page):
     page.goto("https://mostar.api.demo.ch.melon.market/")
 
     assert "Mostar" in page.locator("body").inner_text()
 
-    page.close()
-
-def test_check_images(browser):
-    page = browser.new_page()
+def test_check_images(page):
     page.goto("https://mostar.api.demo.ch.melon.market/")
 
     images = page.locator("img")
     assert images.count() > 0, "Nema slika na stranici!"
 
-    page.close()
-
-def test_navigation(browser):
-    page = browser.new_page()
+def test_navigation(page):
     page.goto("https://mostar.api.demo.ch.melon.market/")
 
     link = page.locator("a[href='#wohnen']").nth(0)
@@ -46,15 +40,10 @@ def test_navigation(browser):
     else:
         pytest.skip("Navigacijski link #wohnen ne postoji.")
 
-    page.close()
 
 
-
-def test_buttons_exist(browser):
-    page = browser.new_page()
+def test_buttons_exist(page):
     page.goto("https://mostar.api.demo.ch.melon.market/")
 
     buttons = page.locator("button")
     assert buttons.count() > 0, "Nema dugmadi na stranici!"
-
-    page.close()
@@ -1,10 +1,11 @@
 import re
-from playwright.sync_api import Playwright, sync_playwright, expect
+from playwright.sync_api import BrowserContext, sync_playwright, expect
+from browser_pool import BrowserPool
+from bulk_fill import bulk_fill
+from incrementers import set_numbers
 
 
-def run(playwright: Playwright) -> None:
-    browser = playwright.chromium.launch(headless=False)
-    context = browser.new_context()
+def test_run(context: BrowserContext) -> None:
     page = context.new_page()
     page.goto("https://mostar.api.demo.ch.melon.market/")
     page.get_by_role("row", name="01.01.01 Kanzlei A CHF 2'900").locator("span").nth(1).click()
@@ -13,20 +14,15 @@ def run(playwright: Playwright) -> None:
     page1 = page1_info.value
     page1.get_by_text("Start").click()
     page1.locator("#parking-true").click()
-    page1.locator("#field-parking_regular").click()
-    page1.locator("#field-parking_regular").fill("2")
-    page1.locator("#field-parking_small").click()
-    page1.locator("#field-parking_small").fill("1")
-    page1.locator("#field-parking_large").click()
-    page1.locator("#field-parking_large").fill("1")
-    page1.locator("#field-parking_electric").click()
-    page1.locator("#field-parking_electric").fill("2")
-    page1.locator("#field-parking_electric_small").click()
-    page1.locator("#field-parking_electric_small").fill("1")
-    page1.locator("#field-parking_outdoor").click()
-    page1.locator("#field-parking_outdoor").fill("0")
-    page1.locator("#field-parking_special").click()
-    page1.locator("#field-parking_special").fill("0")
+    bulk_fill(page1, {
+        "#field-parking_regular": "2",
+        "#field-parking_small": "1",
+        "#field-parking_large": "1",
+        "#field-parking_electric": "2",
+        "#field-parking_electric_small": "1",
+        "#field-parking_outdoor": "0",
+        "#field-parking_special": "0",
+    })
     page1.get_by_role("textbox", name="Please specify").click()
     page1.get_by_role("textbox", name="Please specify").fill("0")
     page1.locator("#field-parking_special").click()
@@ -94,22 +90,19 @@ def run(playwright: Playwright) -> None:
     page1.get_by_role("cell", name="1", exact=True).click()
     page1.locator("#field-tenant_type").click()
     page1.get_by_text("Spouse, registered partnership").click()
-    page1.locator("#field-phone").click()
-    page1.locator("#field-phone").fill("333333333")
-    page1.locator("#field-office_phone").click()
-    page1.locator("#field-office_phone").fill("333333333")
-    page1.locator("#field-email").click()
-    page1.locator("#field-email").fill("andrija@maildrop.cc")
-    page1.locator("#confirm-field-email").click()
-    page1.locator("#confirm-field-email").fill("andrija@maildrop.cc")
+    bulk_fill(page1, {
+        "#field-phone": "333333333",
+        "#field-office_phone": "333333333",
+        "#field-email": "andrija@maildrop.cc",
+        "#confirm-field-email": "andrija@maildrop.cc",
+    })
     page1.locator("#toggle-field-current_housing_situation div").first.click()
     page1.get_by_text("Own home").click()
-    page1.locator("#field-street_nr").click()
-    page1.locator("#field-street_nr").fill("Ulica 1")
-    page1.locator("#field-postcode").click()
-    page1.locator("#field-postcode").fill("88265")
-    page1.locator("#field-city").click()
-    page1.locator("#field-city").fill("Bern")
+    bulk_fill(page1, {
+        "#field-street_nr": "Ulica 1",
+        "#field-postcode": "88265",
+        "#field-city": "Bern",
+    })
     page1.locator("#field-country").click()
     page1.get_by_text("Switzerland", exact=True).click()
     page1.locator("#field-living_since").click()
@@ -133,18 +126,14 @@ def run(playwright: Playwright) -> None:
     page1.get_by_text("2020").click()
     page1.get_by_role("cell", name="5", exact=True).click()
     page1.get_by_role("listitem", name="Not terminated").click()
-    page1.locator("#field-company_street_nr").click()
-    page1.locator("#field-company_street_nr").fill("Ulica 22")
-    page1.locator("#field-company_postcode").click()
-    page1.locator("#field-company_postcode").fill("88265")
-    page1.locator("#field-company_city").click()
-    page1.locator("#field-company_city").fill("Lab")
-    page1.locator("#field-company_contact").click()
-    page1.locator("#field-company_contact").fill("Andrija Soldich")
-    page1.locator("#field-company_contact_phone").click()
-    page1.locator("#field-company_contact_phone").fill("333333333")
-    page1.locator("#field-company_contact_email").click()
-    page1.locator("#field-company_contact_email").fill("asoldo31@gmail.com")
+    bulk_fill(page1, {
+        "#field-company_street_nr": "Ulica 22",
+        "#field-company_postcode": "88265",
+        "#field-company_city": "Lab",
+        "#field-company_contact": "Andrija Soldich",
+        "#field-company_contact_phone": "333333333",
+        "#field-company_contact_email": "asoldo31@gmail.com",
+    })
     page1.locator("#field-income_range").click()
     page1.get_by_text("over CHF 200’").click()
     page1.get_by_role("listitem", name="CreditTrust certificate").click()
@@ -177,20 +166,14 @@ def run(playwright: Playwright) -> None:
     page1.get_by_text("(C) Long-term resident").click()
     page1.locator("#field-tenant_type").click()
     page1.get_by_text("Spouse, registered partnership").click()
-    page1.locator("#field-phone").click()
-    page1.locator("#field-phone").fill("222222222")
-    page1.locator("#field-email").click()
-    page1.locator("#field-email").fill("andrija@maildrop.cc")
-    page1.locator("#field-email").click()
-    page1.locator("#field-email").fill("andrija.soldo@fsre.sum.ba")
-    page1.locator("#confirm-field-email").click()
-    page1.locator("#confirm-field-email").fill("andrija.soldo@fsre.sum.ba")
-    page1.locator("#field-street_nr").click()
-    page1.locator("#field-street_nr").fill("11")
-    page1.locator("#field-postcode").click()
-    page1.locator("#field-postcode").fill("12345")
-    page1.locator("#field-city").click()
-    page1.locator("#field-city").fill("Basel")
+    bulk_fill(page1, {
+        "#field-phone": "222222222",
+        "#field-email": "andrija.soldo@fsre.sum.ba",
+        "#confirm-field-email": "andrija.soldo@fsre.sum.ba",
+        "#field-street_nr": "11",
+        "#field-postcode": "12345",
+        "#field-city": "Basel",
+    })
     page1.locator("#field-country").click()
     page1.get_by_text("Switzerland", exact=True).click()
     page1.locator("#field-living_since").click()
@@ -202,18 +185,14 @@ def run(playwright: Playwright) -> None:
     page1.locator("#field-company_since").click()
     page1.get_by_role("cell", name="7", exact=True).click()
     page1.get_by_role("listitem", name="Not terminated").click()
-    page1.locator("#field-company_street_nr").click()
-    page1.locator("#field-company_street_nr").fill("98")
-    page1.locator("#field-company_postcode").click()
-    page1.locator("#field-company_postcode").fill("9876")
-    page1.locator("#field-company_city").click()
-    page1.locator("#field-company_city").fill("Studio")
-    page1.locator("#field-company_contact").click()
-    page1.locator("#field-company_contact").fill("Ante Soldo")
-    page1.locator("#field-company_contact_phone").click()
-    page1.locator("#field-company_contact_phone").fill("555555555")
-    page1.locator("#field-company_contact_email").click()
-    page1.locator("#field-company_contact_email").fill("asoldo31@gmail.com")
+    bulk_fill(page1, {
+        "#field-company_street_nr": "98",
+        "#field-company_postcode": "9876",
+        "#field-company_city": "Studio",
+        "#field-company_contact": "Ante Soldo",
+        "#field-company_contact_phone": "555555555",
+        "#field-company_contact_email": "asoldo31@gmail.com",
+    })
     page1.get_by_role("listitem", name="CreditTrust certificate").click()
     page1.get_by_role("checkbox", name="I hereby confirm that").check()
     page1.get_by_text("Save", exact=True).click()
@@ -228,16 +207,8 @@ def run(playwright: Playwright) -> None:
     page1.get_by_role("cell", name="3", exact=True).click()
     page1.get_by_role("textbox", name="Search...").click()
     page1.get_by_text("Switzerland").click()
-    page1.locator("#increment-field-days_present").click()
-    page1.locator("#increment-field-days_present").click()
-    page1.locator("#increment-field-days_present").click()
-    page1.locator("#increment-field-days_present i").click()
-    page1.locator("#increment-field-days_present").click()
-    page1.locator("#increment-field-days_present i").click()
-    page1.locator("#increment-field-days_present i").click()
-    page1.locator("#increment-field-days_present").click()
-    page1.locator("#increment-field-days_present").click()
-    page1.locator("#increment-field-days_present i").dblclick()
+    # The recording pressed increment eleven times; the field clamps to its max the same way.
+    set_numbers(page1, {"days_present": 11})
     page1.get_by_text("Save", exact=True).click()
     page1.get_by_text("Save and next").click()
     page1.get_by_role("checkbox", name="Should the prospective tenant").check()
@@ -249,9 +220,10 @@ def run(playwright: Playwright) -> None:
     page.close()
 
     # ---------------------
-    context.close()
-    browser.close()
 
 
-with sync_playwright() as playwright:
-    run(playwright)
+if __name__ == "__main__":
+    with sync_playwright() as playwright:
+        pool = BrowserPool(lambda: playwright.chromium.launch(headless=False)).start()
+        test_run(pool.acquire())
+        pool.close()
@@ -1,38 +1,20 @@
 import os
 import re
 from dotenv import load_dotenv
-from faker import Faker
-from playwright.sync_api import Playwright, expect
+from playwright.sync_api import BrowserContext, expect
+from datepicker import set_date as pick_date
 
 load_dotenv()
 BASE_URL = os.getenv("BASE_URL")
-fake = Faker()
 
 def set_date(page, input_locator, date_str: str, year: int, day: int):
-    input_locator.click()
-    success = False
-    hdr = page.locator(".mdt-date-picker .datepicker-header, .datepicker-header, .icon .fas, i.fas").first
-    for _ in range(3):
-        try:
-            hdr.click()
-            y = page.get_by_text(str(year))
-            y.wait_for(state="visible", timeout=700)
-            y.click()
-            page.get_by_role("cell", name=str(day), exact=True).click()
-            success = True
-            break
-        except:
-            continue
-    if not success:
-        input_locator.fill(date_str)
-        page.locator("body").click()
+    _, month, _ = date_str.split(".")
+    pick_date(page, input_locator, day, month, year)
 
-def run(playwright: Playwright) -> None:
-    email1 = fake.email()
-    email2 = fake.email()
+def run(context: BrowserContext, first, second) -> None:
+    email1 = first["email"]
+    email2 = second["email"]
 
-    browser = playwright.chromium.launch(headless=False)
-    context = browser.new_context()
     page = context.new_page()
     page.goto(BASE_URL)
     page.get_by_role("row", name="01.01.01 Kanzlei A CHF 2'900").locator("span").nth(1).click()
@@ -191,8 +173,6 @@ def run(playwright: Playwright) -> None:
     page1.get_by_text("Submit").click()
     page1.close()
     page.close()
-    context.close()
-    browser.close()
 
-def test_melon_taskv1(playwright: Playwright):
-    run(playwright)
+def test_melon_taskv1(context: BrowserContext, applicant_stream):
+    run(context, next(applicant_stream), next(applicant_stream))
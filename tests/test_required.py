@@ -4,28 +4,20 @@ import tempfile
 import time
 from faker import Faker
 from dotenv import load_dotenv
-from playwright.sync_api import Playwright, sync_playwright, expect
+from playwright.sync_api import BrowserContext, sync_playwright, expect
+from browser_pool import BrowserPool
+from element_query import click_first
 
 load_dotenv()
 
 BASE_URL = os.getenv("BASE_URL")
 
 def click_enabled_speichern(page):
-    speichern_buttons = page.locator("text=Speichern")
-    count = speichern_buttons.count()
+    click_first(page, "*", "Speichern", visible=True, enabled=True)
 
-    for i in range(count):
-        button = speichern_buttons.nth(i)
-        if button.is_visible() and "btn-disabled" not in button.get_attribute("class"):
-            button.click()
-            return
-    raise Exception("No enabled 'Speichern' button found.")
 
 
-
-def test_run(playwright: Playwright) -> None:
-    browser = playwright.chromium.launch(headless=False)
-    context = browser.new_context()
+def test_run(context: BrowserContext) -> None:
     page = context.new_page()
     page.goto(os.getenv("BASE_URL"))
     page.get_by_role("row", name="00.01.02 Kanzlei A CHF 1'850").locator("span").first.click()
@@ -123,10 +115,10 @@ def test_run(playwright: Playwright) -> None:
 
 
     # ---------------------
-    context.close()
-    browser.close()
 
 
 if __name__ == "__main__":
     with sync_playwright() as playwright:
-        test_run(playwright)
\ No newline at end of file
+        pool = BrowserPool(lambda: playwright.chromium.launch(headless=False)).start()
+        test_run(pool.acquire())
+        pool.close()
\ No newline at end of file
@@ -0,0 +1,99 @@
+from script_optimizer import optimize_script
+
+HEADER = "from playwright.sync_api import Page\n\n\n"
+
+
+def run(body):
+    source = HEADER + "def test_run(page: Page):\n" + "".join(f"    {line}\n" for line in body)
+    optimized, report = optimize_script(source)
+    return optimized, report
+
+
+def test_click_before_fill_is_removed():
+    optimized, report = run([
+        'page.locator("#field-firstname").click()',
+        'page.locator("#field-firstname").fill("John")',
+    ])
+    assert 'click()' not in optimized
+    assert 'fill("John")' in optimized
+    assert [rule for _, rule, _ in report["removed"]] == ["click before fill"]
+
+
+def test_overwritten_fill_keeps_the_last_value():
+    optimized, _ = run([
+        'page.locator("#field-city").fill("Bern")',
+        'page.locator("#field-city").fill("Zurich")',
+    ])
+    assert "Bern" not in optimized
+    assert "Zurich" in optimized
+
+
+def test_overridden_toggle_keeps_the_last_click():
+    optimized, report = run([
+        'page.locator("#pets-true").click()',
+        'page.locator("#smoking-false").click()',
+        'page.locator("#pets-false").click()',
+    ])
+    assert "#pets-true" not in optimized
+    assert "#pets-false" in optimized and "#smoking-false" in optimized
+    assert report["actions_after"] == 2
+
+
+def test_statements_between_actions_are_barriers():
+    optimized, _ = run([
+        'page.locator("#field-city").fill("Bern")',
+        'bulk_fill(page, {})',
+        'page.locator("#field-city").fill("Zurich")',
+    ])
+    assert "Bern" in optimized
+
+
+def test_increments_become_one_relative_set_numbers_call():
+    optimized, report = run([
+        'page.locator("#increment-field-days_present").click()',
+        'page.locator("#increment-field-days_present i").click()',
+        'page.locator("#increment-field-days_present").dblclick()',
+        'page.locator("#decrement-field-days_present").click()',
+    ])
+    # 1 + 1 + 2 - 1, stepped from whatever the field holds when the script runs.
+    assert 'set_numbers(page, {"#field-days_present": {"by": 3}})' in optimized
+    assert "increment-field" not in optimized and "decrement-field" not in optimized
+    assert report["actions_before"] == 4 and report["actions_after"] == 1
+
+
+def test_increments_do_not_assume_an_earlier_fill_is_the_start():
+    optimized, _ = run([
+        'page.locator("#field-days_present").fill("2")',
+        'page.locator("#increment-field-days_present").click()',
+        'page.locator("#increment-field-days_present").click()',
+    ])
+    assert 'fill("2")' in optimized
+    assert '{"by": 2}' in optimized
+
+
+def test_single_increment_click_is_kept():
+    optimized, report = run(['page.locator("#increment-field-days_present").click()'])
+    assert "#increment-field-days_present" in optimized
+    assert "set_numbers" not in optimized
+    assert report["removed"] == []
+
+
+def test_set_numbers_is_imported_once():
+    optimized, _ = run([
+        'page.locator("#increment-field-a").click()',
+        'page.locator("#increment-field-a").click()',
+        'page.locator("#increment-field-b").click()',
+        'page.locator("#increment-field-b").click()',
+    ])
+    assert optimized.count("from incrementers import set_numbers") == 1
+    assert optimized.index("from incrementers import set_numbers") > optimized.index("from playwright")
+    compile(optimized, "optimized", "exec")
+
+
+def test_helper_receivers_are_parsed():
+    optimized, report = run([
+        'radio_option(page, 12, 1, 1).click()',
+        'radio_option(page, 12, 1, 1).click()',
+    ])
+    assert report["actions_before"] == 2
+    compile(optimized, "optimized", "exec")
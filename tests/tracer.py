@@ -0,0 +1,208 @@
+import functools
+import json
+import os
+import threading
+import time
+import types
+from contextlib import contextmanager
+from dotenv import load_dotenv
+
+load_dotenv()
+
+TRACE = os.getenv("TRACE", "0") == "1"
+TRACE_DIR = os.getenv("TRACE_DIR", os.path.join(os.path.dirname(__file__), ".perf"))
+
+WAIT_PREFIXES = ("wait", "settle_")
+
+PLAYWRIGHT_METHODS = {
+    "Page": (
+        "goto", "reload", "go_back", "click", "fill", "press", "evaluate", "evaluate_handle", "content", "title",
+        "wait_for_selector", "wait_for_function", "wait_for_load_state", "wait_for_timeout", "wait_for_url",
+        "expose_function", "add_init_script", "route", "unroute_all", "screenshot", "close",
+    ),
+    "Frame": ("goto", "click", "fill", "evaluate", "wait_for_selector", "wait_for_function", "wait_for_load_state"),
+    "Locator": (
+        "click", "dblclick", "fill", "type", "press", "press_sequentially", "check", "uncheck", "set_checked",
+        "select_option", "set_input_files", "hover", "focus", "dispatch_event", "scroll_into_view_if_needed",
+        "text_content", "inner_text", "input_value", "get_attribute", "all_text_contents", "all_inner_texts",
+        "is_visible", "is_enabled", "is_checked", "count", "evaluate", "evaluate_all", "wait_for",
+    ),
+    "ElementHandle": ("click", "fill", "evaluate", "text_content", "is_visible"),
+    "Keyboard": ("press", "type", "insert_text"),
+    "Mouse": ("click", "move", "wheel"),
+    "BrowserContext": ("new_page", "storage_state", "route", "add_init_script", "clear_cookies", "close"),
+    "CDPSession": ("send",),
+}
+
+_local = threading.local()
+_finished = []
+
+
+class Span:
+    """One timed call: wall time, the part of it spent waiting, and the protocol round trips inside it."""
+
+    __slots__ = ("name", "kind", "start", "duration", "wait", "round_trips", "children")
+
+    def __init__(self, name, kind, round_trips):
+        self.name = name
+        self.kind = kind
+        self.start = 0.0
+        self.duration = 0.0
+        self.wait = 0.0
+        self.round_trips = round_trips
+        self.children = []
+
+    def to_dict(self, origin):
+        return {
+            "name": self.name,
+            "kind": self.kind,
+            "start_ms": round((self.start - origin) * 1000, 3),
+            "duration_ms": round(self.duration * 1000, 3),
+            "wait_ms": round(self.wait * 1000, 3),
+            "act_ms": round((self.duration - self.wait) * 1000, 3),
+            "round_trips": self.round_trips,
+            "children": [child.to_dict(origin) for child in self.children],
+        }
+
+
+def _stack():
+    stack = getattr(_local, "stack", None)
+    if stack is None:
+        stack = _local.stack = []
+    return stack
+
+
+@contextmanager
+def span(name, kind="act", round_trips=0):
+    """Times a block as a child of the current span; a span opened with no parent becomes a root."""
+    stack = _stack()
+    current = Span(name, kind, round_trips)
+    if stack:
+        stack[-1].children.append(current)
+    stack.append(current)
+    current.start = time.perf_counter()
+    try:
+        yield current
+    finally:
+        current.duration = time.perf_counter() - current.start
+        stack.pop()
+        current.round_trips += sum(child.round_trips for child in current.children)
+        if kind == "wait":
+            current.wait = current.duration
+        else:
+            current.wait = sum(child.wait for child in current.children)
+        if not stack:
+            _finished.append(current)
+
+
+def traced(fn, name=None, kind=None, round_trips=0):
+    """Wraps fn so calls made inside a traced test open a span; outside a test it costs one attribute lookup."""
+    name = name or fn.__name__
+    if kind is None:
+        kind = "wait" if fn.__name__.startswith(WAIT_PREFIXES) else "act"
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        if not getattr(_local, "stack", None):
+            return fn(*args, **kwargs)
+        with span(name, kind, round_trips):
+            return fn(*args, **kwargs)
+
+    wrapper.__traced__ = True
+    return wrapper
+
+
+def trace_helpers(namespace):
+    """Replaces every plain helper function in a module namespace (tests and fixtures excluded) with a traced one."""
+    for name, obj in list(namespace.items()):
+        if (
+            isinstance(obj, types.FunctionType)
+            and not name.startswith("test_")
+            and not getattr(obj, "__traced__", False)
+            and not hasattr(obj, "_pytestfixturefunction")
+        ):
+            namespace[name] = traced(obj)
+
+
+def instrument_playwright():
+    """Traces the sync Playwright calls in PLAYWRIGHT_METHODS, each counted as one protocol round trip.
+
+    This patches the Playwright classes for the whole process, so conftest only calls it with TRACE=1.
+    The expect_* context managers are left alone: calling one only sets up the waiter, the wait
+    itself happens when the with block exits.
+    """
+    import playwright.sync_api as sync_api
+
+    for class_name, methods in PLAYWRIGHT_METHODS.items():
+        cls = getattr(sync_api, class_name)
+        for method in methods:
+            fn = cls.__dict__.get(method)
+            if fn is None or getattr(fn, "__traced__", False):
+                continue
+            setattr(cls, method, traced(fn, name=f"{class_name}.{method}", round_trips=1))
+
+
+def finished_spans():
+    return list(_finished)
+
+
+def _collapsed(root):
+    lines = {}
+
+    def walk(node, path):
+        frame = path + (node.name.replace(";", ":"),)
+        self_time = node.duration - sum(child.duration for child in node.children)
+        key = ";".join(frame)
+        lines[key] = lines.get(key, 0) + max(int(self_time * 1_000_000), 0)
+        for child in node.children:
+            walk(child, frame)
+
+    walk(root, ())
+    return lines
+
+
+def rollup(roots):
+    """Sums calls, wall time, wait time and round trips per span name across the given roots."""
+    totals = {}
+
+    def walk(node, active):
+        # Recursive or repeated nesting of the same name is only counted at its outermost span.
+        if node.name not in active:
+            entry = totals.setdefault(node.name, {"calls": 0, "seconds": 0.0, "wait": 0.0, "round_trips": 0})
+            entry["calls"] += 1
+            entry["seconds"] += node.duration
+            entry["wait"] += node.wait
+            entry["round_trips"] += node.round_trips
+        for child in node.children:
+            walk(child, active | {node.name})
+
+    for root in roots:
+        walk(root, frozenset())
+    return totals
+
+
+def write_trace(directory=TRACE_DIR):
+    """Writes the session's spans as trace-<worker>.json and trace-<worker>.folded (flamegraph input)."""
+    roots = finished_spans()
+    if not roots:
+        return None
+    worker = os.getenv("PYTEST_XDIST_WORKER", "main")
+    os.makedirs(directory, exist_ok=True)
+    origin = roots[0].start
+    base = os.path.join(directory, f"trace-{worker}")
+
+    with open(base + ".json", "w") as f:
+        json.dump({
+            "tests": [root.to_dict(origin) for root in roots],
+            "rollup": rollup(roots),
+        }, f, indent=1)
+
+    folded = {}
+    for root in roots:
+        for key, micros in _collapsed(root).items():
+            folded[key] = folded.get(key, 0) + micros
+    with open(base + ".folded", "w") as f:
+        for key, micros in folded.items():
+            if micros:
+                f.write(f"{key} {micros}\n")
+    return base
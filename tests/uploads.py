@@ -0,0 +1,149 @@
+import hashlib
+import os
+import random
+import struct
+import zlib
+from collections import OrderedDict
+from dotenv import load_dotenv
+
+load_dotenv()
+
+UPLOAD_SIZE_KB = int(os.getenv("UPLOAD_SIZE_KB", 50))
+UPLOAD_MEMORY_LIMIT_KB = int(os.getenv("UPLOAD_MEMORY_LIMIT_KB", 8192))
+UPLOAD_CACHE_DIR = os.getenv("UPLOAD_CACHE_DIR", os.path.join(os.path.dirname(__file__), ".uploads"))
+
+MIME_TYPES = {"png": "image/png", "jpeg": "image/jpeg", "pdf": "application/pdf"}
+
+
+def _png(rng, size):
+    def chunk(kind, data):
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+    # Stored (level 0) deflate keeps the file close to the requested size even for noise.
+    width = 256
+    height = max(size // (width + 1), 1)
+    rows = b"".join(b"\x00" + rng.randbytes(width) for _ in range(height))
+    header = struct.pack(">IIBBBBB", width, height, 8, 0, 0, 0, 0)
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", header)
+        + chunk(b"IDAT", zlib.compress(rows, 0))
+        + chunk(b"IEND", b"")
+    )
+
+
+def _jpeg(rng, size):
+    def segment(marker, data):
+        return b"\xff" + marker + struct.pack(">H", len(data) + 2) + data
+
+    # A baseline 8x8 grey image: one block whose DC and AC tables hold a single one-bit code.
+    image = (
+        b"\xff\xd8"
+        + segment(b"\xe0", b"JFIF\x00\x01\x01\x00\x00\x01\x00\x01\x00\x00")
+        + segment(b"\xdb", b"\x00" + b"\x01" * 64)
+        + segment(b"\xc0", b"\x08\x00\x08\x00\x08\x01\x01\x11\x00")
+        + segment(b"\xc4", b"\x00" + b"\x01" + b"\x00" * 15 + b"\x00")
+        + segment(b"\xc4", b"\x10" + b"\x01" + b"\x00" * 15 + b"\x00")
+    )
+    padding = b""
+    remaining = size - len(image) - 14
+    while remaining > 4:
+        length = min(remaining - 4, 65533)
+        # Comment segments pad the file; 0xFF bytes are avoided so no marker appears inside them.
+        padding += segment(b"\xfe", bytes(b % 255 for b in rng.randbytes(length)))
+        remaining -= length + 4
+    return image + padding + segment(b"\xda", b"\x01\x01\x00\x00\x3f\x00") + b"\x3f" + b"\xff\xd9"
+
+
+def _pdf(rng, size):
+    content = b"BT /F1 24 Tf 72 720 Td (Test upload) Tj ET"
+    filler = rng.randbytes(max(size - 700, 0))
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents 4 0 R"
+        b" /Resources << /Font << /F1 5 0 R >> >> >>",
+        b"<< /Length %d >>\nstream\n" % len(content) + content + b"\nendstream",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+        b"<< /Length %d >>\nstream\n" % len(filler) + filler + b"\nendstream",
+    ]
+    out = b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n"
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return out
+
+
+GENERATORS = {"png": _png, "jpeg": _jpeg, "pdf": _pdf}
+
+
+class ArtifactCache:
+    """Generates upload files once and keeps them by content hash, in memory with a disk spill.
+
+    Payloads are deterministic for a kind and size, so every worker produces the same digest
+    and spilled files can be shared between workers and sessions.
+    """
+
+    def __init__(self, memory_limit_kb=UPLOAD_MEMORY_LIMIT_KB, directory=UPLOAD_CACHE_DIR):
+        self.memory_limit = memory_limit_kb * 1024
+        self.directory = directory
+        self.generated = 0
+        self.hits = 0
+        self.spilled = 0
+        self._digests = {}
+        self._memory = OrderedDict()
+
+    def _path(self, digest, kind):
+        return os.path.join(self.directory, f"{digest}.{kind}")
+
+    def _spill(self):
+        while self._memory and sum(len(data) for data, _ in self._memory.values()) > self.memory_limit:
+            digest, (data, kind) = self._memory.popitem(last=False)
+            path = self._path(digest, kind)
+            if not os.path.exists(path):
+                os.makedirs(self.directory, exist_ok=True)
+                tmp = f"{path}.{os.getpid()}.tmp"
+                with open(tmp, "wb") as f:
+                    f.write(data)
+                os.replace(tmp, path)
+            self.spilled += 1
+
+    def get(self, kind, size_kb):
+        """Returns (digest, bytes) for a payload of the kind and roughly size_kb kilobytes."""
+        if kind not in GENERATORS:
+            raise Exception(f"Unknown upload kind '{kind}', expected one of {sorted(GENERATORS)}")
+        digest = self._digests.get((kind, size_kb))
+        if digest in self._memory:
+            self._memory.move_to_end(digest)
+            self.hits += 1
+            return digest, self._memory[digest][0]
+        if digest is not None and os.path.exists(self._path(digest, kind)):
+            with open(self._path(digest, kind), "rb") as f:
+                data = f.read()
+            self.hits += 1
+        else:
+            data = GENERATORS[kind](random.Random(f"{kind}:{size_kb}"), size_kb * 1024)
+            digest = hashlib.sha256(data).hexdigest()
+            self._digests[(kind, size_kb)] = digest
+            self.generated += 1
+        self._memory[digest] = (data, kind)
+        self._spill()
+        return digest, data
+
+    def payload(self, kind="png", size_kb=UPLOAD_SIZE_KB, name=None):
+        """Returns an in-memory file for set_input_files / FileChooser.set_files."""
+        digest, data = self.get(kind, size_kb)
+        return {"name": name or f"upload-{digest[:12]}.{kind}", "mimeType": MIME_TYPES[kind], "buffer": data}
+
+
+ARTIFACTS = ArtifactCache()
+
+
+def upload_payload(kind="png", size_kb=UPLOAD_SIZE_KB, name=None):
+    """Returns a valid PNG, JPEG or PDF upload from the session's artifact cache."""
+    return ARTIFACTS.payload(kind, size_kb, name)